@@ -0,0 +1,209 @@
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from napari.layers import Image
+
+from .synthetic import (
+    create_controller,
+    make_imc_group,
+    write_hdf5_hierarchy,
+    write_zarr_hierarchy,
+)
+
+# (depth, breadth, number of arrays per group)
+HIERARCHY_SIZES = {
+    "small": (2, 3, 4),  # 52 arrays
+    "medium": (3, 4, 8),  # 680 arrays
+    "large": (4, 5, 8),  # 6248 arrays
+}
+# (number of slides, number of acquisitions per slide, number of channels)
+IMC_SIZES = {
+    "small": (1, 4, 10),  # 44 arrays
+    "medium": (2, 10, 40),  # 802 arrays
+    "large": (4, 20, 50),  # 4004 arrays
+}
+LOAD_SIZES = ["small", "medium"]
+WRITE_SHAPES = ["64x64", "1024x1024"]
+FORMATS = {
+    "hdf5": (".h5", write_hdf5_hierarchy),
+    "zarr": (".zarr", write_zarr_hierarchy),
+}
+
+
+def _hierarchy_file(fmt: str, size: str) -> str:
+    suffix, _ = FORMATS[fmt]
+    return str(Path(f"{fmt}_{size}{suffix}").absolute())
+
+
+def _write_hierarchy_files(sizes, shape=(64, 64)) -> None:
+    for fmt, (_, write_hierarchy) in FORMATS.items():
+        for size in sizes:
+            depth, breadth, n_arrays = HIERARCHY_SIZES[size]
+            write_hierarchy(_hierarchy_file(fmt, size), depth, breadth, n_arrays, shape)
+
+
+def _set_layer_silently(array, layer) -> None:
+    # skip the loaded/visible event cascade, which is benchmarked separately
+    with array.events.blocker_all():
+        array.layer = layer
+
+
+class ReadGroupSuite:
+    params = (list(FORMATS), list(HIERARCHY_SIZES))
+    param_names = ["format", "size"]
+    number = 1
+    timeout = 300
+
+    def setup_cache(self):
+        _write_hierarchy_files(HIERARCHY_SIZES)
+
+    def setup(self, fmt, size):
+        self.controller = create_controller()
+
+    def time_read_group(self, fmt, size):
+        self.controller.read_group(_hierarchy_file(fmt, size))
+
+
+class _ReadGroupSetup:
+    params = (list(FORMATS), LOAD_SIZES)
+    param_names = ["format", "size"]
+    number = 1
+    timeout = 300
+
+    def setup_cache(self):
+        _write_hierarchy_files(LOAD_SIZES)
+
+    def setup(self, fmt, size):
+        self.controller = create_controller()
+        self.group = self.controller.read_group(_hierarchy_file(fmt, size))
+
+
+class LoadGroupSuite(_ReadGroupSetup):
+    def time_load_group(self, fmt, size):
+        self.controller.load_group(self.group)
+
+
+class UnloadGroupSuite(_ReadGroupSetup):
+    def setup(self, fmt, size):
+        super().setup(fmt, size)
+        self.controller.load_group(self.group)
+
+    def time_unload_group(self, fmt, size):
+        self.controller.unload_group(self.group)
+
+
+class ModelSuite:
+    params = list(IMC_SIZES)
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.group = make_imc_group(*IMC_SIZES[size])
+
+    def time_construct_imc_group(self, size):
+        make_imc_group(*IMC_SIZES[size])
+
+    def time_iter_arrays(self, size):
+        for _ in self.group.iter_arrays(recursive=True):
+            pass
+
+
+class GroupStateSuite:
+    params = list(IMC_SIZES)
+    param_names = ["size"]
+    timeout = 300
+
+    def setup(self, size):
+        self.controller = create_controller()
+        self.group = make_imc_group(*IMC_SIZES[size])
+        self.controller.groups.append(self.group)
+        # one shared layer is sufficient, as loaded/visible only check for its state
+        self.layer = Image(np.zeros((2, 2)))
+        self.arrays = list(self.group.iter_arrays(recursive=True))
+        # leave the last array unloaded to evaluate all arrays (worst case)
+        for array in self.arrays[:-1]:
+            _set_layer_silently(array, self.layer)
+        self.child = self.group.children[0].children[1].children[0]
+
+    def time_group_loaded(self, size):
+        self.group.loaded
+
+    def time_group_visible(self, size):
+        self.group.visible
+
+    def time_array_loaded_event(self, size):
+        # emits loaded/visible events for the array and all of its ancestors
+        array = self.arrays[-1]
+        array.layer = self.layer
+        array.layer = None
+
+    def time_update_current_arrays(self, size):
+        self.controller._update_current_arrays()
+
+    def time_select_group(self, size):
+        self.controller.selected_groups.append(self.child)
+        self.controller.selected_groups.clear()
+
+
+class WriteGroupSuite:
+    params = (list(FORMATS), WRITE_SHAPES)
+    param_names = ["format", "shape"]
+    number = 1
+    timeout = 300
+
+    def setup_cache(self):
+        depth, breadth, n_arrays = HIERARCHY_SIZES["small"]
+        for shape in WRITE_SHAPES:
+            write_hdf5_hierarchy(
+                str(Path(f"source_{shape}.h5").absolute()),
+                depth,
+                breadth,
+                n_arrays,
+                shape=tuple(int(s) for s in shape.split("x")),
+            )
+
+    def setup(self, fmt, shape):
+        self.controller = create_controller()
+        self.group = self.controller.read_group(Path(f"source_{shape}.h5").absolute())
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.target = self.temp_dir / f"target{FORMATS[fmt][0]}"
+
+    def teardown(self, fmt, shape):
+        shutil.rmtree(self.temp_dir)
+
+    def time_write_group(self, fmt, shape):
+        self.controller.write_group(self.target, self.group, stream=True)
+
+    def track_write_group_throughput(self, fmt, shape):
+        n_bytes = sum(
+            self.controller.read_array(array).nbytes
+            for array in self.group.iter_arrays(recursive=True)
+        )
+        start = time.perf_counter()
+        self.controller.write_group(self.target, self.group, stream=True)
+        return n_bytes / 1e6 / (time.perf_counter() - start)
+
+    track_write_group_throughput.unit = "MB/s"
+
+
+class SaveGroupSuite:
+    params = LOAD_SIZES
+    param_names = ["size"]
+    number = 1
+    timeout = 300
+
+    def setup(self, size):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        path = self.temp_dir / "group.h5"
+        write_hdf5_hierarchy(path, *HIERARCHY_SIZES[size])
+        self.controller = create_controller()
+        self.group = self.controller.read_group(path)
+        self.controller.load_group(self.group)
+
+    def teardown(self, size):
+        shutil.rmtree(self.temp_dir)
+
+    def time_save_group(self, size):
+        self.controller.save_group(self.group)
@@ -0,0 +1,16 @@
+# napari is imported in the setup code, as napari is already imported when napari
+# loads the plugin; the benchmarks therefore measure the plugin's own overhead
+
+
+class ImportSuite:
+    def timeraw_import(self):
+        return "import napari_hierarchical", "import napari.layers"
+
+    def timeraw_import_and_resolve_group_reader(self):
+        return (
+            "import napari_hierarchical\n"
+            "napari_hierarchical.controller.can_read_group('file.h5')"
+        ), "import napari.layers"
+
+    def timeraw_import_widgets(self):
+        return "import napari_hierarchical.widgets", "import napari.layers"
@@ -0,0 +1,175 @@
+import os
+
+import numpy as np
+from napari.layers import Image
+from qtpy.QtCore import QAbstractItemModel, QModelIndex, Qt
+from qtpy.QtWidgets import QApplication
+
+from napari_hierarchical.widgets._flat_grouping_tree_model import QFlatGroupingTreeModel
+from napari_hierarchical.widgets._group_tree_model import QGroupTreeModel
+
+from .synthetic import create_controller, make_imc_group
+
+# total number of arrays, distributed over acquisitions of N_CHANNELS channels each;
+# as of now, larger hierarchies (10k-100k arrays) exceed the benchmark timeout
+N_ARRAYS = [100, 1_000]
+N_CHANNELS = 40
+MODEL_SIGNALS = (
+    "dataChanged",
+    "rowsInserted",
+    "rowsRemoved",
+    "rowsMoved",
+    "layoutChanged",
+    "modelReset",
+)
+
+
+class _SignalCounter:
+    def __init__(self, *models: QAbstractItemModel) -> None:
+        self.count = 0
+        for model in models:
+            for signal in MODEL_SIGNALS:
+                getattr(model, signal).connect(self._on_signal)
+
+    def _on_signal(self, *args) -> None:
+        self.count += 1
+
+
+def _walk(model: QAbstractItemModel, parent: QModelIndex = QModelIndex()) -> None:
+    # mimics a fully expanded view painting all of its rows
+    for row in range(model.rowCount(parent)):
+        for column in range(model.columnCount(parent)):
+            index = model.index(row, column, parent)
+            model.data(index, Qt.ItemDataRole.DisplayRole)
+            model.data(index, Qt.ItemDataRole.CheckStateRole)
+            model.flags(index)
+        _walk(model, model.index(row, 0, parent))
+
+
+class _ModelSetup:
+    params = N_ARRAYS
+    param_names = ["n_arrays"]
+    number = 1
+    repeat = (1, 3, 60.0)
+    timeout = 600
+    add_group = True
+
+    def setup(self, n_arrays):
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        self.app = QApplication.instance() or QApplication([])
+        self.controller = create_controller()
+        self.group = make_imc_group(
+            1, n_arrays // N_CHANNELS, N_CHANNELS, n_panoramas=0
+        )
+        self.acquisition_group = self.group.children[0].children[1].children[0]
+        self.group_tree_model = QGroupTreeModel(self.controller)
+        self.flat_grouping_tree_model = QFlatGroupingTreeModel(self.controller)
+        self.channel_tree_model = QFlatGroupingTreeModel(
+            self.controller, flat_grouping="Channel"
+        )
+        if self.add_group:
+            self.controller.groups.append(self.group)
+        self.signal_counter = _SignalCounter(
+            self.group_tree_model,
+            self.flat_grouping_tree_model,
+            self.channel_tree_model,
+        )
+
+
+class AddGroupSuite(_ModelSetup):
+    add_group = False
+
+    def time_add_group(self, n_arrays):
+        self.controller.groups.append(self.group)
+
+    def track_add_group_signals(self, n_arrays):
+        self.controller.groups.append(self.group)
+        return self.signal_counter.count
+
+
+class ModelConstructionSuite(_ModelSetup):
+    def time_construct_group_tree_model(self, n_arrays):
+        QGroupTreeModel(self.controller)
+
+    def time_construct_flat_grouping_tree_model(self, n_arrays):
+        QFlatGroupingTreeModel(self.controller)
+
+    def time_construct_channel_tree_model(self, n_arrays):
+        QFlatGroupingTreeModel(self.controller, flat_grouping="Channel")
+
+
+class SelectionSuite(_ModelSetup):
+    def time_select_group(self, n_arrays):
+        self.controller.selected_groups.append(self.acquisition_group)
+        self.controller.selected_groups.clear()
+
+    def track_select_group_signals(self, n_arrays):
+        self.controller.selected_groups.append(self.acquisition_group)
+        self.controller.selected_groups.clear()
+        return self.signal_counter.count
+
+
+class _LayersSetup(_ModelSetup):
+    def setup(self, n_arrays):
+        super().setup(n_arrays)
+        self.arrays = list(self.group.iter_arrays(recursive=True))
+        self.layers = [Image(np.zeros((2, 2))) for _ in self.arrays]
+
+
+class LoadSuite(_LayersSetup):
+    def _load_arrays(self) -> None:
+        # what array loaders do, without any I/O
+        for array, layer in zip(self.arrays, self.layers):
+            array.layer = layer
+
+    def time_load_arrays(self, n_arrays):
+        self._load_arrays()
+
+    def track_load_arrays_signals(self, n_arrays):
+        self._load_arrays()
+        return self.signal_counter.count
+
+
+class VisibilitySuite(_LayersSetup):
+    def setup(self, n_arrays):
+        super().setup(n_arrays)
+        for array, layer in zip(self.arrays, self.layers):
+            with array.events.blocker_all():
+                array.layer = layer
+        self.signal_counter.count = 0
+
+    def time_hide_group(self, n_arrays):
+        self.group.hide()
+
+    def track_hide_group_signals(self, n_arrays):
+        self.group.hide()
+        return self.signal_counter.count
+
+
+class DropSuite(_ModelSetup):
+    def _drop_acquisition_group(self) -> None:
+        # moves the acquisition group to the top level, as a drag and drop would do
+        data = self.group_tree_model.mimeData(
+            [self.group_tree_model.create_group_index(self.acquisition_group)]
+        )
+        self.group_tree_model.dropMimeData(
+            data, Qt.DropAction.MoveAction, -1, -1, QModelIndex()
+        )
+
+    def time_drop_group(self, n_arrays):
+        self._drop_acquisition_group()
+
+    def track_drop_group_signals(self, n_arrays):
+        self._drop_acquisition_group()
+        return self.signal_counter.count
+
+
+class DataSuite(_ModelSetup):
+    def time_group_tree_model_data(self, n_arrays):
+        _walk(self.group_tree_model)
+
+    def time_flat_grouping_tree_model_data(self, n_arrays):
+        _walk(self.flat_grouping_tree_model)
+
+    def time_channel_tree_model_data(self, n_arrays):
+        _walk(self.channel_tree_model)
@@ -0,0 +1,123 @@
+"""Synthetic hierarchies of configurable size for benchmarking.
+
+A hierarchy of a given ``depth`` and ``breadth`` consists of ``breadth`` child
+groups per group (``breadth ** depth`` leaf groups in total), where every group
+holds ``n_arrays`` arrays of the given ``shape`` and ``dtype``.
+"""
+
+import os
+import sys
+from typing import Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from napari_hierarchical import HierarchicalController
+from napari_hierarchical.contrib import hdf5, imc, zarr
+from napari_hierarchical.contrib.imc.model import IMCAcquisitionArray, IMCPanoramaArray
+from napari_hierarchical.model import Group
+
+PathLike = Union[str, os.PathLike]
+
+
+def create_controller() -> HierarchicalController:
+    controller = HierarchicalController()
+    controller.pm.register(hdf5, name="napari-hierarchical-hdf5")
+    controller.pm.register(imc, name="napari-hierarchical-imc")
+    controller.pm.register(zarr, name="napari-hierarchical-zarr")
+    return controller
+
+
+def iter_group_paths(depth: int, breadth: int) -> Iterator[Tuple[str, ...]]:
+    yield ()
+    if depth > 0:
+        for i in range(breadth):
+            for group_path in iter_group_paths(depth - 1, breadth):
+                yield (f"group{i}", *group_path)
+
+
+def write_hdf5_hierarchy(
+    path: PathLike,
+    depth: int,
+    breadth: int,
+    n_arrays: int,
+    shape: Sequence[int] = (64, 64),
+    dtype: str = "uint16",
+) -> None:
+    import h5py
+
+    data = np.ones(shape, dtype=dtype)
+    with h5py.File(path, mode="w") as f:
+        for group_path in iter_group_paths(depth, breadth):
+            hdf5_group = f.require_group("/".join(("/", *group_path)))
+            for i in range(n_arrays):
+                hdf5_group.create_dataset(f"array{i}", data=data)
+
+
+def write_zarr_hierarchy(
+    path: PathLike,
+    depth: int,
+    breadth: int,
+    n_arrays: int,
+    shape: Sequence[int] = (64, 64),
+    dtype: str = "uint16",
+) -> None:
+    import zarr
+
+    data = np.ones(shape, dtype=dtype)
+    z = zarr.open(store=str(path), mode="w")
+    for group_path in iter_group_paths(depth, breadth):
+        zarr_group = z.require_group("/".join(group_path)) if group_path else z
+        for i in range(n_arrays):
+            zarr_group.create_dataset(f"array{i}", data=data)
+
+
+def make_imc_group(
+    n_slides: int, n_acquisitions: int, n_channels: int, n_panoramas: int = 1
+) -> Group:
+    """Builds the group tree of an MCD file (mirrors ``read_imc_group``)"""
+    name = mcd_file = "synthetic.mcd"
+    slide_groups: List[Group] = []
+    for slide_id in range(1, n_slides + 1):
+        panorama_groups: List[Group] = []
+        for panorama_id in range(1, n_panoramas + 1):
+            panorama_array = IMCPanoramaArray(
+                name=f"{name} [S{slide_id:02d} P{panorama_id:02d}]",
+                mcd_file=mcd_file,
+                slide_id=slide_id,
+                panorama_id=panorama_id,
+            )
+            panorama_group = Group.build(
+                f"[P{panorama_id:02d}] Panorama", arrays=[panorama_array]
+            )
+            panorama_groups.append(panorama_group)
+        acquisition_groups: List[Group] = []
+        for acquisition_id in range(1, n_acquisitions + 1):
+            acquisition_arrays: List[IMCAcquisitionArray] = []
+            for channel_index in range(n_channels):
+                acquisition_array = IMCAcquisitionArray(
+                    name=f"{name} "
+                    f"[S{slide_id:02d} A{acquisition_id:02d} C{channel_index:02d}]",
+                    mcd_file=mcd_file,
+                    slide_id=slide_id,
+                    acquisition_id=acquisition_id,
+                    channel_index=channel_index,
+                )
+                acquisition_array.flat_grouping_groups["Channel"] = sys.intern(
+                    f"[C{channel_index:02d}] Channel{channel_index}"
+                )
+                acquisition_arrays.append(acquisition_array)
+            acquisition_group = Group.build(
+                f"[A{acquisition_id:02d}] Acquisition", arrays=acquisition_arrays
+            )
+            acquisition_groups.append(acquisition_group)
+        slide_group = Group.build(
+            f"[S{slide_id:02d}] Slide",
+            children=[
+                Group.build("Panoramas", children=panorama_groups),
+                Group.build("Acquisitions", children=acquisition_groups),
+            ],
+        )
+        slide_groups.append(slide_group)
+    group = Group.build(name, children=slide_groups)
+    group.commit()
+    return group
@@ -0,0 +1,161 @@
+import argparse
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ._controller import HierarchicalControllerException, controller
+from .model import Array, Group
+
+PathLike = Union[str, os.PathLike]
+
+
+class CopyResult(NamedTuple):
+    source: str
+    target: str
+    n_arrays: int
+    n_bytes: int
+    seconds: float
+    error: Optional[str] = None
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = _create_parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    if args.command == "inspect":
+        return _inspect(args.paths, shapes=args.shapes)
+    if args.command == "convert":
+        suffix = args.to if args.to.startswith(".") else f".{args.to}"
+        jobs = []
+        for source in args.paths:
+            target_dir = Path(args.output) if args.output else Path(source).parent
+            jobs.append((str(source), str(target_dir / (Path(source).stem + suffix))))
+        return _copy(jobs, max_workers=args.workers)
+    if args.command == "copy":
+        return _copy([(args.source, args.target)], max_workers=1)
+    parser.print_help()
+    return 2
+
+
+def copy_group(source: PathLike, target: PathLike) -> CopyResult:
+    # runs in worker processes, each using its own copy of the (headless) controller
+    start = time.perf_counter()
+    try:
+        group = controller.read_group(source)
+        n_arrays = 0
+        n_bytes = 0
+
+        def read_array(array: Array) -> Any:
+            # arrays are read once (by the writer); sizes are taken from metadata
+            nonlocal n_arrays, n_bytes
+            data = controller.read_array(array)
+            n_arrays += 1
+            n_bytes += int(np.prod(data.shape)) * np.dtype(data.dtype).itemsize
+            return data
+
+        try:
+            controller.write_group(target, group, stream=True, array_reader=read_array)
+        finally:
+            controller.groups.remove(group)
+    except HierarchicalControllerException as e:
+        return CopyResult(str(source), str(target), 0, 0, 0.0, error=str(e))
+    seconds = time.perf_counter() - start
+    return CopyResult(str(source), str(target), n_arrays, n_bytes, seconds)
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="napari-hierarchical",
+        description="Inspect, convert and copy hierarchical files without napari",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="verbose output")
+    subparsers = parser.add_subparsers(dest="command")
+    inspect_parser = subparsers.add_parser("inspect", help="print group trees")
+    inspect_parser.add_argument("paths", nargs="+", metavar="PATH")
+    inspect_parser.add_argument(
+        "-s", "--shapes", action="store_true", help="print array shapes and dtypes"
+    )
+    convert_parser = subparsers.add_parser(
+        "convert", help="convert files to another format"
+    )
+    convert_parser.add_argument("paths", nargs="+", metavar="PATH")
+    convert_parser.add_argument(
+        "-t", "--to", required=True, help="target file suffix, e.g. .zarr"
+    )
+    convert_parser.add_argument(
+        "-o", "--output", help="output directory (default: next to input files)"
+    )
+    convert_parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    copy_parser = subparsers.add_parser("copy", help="copy a single file")
+    copy_parser.add_argument("source", metavar="SOURCE")
+    copy_parser.add_argument("target", metavar="TARGET")
+    return parser
+
+
+def _inspect(paths: Sequence[PathLike], shapes: bool = False) -> int:
+    exit_code = 0
+    for path in paths:
+        try:
+            group = controller.read_group(path)
+        except HierarchicalControllerException as e:
+            print(f"{path}: {e}", file=sys.stderr)
+            exit_code = 1
+            continue
+        try:
+            _print_group(group, shapes=shapes)
+        finally:
+            controller.groups.remove(group)
+    return exit_code
+
+
+def _print_group(group: Group, shapes: bool = False, level: int = 0) -> None:
+    print(f"{'  ' * level}{group.name}/")
+    for array in group.arrays:
+        line = f"{'  ' * (level + 1)}{array.name}"
+        if shapes and controller.can_read_array(array):
+            data = controller.read_array(array)
+            line += f"  {tuple(data.shape)} {data.dtype}"
+        print(line)
+    for child in group.children:
+        _print_group(child, shapes=shapes, level=level + 1)
+
+
+def _copy(jobs: List[Tuple[str, str]], max_workers: Optional[int] = None) -> int:
+    start = time.perf_counter()
+    results: List[CopyResult] = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(copy_group, source, target) for source, target in jobs
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            if result.error is not None:
+                print(f"{result.source}: {result.error}", file=sys.stderr)
+            else:
+                print(
+                    f"{result.source} -> {result.target}: {result.n_arrays} arrays, "
+                    f"{result.n_bytes / 1e6:.1f} MB in {result.seconds:.2f} s"
+                )
+            results.append(result)
+    seconds = time.perf_counter() - start
+    succeeded = [result for result in results if result.error is None]
+    n_arrays = sum(result.n_arrays for result in succeeded)
+    n_bytes = sum(result.n_bytes for result in succeeded)
+    print(
+        f"{len(succeeded)}/{len(results)} files, {n_arrays} arrays, "
+        f"{n_bytes / 1e6:.1f} MB in {seconds:.2f} s "
+        f"({len(succeeded) / seconds:.2f} files/s, {n_bytes / 1e6 / seconds:.1f} MB/s)"
+    )
+    return 0 if len(succeeded) == len(results) else 1
@@ -1,23 +1,65 @@
+import json
 import logging
 import os
-from typing import List, Optional, Set, Union
-
-from napari._qt.layer_controls.qt_layer_controls_base import QtLayerControls
-from napari._qt.layer_controls.qt_layer_controls_container import (
-    create_qt_layer_controls,
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
 )
-from napari.layers import Layer
+
+import numpy as np
+from napari.layers import Image, Layer
 from napari.utils.events import Event, EventedList, SelectableEventedList
-from napari.viewer import Viewer
 from pluggy import PluginManager
 
 from . import hookspecs
 from .model import Array, Group
+from .utils.load_queue import LoadQueue
 from .utils.parent_aware import ParentAware
-from .utils.proxy_image import ProxyImage
+from .utils.path_index import PathIndex
+from .utils.remote import is_url
+from .utils.tracing import count, trace_hook_calls, traced
+from .utils.unload_cache import UnloadCache
+from .utils.viewer import add_layers
+
+if TYPE_CHECKING:
+    from napari._qt.layer_controls.qt_layer_controls_base import QtLayerControls
+    from napari.viewer import Viewer
+    from qtpy.QtCore import QFileSystemWatcher, QTimer
+
+    from .utils.proxy_image import ProxyImage
 
 PathLike = Union[str, os.PathLike]
 
+SESSION_VERSION = 1
+SESSION_LAYER_PROPERTIES = ("opacity", "blending", "contrast_limits", "gamma")
+LOAD_QUEUE_INTERVAL = 0.05  # max. seconds of loading per event loop iteration
+# size of the cache for unloaded array data (in MB, disabled by default)
+UNLOAD_CACHE_ENV_VAR = "NAPARI_HIERARCHICAL_UNLOAD_CACHE_MB"
+# refresh groups when their files change (requires a viewer, disabled by default)
+WATCH_FILES_ENV_VAR = "NAPARI_HIERARCHICAL_WATCH_FILES"
+REFRESH_DELAY_MS = 1000  # wait for writers to finish before refreshing
+
+# load priorities (lower priorities are loaded first)
+SELECTED_PRIORITY = 0  # selected arrays/arrays of selected groups
+VISIBLE_PRIORITY = 1  # arrays next to visible arrays in the camera view
+IN_VIEW_PRIORITY = 2  # arrays next to (hidden) arrays in the camera view
+DEFAULT_PRIORITY = 3
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,10 +67,11 @@ class HierarchicalController:
     def __init__(self) -> None:
         self._pm = PluginManager("napari-hierarchical")
         self._pm.add_hookspecs(hookspecs)
-        self._pm.load_setuptools_entrypoints("napari-hierarchical")
-        self._viewer: Optional[Viewer] = None
-        self._proxy_image: Optional[ProxyImage] = None
-        self._layer_controls: Optional[QtLayerControls] = None
+        trace_hook_calls(self._pm)
+        self._setuptools_entrypoints_loaded = False  # loaded upon first hook call
+        self._viewer: Optional["Viewer"] = None
+        self._proxy_image: Optional["ProxyImage"] = None
+        self._layer_controls: Optional["QtLayerControls"] = None
         self._groups: EventedList[Group] = EventedList(
             basetype=Group, lookup={str: lambda group: group.name}
         )
@@ -38,8 +81,26 @@ class HierarchicalController:
         self._current_arrays: SelectableEventedList[Array] = SelectableEventedList(
             basetype=Array, lookup={str: lambda array: array.name}
         )
+        self._path_index: PathIndex[Union[Group, Array]] = PathIndex()
+        self._group_paths: Dict[Group, str] = {}  # for sessions
+        self._group_mtimes: Dict[Group, Optional[float]] = {}  # for refreshing
+        # paths/mtimes of root groups that were moved into other groups
+        self._nested_group_paths: Dict[Group, Tuple[str, Optional[float]]] = {}
+        self._load_queue: LoadQueue[Array] = LoadQueue(self._get_load_priority)
+        self._load_priority_cache: Dict[Group, int] = {}
+        self._dirty_load_groups: Set[Group] = set()  # see _load_array
+        self._load_timer: Optional["QTimer"] = None
+        self._read_timer: Optional["QTimer"] = None
+        self._refresh_timer: Optional["QTimer"] = None
+        self._file_watcher: Optional["QFileSystemWatcher"] = None
+        self._group_streams: Dict[Group, Iterator[Group]] = {}
+        self._unload_cache: UnloadCache[Array] = UnloadCache(
+            int(float(os.environ.get(UNLOAD_CACHE_ENV_VAR, "0")) * 1024**2)
+        )
         self._updating_layers_selection = False
         self._updating_current_arrays_selection = False
+        self._inserting_groups = False
+        self._retaining_selection = False
         self._groups.events.connect(self._on_groups_event)
         self._selected_groups.events.connect(self._on_selected_groups_event)
         self._current_arrays.selection.events.changed.connect(
@@ -52,8 +113,18 @@ class HierarchicalController:
             self._viewer.layers.selection.events.changed.disconnect(
                 self._on_layers_selection_changed_event
             )
+            self._viewer.camera.events.center.disconnect(self._on_camera_event)
+            self._viewer.camera.events.zoom.disconnect(self._on_camera_event)
+
+    def register_viewer(self, viewer: "Viewer") -> None:
+        # defer Qt imports to allow for using the controller without viewer (headless)
+        from napari._qt.layer_controls.qt_layer_controls_container import (
+            create_qt_layer_controls,
+        )
+        from qtpy.QtCore import QFileSystemWatcher, QTimer
+
+        from .utils.proxy_image import ProxyImage
 
-    def register_viewer(self, viewer: Viewer) -> None:
         assert self._viewer is None
         self._viewer = viewer
         self._proxy_image = ProxyImage(viewer.layers)
@@ -65,12 +136,39 @@ class HierarchicalController:
         viewer.layers.selection.events.changed.connect(
             self._on_layers_selection_changed_event
         )
+        viewer.camera.events.center.connect(self._on_camera_event)
+        viewer.camera.events.zoom.connect(self._on_camera_event)
+        self._load_timer = QTimer()
+        self._load_timer.setInterval(0)
+        self._load_timer.timeout.connect(self._on_load_timer_timeout)
+        self._read_timer = QTimer()
+        self._read_timer.setInterval(0)
+        self._read_timer.timeout.connect(self._on_read_timer_timeout)
+        if os.environ.get(WATCH_FILES_ENV_VAR):
+            self._refresh_timer = QTimer()
+            self._refresh_timer.setSingleShot(True)
+            self._refresh_timer.setInterval(REFRESH_DELAY_MS)
+            self._refresh_timer.timeout.connect(self._on_refresh_timer_timeout)
+            self._file_watcher = QFileSystemWatcher()
+            self._file_watcher.fileChanged.connect(self._on_file_changed)
+            self._file_watcher.directoryChanged.connect(self._on_file_changed)
+            for path in set(self._group_paths.values()):
+                if not is_url(path):
+                    self._file_watcher.addPath(path)
 
     def can_read_group(self, path: PathLike) -> bool:
         return self._get_group_reader_function(path) is not None
 
-    def read_group(self, path: PathLike) -> Group:
-        logger.debug(f"path={path}")
+    @traced
+    def read_group(self, path: PathLike, block: bool = True) -> Group:
+        # when not blocking, groups are read progressively using group stream readers
+        # (if available): the root group is inserted immediately and its children are
+        # appended as they are read (requires a viewer, i.e. an event loop)
+        logger.debug(f"path={path}, block={block}")
+        if not block and self._read_timer is not None:
+            group_stream_reader_function = self._get_group_stream_reader_function(path)
+            if group_stream_reader_function is not None:
+                return self._stream_group(path, group_stream_reader_function)
         group_reader_function = self._get_group_reader_function(path)
         if group_reader_function is None:
             raise HierarchicalControllerException(f"No group reader found for {path}")
@@ -79,18 +177,248 @@ class HierarchicalController:
         except Exception as e:
             raise HierarchicalControllerException(e)
         self._groups.append(group)
+        self._set_group_path(group, path)
         return group
 
+    @traced
+    def read_groups(
+        self,
+        paths: Sequence[PathLike],
+        max_workers: Optional[int] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> List[Group]:
+        # files are read concurrently and the groups are inserted in the given order
+        # once all files have been read; files that cannot be read do not prevent the
+        # other groups from being inserted, but are reported afterwards (in order)
+        logger.debug(f"paths={len(paths)}, max_workers={max_workers}")
+        groups, errors = self._read_groups(paths, max_workers, progress)
+        if len(errors) > 0:
+            raise HierarchicalControllerException(
+                "\n".join(f"{paths[i]}: {error}" for i, error in sorted(errors))
+            )
+        return [groups[i] for i in sorted(groups)]
+
+    def _read_groups(
+        self,
+        paths: Sequence[PathLike],
+        max_workers: Optional[int],
+        progress: Optional[Callable[[int, int], None]],
+    ) -> Tuple[Dict[int, Group], List[Tuple[int, str]]]:
+        # returns the inserted groups and the errors by path index
+        errors: List[Tuple[int, str]] = []  # paths may be duplicated
+        group_reader_functions: Dict[int, hookspecs.GroupReaderFunction] = {}
+        for i, path in enumerate(paths):
+            group_reader_function = self._get_group_reader_function(path)
+            if group_reader_function is None:
+                errors.append((i, "No group reader found"))
+            else:
+                group_reader_functions[i] = group_reader_function
+        groups: Dict[int, Group] = {}
+        num_done = len(errors)
+        if progress is not None:
+            progress(num_done, len(paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(group_reader_function, paths[i]): i
+                for i, group_reader_function in group_reader_functions.items()
+            }
+            not_done = set(futures)
+            while len(not_done) > 0:
+                # the viewer (e.g. the progress bar) is repainted while waiting
+                done, not_done = wait(
+                    not_done, timeout=LOAD_QUEUE_INTERVAL, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    i = futures[future]
+                    try:
+                        groups[i] = future.result()
+                    except Exception as e:
+                        errors.append((i, str(e)))
+                    num_done += 1
+                if len(done) > 0 and progress is not None:
+                    progress(num_done, len(paths))
+                self._process_events()
+        new_groups = [groups[i] for i in sorted(groups)]
+        self._inserting_groups = True
+        try:
+            self._groups.extend(new_groups)
+        finally:
+            self._inserting_groups = False
+        for i, group in groups.items():
+            self._set_group_path(group, paths[i])
+        if len(new_groups) > 0 and len(self._selected_groups) == 0:
+            self._update_current_arrays()
+        count("groups read", len(new_groups))
+        return groups, errors
+
+    def _stream_group(
+        self,
+        path: PathLike,
+        group_stream_reader_function: hookspecs.GroupStreamReaderFunction,
+    ) -> Group:
+        assert self._read_timer is not None
+        try:
+            group_stream = group_stream_reader_function(path)
+            group = next(group_stream)
+        except Exception as e:
+            raise HierarchicalControllerException(e)
+        self._groups.append(group)
+        self._set_group_path(group, path)
+        self._group_streams[group] = group_stream
+        if not self._read_timer.isActive():
+            self._read_timer.start()
+        return group
+
+    @traced
+    def refresh_group(self, group: Group) -> bool:
+        # re-reads the group's file and applies the differences to the group tree,
+        # i.e. unchanged groups and arrays (including loaded layers) are retained;
+        # returns whether the group tree has changed
+        logger.debug(f"group={group}")
+        path = self._group_paths.get(group)
+        if path is None:
+            raise HierarchicalControllerException(
+                f"Group has not been read from a file: {group}"
+            )
+        if group in self._group_streams:
+            raise HierarchicalControllerException(f"Group is still being read: {group}")
+        if group.dirty:
+            raise HierarchicalControllerException(
+                f"Group structure has been modified: {group}"
+            )
+        group_reader_function = self._get_group_reader_function(path)
+        if group_reader_function is None:
+            raise HierarchicalControllerException(f"No group reader found for {path}")
+        mtime = _get_mtime(path)
+        try:
+            new_group = group_reader_function(path)
+        except Exception as e:
+            raise HierarchicalControllerException(e)
+        self._group_mtimes[group] = mtime
+        self._retaining_selection = True
+        try:
+            changed = self._merge_group(group, new_group)
+        finally:
+            self._retaining_selection = False
+        group.commit()
+        if changed:
+            count("groups refreshed")
+        return changed
+
+    @traced
+    def refresh_groups(self) -> List[Group]:
+        # refreshes all groups whose files have been modified since they were read;
+        # groups that cannot be refreshed are reported after refreshing the others
+        logger.debug("")
+        refreshed_groups: List[Group] = []
+        errors: List[Tuple[str, str]] = []  # groups may share paths
+        for group in list(self._groups):
+            path = self._group_paths.get(group)
+            if path is None or group in self._group_streams or group.dirty:
+                continue
+            mtime = _get_mtime(path)
+            if mtime is None or mtime == self._group_mtimes.get(group):
+                continue
+            try:
+                if self.refresh_group(group):
+                    refreshed_groups.append(group)
+            except HierarchicalControllerException as e:
+                errors.append((path, str(e)))
+        if len(errors) > 0:
+            raise HierarchicalControllerException(
+                "\n".join(f"{path}: {error}" for path, error in errors)
+            )
+        return refreshed_groups
+
+    def _merge_group(self, group: Group, new_group: Group) -> bool:
+        # arrays are matched by their reader-specific fields (i.e., not by their names,
+        # which follow the layer names), child groups are matched by their names
+        changed = False
+        new_arrays = {_get_array_key(array): array for array in new_group.arrays}
+        for array in list(group.arrays):
+            if new_arrays.pop(_get_array_key(array), None) is None:
+                self._load_queue.remove([array])
+                if array.loaded:
+                    self.unload_array(array)
+                group.arrays.remove(array)
+                changed = True
+        for array in new_arrays.values():
+            group.arrays.append(array)
+            changed = True
+        new_children = {child.name: child for child in new_group.children}
+        for child in list(group.children):
+            new_child = new_children.pop(child.name, None)
+            if new_child is None:
+                self.unload_group(child)
+                group.children.remove(child)
+                changed = True
+            elif self._merge_group(child, new_child):
+                changed = True
+        for new_child in new_children.values():
+            group.children.append(new_child)
+            changed = True
+        return changed
+
+    def _set_group_path(self, group: Group, path: PathLike) -> None:
+        group_path = _get_group_path(path)
+        self._group_paths[group] = group_path
+        self._group_mtimes[group] = _get_mtime(group_path)
+        if self._file_watcher is not None and not is_url(group_path):
+            self._file_watcher.addPath(group_path)
+
+    def _unset_group_path(self, group: Group) -> None:
+        group_path = self._group_paths.pop(group, None)
+        self._group_mtimes.pop(group, None)
+        if (
+            self._file_watcher is not None
+            and group_path is not None
+            and group_path not in self._group_paths.values()
+        ):
+            self._file_watcher.removePath(group_path)
+
+    def _on_file_changed(self, path: str) -> None:
+        assert self._file_watcher is not None and self._refresh_timer is not None
+        logger.debug(f"path={path}")
+        # replaced files (e.g. when written atomically) are no longer watched
+        if (
+            path in self._group_paths.values()
+            and path not in self._file_watcher.files()
+            and path not in self._file_watcher.directories()
+            and os.path.exists(path)
+        ):
+            self._file_watcher.addPath(path)
+        self._refresh_timer.start()
+
+    def _on_refresh_timer_timeout(self) -> None:
+        try:
+            self.refresh_groups()
+        except HierarchicalControllerException as e:
+            logger.warning(f"Could not refresh groups: {e}")
+
     def can_write_group(self, path: PathLike, group: Group) -> bool:
         return self._get_group_writer_function(path, group) is not None
 
-    def write_group(self, path: PathLike, group: Group) -> None:
-        logger.debug(f"path={path}, group={group}")
+    @traced
+    def write_group(
+        self,
+        path: PathLike,
+        group: Group,
+        stream: bool = False,
+        array_reader: Optional[hookspecs.ArrayReaderFunction] = None,
+    ) -> None:
+        logger.debug(f"path={path}, group={group}, stream={stream}")
         group_writer_function = self._get_group_writer_function(path, group)
         if group_writer_function is None:
             raise HierarchicalControllerException(f"No group writer found for {path}")
         try:
-            group_writer_function(path, group)
+            # read unloaded arrays on the fly instead of loading them (implied by
+            # passing an array reader)
+            if stream or array_reader is not None:
+                group_writer_function(
+                    path, group, array_reader=array_reader or self.read_array
+                )
+            else:
+                group_writer_function(path, group)
         except Exception as e:
             raise HierarchicalControllerException(e)
 
@@ -104,45 +432,155 @@ class HierarchicalController:
             and (not unloaded_only or not array.loaded)
         )
 
-    def load_group(self, group: Group) -> None:
-        logger.debug(f"group={group}")
-        for array in group.iter_arrays(recursive=True):
-            if not array.loaded:
-                self.load_array(array)
+    @traced
+    def load_group(self, group: Group, block: bool = True) -> None:
+        # arrays are loaded by priority (see _get_load_priority); when not blocking,
+        # arrays are loaded in the background and priorities are updated as the user
+        # navigates (requires a viewer, i.e. an event loop)
+        logger.debug(f"group={group}, block={block}")
+        self._load_queue.push(
+            array for array in group.iter_arrays(recursive=True) if not array.loaded
+        )
+        if block or self._load_timer is None:
+            self._process_load_queue()
+        elif not self._load_timer.isActive():
+            self._load_timer.start()
 
+    @traced
     def unload_group(self, group: Group) -> None:
         logger.debug(f"group={group}")
+        self._load_queue.remove(group.iter_arrays(recursive=True))
         for array in group.iter_arrays(recursive=True):
             if array.loaded:
                 self.unload_array(array)
 
+    def can_read_array(self, array: Array) -> bool:
+        return self._get_array_reader_function(array) is not None
+
+    @traced
+    def read_array(self, array: Array) -> Any:
+        logger.debug(f"array={array}")
+        array_reader_function = self._get_array_reader_function(array)
+        if array_reader_function is None:
+            raise HierarchicalControllerException(f"No array reader found for {array}")
+        try:
+            return array_reader_function(array)
+        except Exception as e:
+            raise HierarchicalControllerException(e)
+
     def can_load_array(self, array: Array) -> bool:
         return self._get_array_loader_function(array) is not None
 
+    @traced
     def load_array(self, array: Array) -> None:
-        assert self._viewer is not None
+        self._load_array(array)
+        assert array.layer is not None
+        self._add_layers([array.layer])
+
+    def _load_array(self, array: Array) -> None:
+        # loads the array without adding its layer to the viewer (see _add_layers)
         if array.loaded:
             raise HierarchicalControllerException(
                 f"Array has already been loaded: {array}"
             )
         logger.debug(f"array={array}")
-        array_loader_function = self._get_array_loader_function(array)
-        if array_loader_function is None:
-            raise HierarchicalControllerException(f"No array loader found for {array}")
-        try:
-            array_loader_function(array)
-        except Exception as e:
-            raise HierarchicalControllerException(e)
+        layer = self._unload_cache.pop(array)
+        if layer is not None:
+            array.layer = layer
+            count("arrays loaded from cache")
+        else:
+            array_loader_function = self._get_array_loader_function(array)
+            if array_loader_function is None:
+                raise HierarchicalControllerException(
+                    f"No array loader found for {array}"
+                )
+            try:
+                array_loader_function(array)
+            except Exception as e:
+                raise HierarchicalControllerException(e)
         assert array.layer is not None
-        self._viewer.add_layer(array.layer)
+        count("arrays loaded")
+        if len(self._load_queue) > 0 and array.parent is not None:
+            # loaded arrays affect the load priorities of their siblings, which are
+            # updated once per processed slice (see _update_dirty_load_priorities)
+            self._load_queue.remove([array])
+            self._load_priority_cache.pop(array.parent, None)
+            self._dirty_load_groups.add(array.parent)
 
+    @traced
+    def load_arrays(
+        self, arrays: Iterable[Array], max_workers: Optional[int] = None
+    ) -> None:
+        # arrays are loaded concurrently, but layers are set in the calling thread and
+        # in the given order, i.e. arrays should be ordered by priority; layers are
+        # added to the viewer in time slices, i.e. the first arrays are shown early
+        arrays = [array for array in arrays if not array.loaded]
+        logger.debug(f"arrays={len(arrays)}, max_workers={max_workers}")
+        self._load_queue.remove(arrays)
+        array_loader_functions: Dict[Array, hookspecs.ArrayLoaderFunction] = {}
+        for array in arrays:
+            if array in self._unload_cache:
+                continue
+            array_loader_function = self._get_array_loader_function(array)
+            if array_loader_function is None:
+                raise HierarchicalControllerException(
+                    f"No array loader found for {array}"
+                )
+            array_loader_functions[array] = array_loader_function
+        cached_layers: Dict[Array, Layer] = {}
+        for array in arrays:
+            layer = self._unload_cache.pop(array)
+            if layer is not None:
+                cached_layers[array] = layer
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                array: executor.submit(
+                    _load_detached_array, array_loader_function, array
+                )
+                for array, array_loader_function in array_loader_functions.items()
+            }
+            start = time.perf_counter()
+            layers: List[Layer] = []
+            try:
+                for array in arrays:
+                    layer = cached_layers.get(array)
+                    if layer is None:
+                        try:
+                            layer = futures[array].result()
+                        except Exception as e:
+                            raise HierarchicalControllerException(e)
+                    else:
+                        count("arrays loaded from cache")
+                    array.layer = layer
+                    layers.append(layer)
+                    count("arrays loaded")
+                    if time.perf_counter() - start > LOAD_QUEUE_INTERVAL:
+                        self._add_layers(layers)
+                        layers = []
+                        self._process_events()
+                        start = time.perf_counter()
+            finally:
+                for future in futures.values():
+                    future.cancel()
+                # cached layers that have not been assigned (e.g. another array failed
+                # to load) are returned to the unload cache
+                for array, layer in cached_layers.items():
+                    if array.layer is not layer:
+                        self._unload_cache.put(array, layer)
+                self._add_layers(layers)
+
+    @traced
     def unload_array(self, array: Array) -> None:
         logger.debug(f"array={array}")
+        self._load_queue.remove([array])
         if array.layer is None:
             raise HierarchicalControllerException(f"Array has not been loaded: {array}")
         if self._viewer is not None and array.layer in self._viewer.layers:
             self._viewer.layers.remove(array.layer)
+        if self._unload_cache.put(array, array.layer):
+            count("arrays cached")
         array.layer = None
+        count("arrays unloaded")
 
     def can_save_group(self, group: Group) -> bool:
         return not group.dirty and all(
@@ -151,6 +589,7 @@ class HierarchicalController:
             if array.loaded
         )
 
+    @traced
     def save_group(self, group: Group) -> None:
         logger.debug(f"group={group}")
         if group.dirty:
@@ -164,6 +603,7 @@ class HierarchicalController:
     def can_save_array(self, array: Array) -> bool:
         return self._get_array_saver_function(array) is not None
 
+    @traced
     def save_array(self, array: Array) -> None:
         logger.debug(f"array={array}")
         if not array.loaded:
@@ -176,27 +616,251 @@ class HierarchicalController:
         except Exception as e:
             raise HierarchicalControllerException(e)
 
+    def save_session(self, path: PathLike) -> None:
+        logger.debug(f"path={path}")
+        group_sessions = []
+        for group in self._groups:
+            group_path = self._group_paths.get(group)
+            if group_path is None:
+                logger.warning(f"Group has not been read from a file: {group}")
+                continue
+            array_sessions = []
+            for array_path, array in _iter_group_paths(group):
+                if isinstance(array, Array) and array.layer is not None:
+                    array_session = {
+                        "path": array_path,
+                        "visible": array.layer.visible,
+                        "layer": _get_layer_properties(array.layer),
+                    }
+                    array_sessions.append(array_session)
+            group_sessions.append({"path": group_path, "arrays": array_sessions})
+        session = {"version": SESSION_VERSION, "groups": group_sessions}
+        with Path(path).open("w") as f:
+            json.dump(session, f, indent=2)
+
+    @traced
+    def restore_session(
+        self, path: PathLike, max_workers: Optional[int] = None
+    ) -> List[Group]:
+        logger.debug(f"path={path}, max_workers={max_workers}")
+        with Path(path).open() as f:
+            session = json.load(f)
+        if session.get("version") != SESSION_VERSION:
+            raise HierarchicalControllerException(f"Unsupported session: {path}")
+        # groups are read concurrently; groups that cannot be read do not prevent the
+        # other groups from being restored, but are reported afterwards (in order)
+        group_sessions = session["groups"]
+        paths = [group_session["path"] for group_session in group_sessions]
+        read_groups, errors = self._read_groups(paths, max_workers, None)
+        groups: List[Group] = []
+        visible_arrays: List[Array] = []
+        hidden_arrays: List[Array] = []
+        layer_properties: Dict[Array, Dict[str, Any]] = {}
+        for i, group in sorted(read_groups.items()):
+            group_session = group_sessions[i]
+            groups.append(group)
+            arrays = dict(_iter_group_paths(group))
+            for array_session in group_session["arrays"]:
+                array = arrays.get(array_session["path"])
+                if not isinstance(array, Array):
+                    logger.warning(f"Array not found: {array_session['path']}")
+                    continue
+                if array_session["visible"]:
+                    visible_arrays.append(array)
+                else:
+                    hidden_arrays.append(array)
+                layer_properties[array] = array_session["layer"]
+        # load visible arrays first, such that the viewer becomes usable early
+        self.load_arrays(visible_arrays + hidden_arrays, max_workers=max_workers)
+        for array in visible_arrays + hidden_arrays:
+            assert array.layer is not None
+            _set_layer_properties(array.layer, layer_properties[array])
+        for array in hidden_arrays:
+            array.hide()
+        if len(errors) > 0:
+            raise HierarchicalControllerException(
+                "\n".join(f"{paths[i]}: {error}" for i, error in sorted(errors))
+            )
+        return groups
+
+    @traced
+    def _process_load_queue(self, timeout: Optional[float] = None) -> None:
+        start = time.perf_counter()
+        self._update_dirty_load_priorities()
+        layers: List[Layer] = []
+        try:
+            while len(self._load_queue) > 0:
+                array = self._load_queue.pop()
+                if not array.loaded:
+                    self._load_array(array)
+                    assert array.layer is not None
+                    layers.append(array.layer)
+                if timeout is not None and time.perf_counter() - start > timeout:
+                    break
+        finally:
+            if len(self._load_queue) == 0:
+                self._dirty_load_groups.clear()
+            self._add_layers(layers)
+
+    @traced
+    def _add_layers(self, layers: List[Layer]) -> None:
+        if self._viewer is not None:  # headless otherwise
+            add_layers(self._viewer, layers)
+
+    def _process_events(self) -> None:
+        # repaints the viewer (e.g. added layers, progress bars) during long-running
+        # operations; user input is not processed, i.e. it cannot interfere
+        if self._viewer is not None:  # headless otherwise
+            from qtpy.QtCore import QCoreApplication, QEventLoop
+
+            QCoreApplication.processEvents(
+                QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents
+            )
+
+    @traced
+    def _process_group_streams(self, timeout: Optional[float] = None) -> None:
+        # child groups are read from all group streams in turns
+        start = time.perf_counter()
+        while len(self._group_streams) > 0:
+            for group, group_stream in list(self._group_streams.items()):
+                try:
+                    child = next(group_stream)
+                except StopIteration:
+                    del self._group_streams[group]
+                    continue
+                except Exception as e:
+                    del self._group_streams[group]
+                    raise HierarchicalControllerException(e)
+                # streamed children are not structural modifications (see dirty)
+                dirty = group.children.dirty
+                self._retaining_selection = True
+                try:
+                    group.children.append(child)
+                finally:
+                    self._retaining_selection = False
+                group.children.dirty = dirty
+                count("groups streamed")
+            if timeout is not None and time.perf_counter() - start > timeout:
+                break
+
+    def _on_read_timer_timeout(self) -> None:
+        assert self._read_timer is not None
+        try:
+            self._process_group_streams(timeout=LOAD_QUEUE_INTERVAL)
+        finally:
+            if len(self._group_streams) == 0:
+                self._read_timer.stop()
+
+    def _on_load_timer_timeout(self) -> None:
+        assert self._load_timer is not None
+        try:
+            self._process_load_queue(timeout=LOAD_QUEUE_INTERVAL)
+        finally:
+            if len(self._load_queue) == 0:
+                self._load_timer.stop()
+
+    def _update_load_priorities(self) -> None:
+        self._dirty_load_groups.clear()
+        if len(self._load_queue) > 0:
+            self._load_priority_cache.clear()
+            self._load_queue.update()
+
+    def _update_dirty_load_priorities(self) -> None:
+        dirty_load_groups = self._dirty_load_groups
+        self._dirty_load_groups = set()
+        if len(self._load_queue) > 0:
+            for group in dirty_load_groups:
+                self._load_queue.update(group.arrays)
+
+    def _get_load_priority(self, array: Array) -> int:
+        if array in self._current_arrays.selection:
+            return SELECTED_PRIORITY
+        group = array.parent
+        if group is None:
+            return DEFAULT_PRIORITY
+        priority = self._load_priority_cache.get(group)
+        if priority is None:
+            priority = self._get_group_load_priority(group)
+            self._load_priority_cache[group] = priority
+        return priority
+
+    def _get_group_load_priority(self, group: Group) -> int:
+        # the extents of unloaded arrays are unknown, so the loaded arrays of the same
+        # group (e.g. other channels of the same acquisition) are used instead
+        ancestor: Optional[Group] = group
+        while ancestor is not None:
+            if ancestor in self._selected_groups:
+                return SELECTED_PRIORITY
+            ancestor = ancestor.parent
+        view_extent = self._get_view_extent()
+        priority = DEFAULT_PRIORITY
+        for array in group.arrays:
+            if array.layer is not None:
+                if view_extent is not None:
+                    layer_extent = array.layer.extent.world[:, -2:]
+                    if not np.all(
+                        (layer_extent[0] <= view_extent[1])
+                        & (view_extent[0] <= layer_extent[1])
+                    ):
+                        continue
+                if array.layer.visible:
+                    return VISIBLE_PRIORITY
+                priority = IN_VIEW_PRIORITY
+        return priority
+
+    def _get_view_extent(self) -> Optional[np.ndarray]:
+        if self._viewer is None:
+            return None
+        center = np.asarray(self._viewer.camera.center[-2:])
+        half_size = np.asarray(self._viewer._canvas_size) / self._viewer.camera.zoom / 2
+        return np.array([center - half_size, center + half_size])
+
+    def _on_camera_event(self, event: Event) -> None:
+        self._update_load_priorities()
+
     def _get_group_reader_function(
         self, path: PathLike
     ) -> Optional[hookspecs.GroupReaderFunction]:
-        return self._pm.hook.napari_hierarchical_get_group_reader(path=path)
+        group_reader_function = self._hook.napari_hierarchical_get_group_reader(
+            path=path
+        )
+        if group_reader_function is None:
+            group_stream_reader_function = self._get_group_stream_reader_function(path)
+            if group_stream_reader_function is not None:
+                return partial(_read_streamed_group, group_stream_reader_function)
+        return group_reader_function
+
+    def _get_group_stream_reader_function(
+        self, path: PathLike
+    ) -> Optional[hookspecs.GroupStreamReaderFunction]:
+        return self._hook.napari_hierarchical_get_group_stream_reader(path=path)
 
     def _get_group_writer_function(
         self, path: PathLike, group: Group
     ) -> Optional[hookspecs.GroupWriterFunction]:
-        return self._pm.hook.napari_hierarchical_get_group_writer(
-            path=path, group=group
-        )
+        return self._hook.napari_hierarchical_get_group_writer(path=path, group=group)
+
+    def _get_array_reader_function(
+        self, array: Array
+    ) -> Optional[hookspecs.ArrayReaderFunction]:
+        return self._hook.napari_hierarchical_get_array_reader(array=array)
 
     def _get_array_loader_function(
         self, array: Array
     ) -> Optional[hookspecs.ArrayLoaderFunction]:
-        return self._pm.hook.napari_hierarchical_get_array_loader(array=array)
+        return self._hook.napari_hierarchical_get_array_loader(array=array)
 
     def _get_array_saver_function(
         self, array: Array
     ) -> Optional[hookspecs.ArraySaverFunction]:
-        return self._pm.hook.napari_hierarchical_get_array_saver(array=array)
+        return self._hook.napari_hierarchical_get_array_saver(array=array)
+
+    @property
+    def _hook(self) -> Any:
+        if not self._setuptools_entrypoints_loaded:
+            self._pm.load_setuptools_entrypoints("napari-hierarchical")
+            self._setuptools_entrypoints_loaded = True
+        return self._pm.hook
 
     def _on_groups_event(self, event: Event) -> None:
         self._process_groups_event(event, connect=True)
@@ -208,40 +872,65 @@ class HierarchicalController:
         assert isinstance(group_arrays_or_children, ParentAware)
         group = group_arrays_or_children.parent
         assert isinstance(group, Group)
-        if group_arrays_or_children == group.children:
+        if group_arrays_or_children is group.children:
             self._process_groups_event(source_list_event)
-        elif group_arrays_or_children == group.arrays:
+        elif group_arrays_or_children is group.arrays:
             self._process_arrays_event(source_list_event)
 
+    def _on_group_nested_event(self, event: Event) -> None:
+        source_event = event.source_event
+        assert isinstance(source_event, Event)
+        if source_event.type == "name":
+            group_or_array = source_event.source
+            if isinstance(group_or_array, Group):
+                self._unindex_group(group_or_array)
+                self._index_group(group_or_array)
+            elif isinstance(group_or_array, Array):
+                self._path_index.remove([group_or_array])
+                self._index_array(group_or_array)
+
     def _process_groups_event(self, event: Event, connect: bool = False) -> None:
         if not isinstance(event.sources[0], EventedList):
             return
         if event.type == "inserted":
             logger.debug(f"event={event.type}")
-            if len(self._selected_groups) > 0:
+            self._index_group(event.value)
+            # streamed/refreshed groups do not affect the selection
+            if len(self._selected_groups) > 0 and not self._retaining_selection:
                 self._selected_groups.clear()
-            else:
+            elif not self._inserting_groups:  # updated once in read_groups
                 self._update_current_arrays()
             if connect:
                 group = event.value
                 assert isinstance(group, Group)
-                group.nested_list_event.connect(self._on_group_nested_list_event)
+                self._connect_group_events(group)
         elif event.type == "removed":
             logger.debug(f"event={event.type}")
+            self._unindex_group(event.value)
             if connect:
                 group = event.value
                 assert isinstance(group, Group)
-                group.nested_list_event.disconnect(self._on_group_nested_list_event)
+                self._disconnect_group_events(group)
+                self._unset_group_path(group)
+                group_stream = self._group_streams.pop(group, None)
+                if isinstance(group_stream, Generator):
+                    group_stream.close()
+            self._load_queue.remove(event.value.iter_arrays(recursive=True))
+            self._unload_cache.remove(event.value.iter_arrays(recursive=True))
+            for group in (event.value, *event.value.iter_children(recursive=True)):
+                self._nested_group_paths.pop(group, None)
             if len(self._selected_groups) > 0:
                 self._selected_groups.clear()
             else:
                 self._update_current_arrays()
         elif event.type == "changed" and isinstance(event.index, int):
             logger.debug(f"event={event.type}")
+            self._unindex_group(event.old_value)
+            self._index_group(event.value)
             if connect:
                 old_group = event.old_value
                 assert isinstance(old_group, Group)
-                old_group.nested_list_event.disconnect(self._on_group_nested_list_event)
+                self._disconnect_group_events(old_group)
             if len(self._selected_groups) > 0:
                 self._selected_groups.clear()
             else:
@@ -249,17 +938,19 @@ class HierarchicalController:
             if connect:
                 group = event.value
                 assert isinstance(group, Group)
-                group.nested_list_event.connect(self._on_group_nested_list_event)
+                self._connect_group_events(group)
         elif event.type == "changed":
             logger.debug(f"event={event.type}")
+            for old_group in event.old_value:
+                self._unindex_group(old_group)
+            for group in event.value:
+                self._index_group(group)
             if connect:
                 old_groups = event.old_value
                 assert isinstance(old_groups, List)
                 for old_group in old_groups:
                     assert isinstance(old_group, Group)
-                    old_group.nested_list_event.disconnect(
-                        self._on_group_nested_list_event
-                    )
+                    self._disconnect_group_events(old_group)
             if len(self._selected_groups) > 0:
                 self._selected_groups.clear()
             else:
@@ -269,14 +960,81 @@ class HierarchicalController:
                 assert isinstance(groups, List)
                 for group in groups:
                     assert isinstance(group, Group)
-                    group.nested_list_event.connect(self._on_group_nested_list_event)
+                    self._connect_group_events(group)
+        elif event.type == "moved" and hasattr(event, "dest_list"):
+            logger.debug(f"event={event.type}")
+            group = event.value
+            assert isinstance(group, Group)
+            self._unindex_group(group)
+            self._index_group(group)
+            # file paths only apply to root groups (sessions, refreshing), but are
+            # restored when moving groups back to the top level
+            if connect and event.dest_list is not self._groups:
+                self._disconnect_group_events(group)
+                if group in self._group_paths:
+                    self._nested_group_paths[group] = (
+                        self._group_paths[group],
+                        self._group_mtimes.get(group),
+                    )
+                self._unset_group_path(group)
+            elif not connect and event.dest_list is self._groups:
+                self._connect_group_events(group)
+                if group in self._nested_group_paths:
+                    group_path, mtime = self._nested_group_paths.pop(group)
+                    self._set_group_path(group, group_path)
+                    self._group_mtimes[group] = mtime
+            self._update_current_arrays()
 
     def _process_arrays_event(self, event: Event) -> None:
         if not isinstance(event.sources[0], EventedList):
             return
         if event.type in ("inserted", "removed", "changed"):
             logger.debug(f"event={event.type}")
+            if event.type == "inserted":
+                self._index_array(event.value)
+            elif event.type == "removed":
+                self._path_index.remove([event.value])
+                self._unload_cache.remove([event.value])
+            elif isinstance(event.index, int):
+                self._path_index.remove([event.old_value])
+                self._unload_cache.remove([event.old_value])
+                self._index_array(event.value)
+            else:
+                self._path_index.remove(event.old_value)
+                self._unload_cache.remove(event.old_value)
+                for array in event.value:
+                    self._index_array(array)
             self._update_current_arrays()
+        elif event.type == "moved" and hasattr(event, "dest_list"):
+            logger.debug(f"event={event.type}")
+            self._path_index.remove([event.value])
+            self._index_array(event.value)
+            self._update_current_arrays()
+
+    def _connect_group_events(self, group: Group) -> None:
+        group.nested_event.connect(self._on_group_nested_event)
+        group.nested_list_event.connect(self._on_group_nested_list_event)
+
+    def _disconnect_group_events(self, group: Group) -> None:
+        group.nested_event.disconnect(self._on_group_nested_event)
+        group.nested_list_event.disconnect(self._on_group_nested_list_event)
+
+    def _index_group(self, group: Group) -> None:
+        parent_path = None
+        if group.parent is not None:
+            parent_path = self._path_index.get_path(group.parent)
+        self._path_index.add(_iter_group_paths(group, parent_path=parent_path))
+
+    def _unindex_group(self, group: Group) -> None:
+        self._path_index.remove([group])
+        self._path_index.remove(group.iter_arrays(recursive=True))
+        self._path_index.remove(group.iter_children(recursive=True))
+
+    def _index_array(self, array: Array) -> None:
+        assert array.parent is not None
+        group_path = self._path_index.get_path(array.parent)
+        assert group_path is not None
+        self._path_index.add([(_get_array_path(array, group_path), array)])
 
     def _on_selected_groups_event(self, event: Event) -> None:
         if not isinstance(event.sources[0], EventedList):
@@ -284,8 +1042,10 @@ class HierarchicalController:
         if event.type in ("inserted", "removed", "changed"):
             logger.debug(f"event={event.type}")
             self._update_current_arrays()
+            self._update_load_priorities()
 
     def _on_current_arrays_selection_changed_event(self, event: Event) -> None:
+        self._update_load_priorities()
         if self._viewer is not None and not self._updating_current_arrays_selection:
             logger.debug("")
             self._updating_layers_selection = True
@@ -375,6 +1135,7 @@ class HierarchicalController:
             finally:
                 self._updating_current_arrays_selection = False
 
+    @traced
     def _update_current_arrays(self) -> None:
         logger.debug("")
         if len(self._selected_groups) > 0:
@@ -385,10 +1146,14 @@ class HierarchicalController:
         new_current_arrays: Set[Array] = set()
         for group in selected_groups:
             new_current_arrays.update(group.iter_arrays(recursive=True))
-        for array in old_current_arrays.difference(new_current_arrays):
+        removed_arrays = old_current_arrays.difference(new_current_arrays)
+        for array in removed_arrays:
             self._current_arrays.remove(array)
-        for array in new_current_arrays.difference(old_current_arrays):
+        inserted_arrays = new_current_arrays.difference(old_current_arrays)
+        for array in inserted_arrays:
             self._current_arrays.append(array)
+        count("current arrays removed", len(removed_arrays))
+        count("current arrays inserted", len(inserted_arrays))
         self._current_arrays.selection.clear()
 
     @property
@@ -396,7 +1161,7 @@ class HierarchicalController:
         return self._pm
 
     @property
-    def viewer(self) -> Optional[Viewer]:
+    def viewer(self) -> Optional["Viewer"]:
         return self._viewer
 
     @property
@@ -411,9 +1176,115 @@ class HierarchicalController:
     def current_arrays(self) -> SelectableEventedList[Array]:
         return self._current_arrays
 
+    @property
+    def unload_cache(self) -> UnloadCache[Array]:
+        return self._unload_cache
+
+    @property
+    def path_index(self) -> PathIndex[Union[Group, Array]]:
+        return self._path_index
+
 
 class HierarchicalControllerException(Exception):
     pass
 
 
+def _iter_group_paths(
+    group: Group, parent_path: Optional[str] = None
+) -> Iterator[Tuple[str, Union[Group, Array]]]:
+    # paths are composed of group names, e.g. "file.h5/group/subgroup"
+    if parent_path is not None:
+        group_path = f"{parent_path}/{group.name}"
+    else:
+        group_path = group.name
+    yield group_path, group
+    for array in group.arrays:
+        yield _get_array_path(array, group_path), array
+    for child in group.children:
+        yield from _iter_group_paths(child, parent_path=group_path)
+
+
+def _read_streamed_group(
+    group_stream_reader_function: hookspecs.GroupStreamReaderFunction, path: PathLike
+) -> Group:
+    group_stream = group_stream_reader_function(path)
+    group = next(group_stream)
+    group.children.extend_silently(group_stream)
+    return group
+
+
+def _get_group_path(path: PathLike) -> str:
+    if is_url(path):  # e.g. s3://bucket/file.h5
+        return str(path)
+    return os.path.abspath(path)
+
+
+def _get_mtime(path: PathLike) -> Optional[float]:
+    # for directories (e.g. Zarr), only changes of top-level entries are detected
+    if is_url(path):
+        return None
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _get_array_key(array: Array) -> Tuple[Any, ...]:
+    fields = tuple(
+        (name, getattr(array, name))
+        for name in array.__fields__
+        if name not in ("name", "layer", "flat_grouping_groups")
+    )
+    if len(fields) == 0:  # not read from a file
+        fields = (("name", array.name),)
+    return (type(array), *fields)
+
+
+def _get_array_path(array: Array, group_path: str) -> str:
+    # array names may already include the group path, e.g. "file.h5/group/array"
+    return f"{group_path}/{array.name.rsplit('/', maxsplit=1)[-1]}"
+
+
+def _load_detached_array(
+    array_loader_function: hookspecs.ArrayLoaderFunction, array: Array
+) -> Layer:
+    # array loaders only depend on the array's fields (e.g. file paths), so they can
+    # be run on unobserved copies of the arrays in worker threads
+    detached_array = type(array)(
+        **{
+            name: getattr(array, name)
+            for name in array.__fields__
+            if name not in ("layer", "flat_grouping_groups")
+        }
+    )
+    array_loader_function(detached_array)
+    layer = detached_array.layer
+    assert layer is not None
+    detached_array.layer = None
+    return layer
+
+
+def _get_layer_properties(layer: Layer) -> Dict[str, Any]:
+    layer_properties: Dict[str, Any] = {}
+    for name in SESSION_LAYER_PROPERTIES:
+        if hasattr(layer, name):
+            value = getattr(layer, name)
+            if isinstance(value, (list, tuple)):
+                value = [float(v) for v in value]
+            elif not isinstance(value, str):
+                value = float(value)
+            layer_properties[name] = value
+    if isinstance(layer, Image):
+        layer_properties["colormap"] = layer.colormap.name
+    return layer_properties
+
+
+def _set_layer_properties(layer: Layer, layer_properties: Dict[str, Any]) -> None:
+    for name, value in layer_properties.items():
+        try:
+            setattr(layer, name, value)
+        except Exception as e:
+            logger.warning(f"Could not restore {name} of {layer}: {e}")
+
+
 controller = HierarchicalController()
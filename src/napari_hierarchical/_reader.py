@@ -1,24 +1,34 @@
-from napari.viewer import current_viewer
-
 from ._controller import controller
 
 
 def napari_get_reader(path):
-    if isinstance(path, list):
-        if len(path) != 1:
-            return None
-        path = path[0]
-    if controller.can_read_group(path):
+    # multiple paths are passed as a list when opening files as a stack
+    paths = path if isinstance(path, list) else [path]
+    if len(paths) > 0 and all(controller.can_read_group(p) for p in paths):
         return _reader_function
     return None
 
 
 def _reader_function(path):
-    controller.read_group(path)
+    from napari.utils import progress
+    from napari.viewer import current_viewer
+
+    paths = path if isinstance(path, list) else [path]
     viewer = controller.viewer or current_viewer()
     assert viewer is not None
     if controller.viewer != viewer:
         controller.register_viewer(viewer)
+    if len(paths) == 1:
+        # the group tree is populated progressively (if supported by the reader)
+        controller.read_group(paths[0], block=False)
+    else:
+        with progress(total=len(paths), desc="Reading groups") as pbar:
+
+            def update_progress(num_done: int, total: int) -> None:
+                pbar.n = num_done
+                pbar.refresh()
+
+            controller.read_groups(paths, progress=update_progress)
     viewer.window.add_plugin_dock_widget("napari-hierarchical", widget_name="Groups")
     viewer.window.add_plugin_dock_widget("napari-hierarchical", widget_name="Arrays")
     return [(None,)]
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from napari_hierarchical._cli import copy_group, main
+
+h5py = pytest.importorskip("h5py")
+zarr = pytest.importorskip("zarr")
+
+
+def test_convert(tmp_path, capsys):
+    hdf5_file = tmp_path / "test.h5"
+    with h5py.File(hdf5_file, mode="w") as f:
+        f.create_dataset("a", data=np.arange(12).reshape(3, 4), chunks=(2, 2))
+        f.create_group("b").create_dataset("c", data=np.ones((5, 5)))
+    assert main(["convert", str(hdf5_file), "--to", ".zarr", "--workers", "1"]) == 0
+    assert "1/1 files, 2 arrays" in capsys.readouterr().out
+    z = zarr.open(str(tmp_path / "test.zarr"), mode="r")
+    np.testing.assert_array_equal(z["a"][:], np.arange(12).reshape(3, 4))
+    np.testing.assert_array_equal(z["b/c"][:], np.ones((5, 5)))
+
+
+def test_convert_error(tmp_path, capsys):
+    missing_file = tmp_path / "missing.h5"
+    assert main(["convert", str(missing_file), "--to", ".zarr", "--workers", "1"]) == 1
+    assert "0/1 files" in capsys.readouterr().out
+
+
+def test_copy_group_closes_files(tmp_path):
+    hdf5_file = tmp_path / "test.h5"
+    with h5py.File(hdf5_file, mode="w") as f:
+        for i in range(10):
+            f.create_dataset(f"a{i}", data=np.full((4, 4), i, dtype=np.uint8))
+    num_open_files = h5py.h5f.get_obj_count(h5py.h5f.OBJ_ALL, h5py.h5f.OBJ_FILE)
+    result = copy_group(hdf5_file, tmp_path / "copy.h5")
+    assert result.error is None
+    assert result.n_arrays == 10 and result.n_bytes == 160
+    assert h5py.h5f.get_obj_count(h5py.h5f.OBJ_ALL, h5py.h5f.OBJ_FILE) == num_open_files
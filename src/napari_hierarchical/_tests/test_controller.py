@@ -0,0 +1,413 @@
+import json
+
+import numpy as np
+import pytest
+from napari.layers import Image
+
+from napari_hierarchical import HierarchicalController, HierarchicalControllerException
+from napari_hierarchical.contrib import hdf5
+from napari_hierarchical.model import Array
+from napari_hierarchical.utils.parent_aware import move_item
+from napari_hierarchical.utils.path_index import PathIndex
+from napari_hierarchical.utils.statistics import MAX_ATTR, MIN_ATTR, PERCENTILE_ATTRS
+from napari_hierarchical.utils.unload_cache import UnloadCache
+
+h5py = pytest.importorskip("h5py")
+
+
+@pytest.fixture
+def controller():
+    controller = HierarchicalController()
+    controller.pm.register(hdf5, name="napari-hierarchical-hdf5")
+    return controller
+
+
+@pytest.fixture
+def hdf5_file(tmp_path):
+    hdf5_file = tmp_path / "test.h5"
+    with h5py.File(hdf5_file, mode="w") as f:
+        f.create_dataset("a", data=np.arange(12).reshape(3, 4))
+        f.create_group("b").create_dataset("c", data=np.ones((5, 5)))
+    return hdf5_file
+
+
+def test_headless_load_group(controller, hdf5_file):
+    assert controller.viewer is None
+    group = controller.read_group(hdf5_file)
+    controller.load_group(group)
+    assert group.loaded
+    array = group.arrays["test.h5/a"]
+    np.testing.assert_array_equal(array.layer.data, np.arange(12).reshape(3, 4))
+    controller.unload_group(group)
+    assert group.loaded is False
+
+
+def test_path_index(controller, hdf5_file):
+    group = controller.read_group(hdf5_file)
+    path_index = controller.path_index
+    array = path_index.get("test.h5/b/c")
+    assert array is group.children["b"].arrays["test.h5/b/c"]
+    assert [path for path, _ in path_index.find("test.h5/b")] == [
+        "test.h5/b",
+        "test.h5/b/c",
+    ]
+    group.children["b"].name = "renamed"
+    assert path_index.get("test.h5/b/c") is None
+    assert path_index.get("test.h5/renamed/c") is array
+    array.name = "test.h5/renamed/d"
+    assert path_index.get("test.h5/renamed/c") is None
+    assert path_index.get("test.h5/renamed/d") is array
+    group.children.clear()
+    assert "test.h5/renamed/c" not in path_index
+    controller.groups.remove(group)
+    assert len(path_index) == 0
+
+
+def test_path_index_find():
+    path_index = PathIndex()
+    path_index.add([("f.h5/a", 1), ("f.h5/a-b", 2), ("f.h5/a/b", 3), ("f.h5/abc/d", 4)])
+    assert path_index.find("f.h5/a") == [("f.h5/a", 1), ("f.h5/a/b", 3)]
+    assert path_index.find("f.h5/a/") == [("f.h5/a", 1), ("f.h5/a/b", 3)]
+
+
+def test_session(controller, hdf5_file, tmp_path):
+    group = controller.read_group(hdf5_file)
+    controller.load_arrays(group.iter_arrays(recursive=True), max_workers=2)
+    array = group.arrays["test.h5/a"]
+    array.layer.opacity = 0.5
+    array.hide()
+    session_file = tmp_path / "session.json"
+    controller.save_session(session_file)
+    new_controller = HierarchicalController()
+    new_controller.pm.register(hdf5, name="napari-hierarchical-hdf5")
+    (new_group,) = new_controller.restore_session(session_file)
+    assert new_group.loaded
+    new_array = new_group.arrays["test.h5/a"]
+    assert not new_array.visible and new_array.layer.opacity == 0.5
+    np.testing.assert_array_equal(new_array.layer.data, np.arange(12).reshape(3, 4))
+    assert new_group.children["b"].visible
+
+
+def test_session_missing_file(controller, hdf5_file, tmp_path):
+    other_file = tmp_path / "other.h5"
+    other_file.write_bytes(hdf5_file.read_bytes())
+    for path in (other_file, hdf5_file):
+        group = controller.read_group(path)
+        controller.load_group(group)
+    session_file = tmp_path / "session.json"
+    controller.save_session(session_file)
+    other_file.unlink()
+    new_controller = HierarchicalController()
+    new_controller.pm.register(hdf5, name="napari-hierarchical-hdf5")
+    with pytest.raises(HierarchicalControllerException, match="other.h5"):
+        new_controller.restore_session(session_file)
+    (new_group,) = new_controller.groups  # restored despite the missing file
+    assert new_group.name == "test.h5" and new_group.loaded
+
+
+def test_load_arrays_failure_keeps_cached_layers(controller, hdf5_file):
+    group = controller.read_group(hdf5_file)
+    controller.load_group(group)
+    array, other_array = group.iter_arrays(recursive=True)
+    controller.unload_cache.max_bytes = 1024**2
+    controller.unload_array(array)
+    controller.unload_array(other_array)
+    controller.unload_cache.remove([other_array])
+    hdf5_file.unlink()  # other_array cannot be loaded
+    with pytest.raises(HierarchicalControllerException):
+        controller.load_arrays([other_array, array])
+    assert not array.loaded and array in controller.unload_cache
+
+
+def test_move_root_group(controller, hdf5_file, tmp_path):
+    other_file = tmp_path / "other.h5"
+    other_file.write_bytes(hdf5_file.read_bytes())
+    group = controller.read_group(hdf5_file)
+    other_group = controller.read_group(other_file)
+    move_item(controller.groups, 1, group.children, -1)
+    assert group.children[-1] is other_group
+    controller.save_session(tmp_path / "session.json")
+    with (tmp_path / "session.json").open() as f:
+        session = json.load(f)
+    assert [group_session["path"] for group_session in session["groups"]] == [
+        str(hdf5_file)
+    ]
+    with h5py.File(other_file, mode="a") as f:
+        f.create_dataset("g", data=np.zeros((2, 2)))
+    assert controller.refresh_groups() == []
+    move_item(group.children, len(group.children) - 1, controller.groups, -1)
+    assert controller.refresh_groups() == [other_group]
+
+
+def test_load_group_priorities(controller, hdf5_file):
+    group = controller.read_group(hdf5_file)
+    loaded_arrays = []
+    for array in group.iter_arrays(recursive=True):
+        array.events.loaded.connect(lambda event: loaded_arrays.append(event.source))
+    child = group.children["b"]
+    controller.selected_groups.append(child)
+    controller.load_group(group)
+    assert loaded_arrays == [child.arrays["test.h5/b/c"], group.arrays["test.h5/a"]]
+
+
+def test_load_group_updates_priorities_once(controller, tmp_path, monkeypatch):
+    hdf5_file = tmp_path / "many.h5"
+    with h5py.File(hdf5_file, mode="w") as f:
+        for i in range(10):
+            f.create_dataset(f"a{i}", data=np.zeros((2, 2)))
+    group = controller.read_group(hdf5_file)
+    updates = []
+    monkeypatch.setattr(
+        controller._load_queue, "update", lambda items=None: updates.append(items)
+    )
+    controller.load_group(group)
+    assert group.loaded
+    # sibling priorities are updated once per processed slice, not once per array
+    assert updates == [] and len(controller._dirty_load_groups) == 0
+
+
+def test_load_group_with_viewer(controller, hdf5_file, make_napari_viewer):
+    viewer = make_napari_viewer()
+    controller.register_viewer(viewer)
+    group = controller.read_group(hdf5_file)
+    layers_change_events = []
+    viewer.events.layers_change.connect(layers_change_events.append)
+    controller.load_group(group)
+    assert len(layers_change_events) == 1
+    assert [layer.name for layer in viewer.layers] == ["test.h5/a", "test.h5/b/c"]
+    assert viewer.layers.selection.active is viewer.layers[-1]
+    assert viewer.dims.range[-1] == (0.0, 5.0, 1.0)
+    controller.unload_group(group)
+    assert len(viewer.layers) == 0
+
+
+def test_load_arrays_in_slices(controller, hdf5_file, make_napari_viewer, monkeypatch):
+    viewer = make_napari_viewer()
+    controller.register_viewer(viewer)
+    group = controller.read_group(hdf5_file)
+    monkeypatch.setattr("napari_hierarchical._controller.LOAD_QUEUE_INTERVAL", -1)
+    layers_change_events = []
+    viewer.events.layers_change.connect(layers_change_events.append)
+    controller.load_arrays(group.iter_arrays(recursive=True))
+    assert len(layers_change_events) == 2  # one per slice
+    assert [layer.name for layer in viewer.layers] == ["test.h5/a", "test.h5/b/c"]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_write_group_statistics(controller, hdf5_file, tmp_path, stream):
+    group = controller.read_group(hdf5_file)
+    if not stream:
+        controller.load_group(group)
+    out_file = tmp_path / "out.h5"
+    controller.write_group(out_file, group, stream=stream)
+    with h5py.File(out_file) as f:
+        attrs = dict(f["a"].attrs)
+    assert attrs[MIN_ATTR] == 0 and attrs[MAX_ATTR] == 11
+    lower, upper = (attrs[attr] for attr in PERCENTILE_ATTRS)
+    assert 0 < lower < upper < 11
+    out_group = controller.read_group(out_file)
+    controller.load_group(out_group)
+    layer = out_group.arrays["out.h5/a"].layer
+    assert tuple(layer.contrast_limits_range) == (0, 11)
+    assert tuple(layer.contrast_limits) == (lower, upper)
+
+
+def test_write_group_array_reader(controller, hdf5_file, tmp_path):
+    group = controller.read_group(hdf5_file)
+    read_arrays = []
+
+    def read_array(array):
+        read_arrays.append(array.name)
+        return controller.read_array(array)
+
+    out_file = tmp_path / "out.h5"
+    controller.write_group(out_file, group, array_reader=read_array)  # streamed
+    assert sorted(read_arrays) == ["test.h5/a", "test.h5/b/c"]
+    with h5py.File(out_file) as f:
+        np.testing.assert_array_equal(f["a"], np.arange(12).reshape(3, 4))
+
+
+def test_read_hdf5_array_closes_file(hdf5_file):
+    from napari_hierarchical.contrib.hdf5 import read_hdf5_array, read_hdf5_group
+
+    group = read_hdf5_group(hdf5_file)
+    data = read_hdf5_array(group.arrays["test.h5/a"])
+    np.testing.assert_array_equal(data.compute(), np.arange(12).reshape(3, 4))
+    open_types = h5py.h5f.OBJ_FILE | h5py.h5f.OBJ_DATASET
+    assert h5py.h5f.get_obj_count(h5py.h5f.OBJ_ALL, open_types) == 0
+
+
+def test_foreign_statistics_attrs(controller, hdf5_file):
+    with h5py.File(hdf5_file, mode="a") as f:
+        f["a"].attrs.update({"min": "foo", "max": [1, 2]})
+        f["b/c"].attrs.update({MIN_ATTR: "foo", MAX_ATTR: [1, 2]})
+    group = controller.read_group(hdf5_file)
+    controller.load_group(group)
+    assert tuple(group.arrays["test.h5/a"].layer.contrast_limits) == (0, 11)
+
+
+def test_unload_cache(controller, hdf5_file):
+    group = controller.read_group(hdf5_file)
+    controller.load_group(group)
+    array = group.arrays["test.h5/a"]
+    array.layer.gamma = 0.5
+    controller.unload_cache.max_bytes = 1024**2
+    controller.unload_group(group)
+    assert array in controller.unload_cache and controller.unload_cache.nbytes > 0
+    with h5py.File(hdf5_file, mode="r+") as f:
+        f["a"][:] = 0  # reloaded from the cache, i.e. not from the file
+    controller.load_arrays([array])
+    np.testing.assert_array_equal(array.layer.data, np.arange(12).reshape(3, 4))
+    assert array.layer.gamma == 0.5 and array not in controller.unload_cache
+    controller.unload_array(array)
+    controller.unload_cache.max_bytes = 0
+    assert len(controller.unload_cache) == 0
+    controller.load_array(array)
+    np.testing.assert_array_equal(array.layer.data, np.zeros((3, 4)))
+
+
+def test_unload_cache_lazy_data(hdf5_file):
+    from napari_hierarchical.contrib.hdf5 import read_hdf5_array, read_hdf5_group
+
+    group = read_hdf5_group(hdf5_file)
+    array = group.arrays["test.h5/a"]
+    layer = Image(read_hdf5_array(array), name=array.name)
+    assert not UnloadCache(16).put(array, layer)  # exceeds the budget, i.e. not read
+    unload_cache: UnloadCache[Array] = UnloadCache(1024**2)
+    assert unload_cache.put(array, layer)
+    with h5py.File(hdf5_file, mode="r+") as f:
+        f["a"][:] = 0  # read upon unloading, i.e. not from the file
+    cached_layer = unload_cache.pop(array)
+    assert cached_layer is not None and cached_layer.name == array.name
+    np.testing.assert_array_equal(cached_layer.data, np.arange(12).reshape(3, 4))
+
+
+def test_load_hdf5_array_processes(tmp_path):
+    from napari_hierarchical.contrib.hdf5 import load_hdf5_array, read_hdf5_group
+
+    hdf5_file = tmp_path / "compressed.h5"
+    data = np.random.default_rng(0).integers(0, 100, size=(100, 60), dtype=np.uint16)
+    with h5py.File(hdf5_file, mode="w") as f:
+        f.create_dataset("a", data=data, chunks=(16, 16), compression="gzip")
+    group = read_hdf5_group(hdf5_file)
+    array = group.arrays["compressed.h5/a"]
+    load_hdf5_array(array, max_processes=2)
+    np.testing.assert_array_equal(array.layer.data, data)
+
+
+def test_load_hdf5_array_references(tmp_path):
+    pytest.importorskip("fsspec")
+    pytest.importorskip("zarr")
+    from napari_hierarchical.contrib.hdf5 import load_hdf5_array, read_hdf5_group
+
+    hdf5_file = tmp_path / "compressed.h5"
+    data = np.random.default_rng(0).integers(0, 100, size=(100, 60), dtype=np.uint16)
+    with h5py.File(hdf5_file, mode="w") as f:
+        f.create_dataset("a", data=data, chunks=(16, 16), compression="gzip")
+        f.create_dataset("b", data=data, shuffle=True, fletcher32=True)
+        f.create_dataset("c", data=data, chunks=(16, 16), compression="lzf")
+        dcpl = h5py.h5p.create(h5py.h5p.DATASET_CREATE)
+        dcpl.set_layout(h5py.h5d.COMPACT)
+        space = h5py.h5s.create_simple(data[:10, :10].shape)
+        tid = h5py.h5t.py_create(data.dtype)
+        h5py.h5d.create(f.id, b"d", tid, space, dcpl=dcpl)
+        f["d"][:] = data[:10, :10]
+    group = read_hdf5_group(hdf5_file)
+    for array in group.arrays:
+        load_hdf5_array(array, use_references=True)
+        expected_data = data[:10, :10] if array.name == "compressed.h5/d" else data
+        np.testing.assert_array_equal(array.layer.data, expected_data)
+    with open(str(hdf5_file) + ".refs.json") as f:
+        refs = json.load(f)["refs"]
+    assert "a/.zarray" in refs and "b/.zarray" in refs
+    assert "c/.zarray" not in refs  # LZF is not supported (read with h5py)
+    assert "d/.zarray" not in refs  # compact layout (read with h5py)
+
+
+@pytest.mark.parametrize("use_references", [False, True])
+def test_read_remote_hdf5_group(controller, hdf5_file, use_references):
+    fsspec = pytest.importorskip("fsspec")
+    from napari_hierarchical.contrib.hdf5 import load_hdf5_array, read_hdf5_array
+
+    # the in-memory file system stands in for object storage (e.g., s3://)
+    url = f"memory://remote-{use_references}/test.h5"
+    fsspec.filesystem("memory").pipe(url, hdf5_file.read_bytes())
+    group = controller.read_group(url)
+    assert group.name == "test.h5"
+    assert controller.can_write_group("memory://remote/copy.h5", group) is False
+    array = group.children["b"].arrays["test.h5/b/c"]
+    assert array.hdf5_file == url
+    data = read_hdf5_array(array, use_references=use_references)
+    np.testing.assert_array_equal(data.compute(), np.ones((5, 5)))
+    load_hdf5_array(array, use_references=use_references)
+    np.testing.assert_array_equal(array.layer.data, np.ones((5, 5)))
+
+
+def test_read_groups(controller, hdf5_file, tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"test{i}.h5"
+        path.write_bytes(hdf5_file.read_bytes())
+        paths.append(path)
+    invalid_path = tmp_path / "invalid.h5"
+    invalid_path.write_bytes(b"not an HDF5 file")
+    progress = []
+    with pytest.raises(HierarchicalControllerException, match="invalid.h5") as e:
+        controller.read_groups(
+            [paths[0], invalid_path, *paths[1:], invalid_path],
+            max_workers=2,
+            progress=lambda num_done, total: progress.append((num_done, total)),
+        )
+    assert str(e.value).count("invalid.h5") == 2
+    assert [group.name for group in controller.groups] == [p.name for p in paths]
+    assert len(controller.current_arrays) == 6
+    assert progress[0] == (0, 5) and progress[-1] == (5, 5)
+    assert controller.path_index.get("test2.h5/b/c") is not None
+
+
+def test_read_group_stream(controller, hdf5_file, make_napari_viewer, qtbot):
+    viewer = make_napari_viewer()
+    controller.register_viewer(viewer)
+    with h5py.File(hdf5_file, mode="a") as f:
+        f.create_group("d").create_dataset("e", data=np.zeros((2, 2)))
+    group = controller.read_group(hdf5_file, block=False)
+    assert [array.name for array in group.arrays] == ["test.h5/a"]
+    assert len(group.children) == 0
+    controller.selected_groups.append(group)
+    qtbot.waitUntil(lambda: len(group.children) == 2)
+    assert [child.name for child in group.children] == ["b", "d"]
+    assert not group.dirty
+    assert controller.path_index.get("test.h5/d/e") is not None
+    assert list(controller.selected_groups) == [group]
+    assert len(controller.current_arrays) == 3
+
+
+def test_refresh_group(controller, hdf5_file):
+    group = controller.read_group(hdf5_file)
+    array = group.arrays["test.h5/a"]
+    controller.load_array(array)
+    layer = array.layer
+    assert controller.refresh_groups() == []
+    with h5py.File(hdf5_file, mode="a") as f:
+        del f["b/c"]
+        f["b"].create_dataset("d", data=np.zeros((2, 2)))
+        f.create_group("e").create_dataset("f", data=np.zeros((2, 2)))
+    assert controller.refresh_groups() == [group]
+    assert group.arrays["test.h5/a"] is array and array.layer is layer
+    assert [a.name for a in group.children["b"].arrays] == ["test.h5/b/d"]
+    assert [child.name for child in group.children] == ["b", "e"]
+    assert controller.path_index.get("test.h5/b/c") is None
+    assert controller.path_index.get("test.h5/e/f") is not None
+    assert not group.dirty
+    assert not controller.refresh_group(group)
+
+
+def test_watch_files(controller, hdf5_file, make_napari_viewer, qtbot, monkeypatch):
+    monkeypatch.setenv("NAPARI_HIERARCHICAL_WATCH_FILES", "1")
+    viewer = make_napari_viewer()
+    controller.register_viewer(viewer)
+    group = controller.read_group(hdf5_file)
+    with h5py.File(hdf5_file, mode="a") as f:
+        f.create_dataset("g", data=np.zeros((2, 2)))
+    qtbot.waitUntil(lambda: len(group.arrays) == 2, timeout=10000)
+    assert group.arrays[1].name == "test.h5/g"
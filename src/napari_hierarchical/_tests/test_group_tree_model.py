@@ -0,0 +1,51 @@
+import numpy as np
+from napari.layers import Image
+from qtpy.QtCore import QModelIndex, Qt
+
+from napari_hierarchical import HierarchicalController
+from napari_hierarchical.model import Array, Group
+from napari_hierarchical.widgets._group_tree_model import QGroupTreeModel
+
+
+def test_drop_moves_groups(qtbot, qtmodeltester):
+    controller = HierarchicalController()
+    array = Array(name="array")
+    array.flat_grouping_groups["Channel"] = "channel"
+    child = Group.build("child", arrays=[array])
+    source = Group.build("source", children=[child])
+    target = Group.build("target")
+    controller.groups.extend([source, target])
+    layer = Image(np.zeros((2, 2)), name="array")
+    array.layer = layer
+    model = QGroupTreeModel(controller)
+    qtmodeltester.check(model)
+    moved_rows = []
+    removed_rows = []
+    model.rowsMoved.connect(lambda *args: moved_rows.append(args))
+    model.rowsRemoved.connect(lambda *args: removed_rows.append(args))
+    data = model.mimeData([model.create_group_index(child)])
+    target_index = model.create_group_index(target)
+    assert model.dropMimeData(data, Qt.DropAction.MoveAction, -1, -1, target_index)
+    assert len(moved_rows) == 1 and len(removed_rows) == 0
+    assert list(source.children) == [] and target.children[0] is child
+    assert child.parent is target and array.layer is layer
+    assert dict(array.flat_grouping_groups) == {"Channel": "channel"}
+    assert controller.path_index.get("target/child/array") is array
+    visible_values = []
+    target.events.visible.connect(lambda event: visible_values.append(event.value))
+    layer.visible = False
+    assert visible_values == [False]
+    # move to the top level and back again
+    data = model.mimeData([model.create_group_index(child)])
+    assert model.dropMimeData(data, Qt.DropAction.MoveAction, 0, 0, QModelIndex())
+    assert controller.groups[0] is child and child.parent is None
+    assert controller.path_index.get("child/array") is array
+    data = model.mimeData([model.create_group_index(child)])
+    source_index = model.create_group_index(source)
+    assert model.dropMimeData(data, Qt.DropAction.MoveAction, -1, -1, source_index)
+    assert list(controller.groups) == [source, target] and child.parent is source
+    # groups cannot be moved into themselves
+    data = model.mimeData([model.create_group_index(source)])
+    child_index = model.create_group_index(child)
+    assert not model.dropMimeData(data, Qt.DropAction.MoveAction, -1, -1, child_index)
+    qtmodeltester.check(model)
@@ -0,0 +1,63 @@
+import numpy as np
+from napari.utils.transforms import Affine
+
+from napari_hierarchical.contrib.imc._mosaic import (
+    MosaicSource,
+    MosaicSourceCache,
+    create_mosaic,
+)
+
+
+def test_create_mosaic():
+    data = {
+        1: np.full((8, 10), 1, dtype=np.float32),
+        2: np.full((6, 6), 2, dtype=np.float32),
+    }
+    sources = [
+        MosaicSource.create("test.mcd", 1, 1, 0, (8, 10), Affine(scale=(1, 1))),
+        MosaicSource.create(
+            "test.mcd", 1, 2, 0, (6, 6), Affine(scale=(2, 2), translate=(20, 30))
+        ),
+    ]
+    read_sources = []
+
+    def read_source(source: MosaicSource) -> np.ndarray:
+        read_sources.append(source.acquisition_id)
+        return data[source.acquisition_id]
+
+    levels, origin = create_mosaic(sources, read_source, 1, tile_size=16)
+    assert read_sources == []  # lazy
+    assert origin == (-0.5, -0.5)
+    assert [level.shape for level in levels] == [(32, 42), (16, 21), (8, 11)]
+    mosaic = levels[0].compute()
+    assert np.all(mosaic[:8, :10] == 1) and mosaic[8, 10] == 0
+    assert np.all(mosaic[20:31, 30:41] == 2)
+    assert levels[-1][0, 0].compute() == 1
+    assert levels[-1][6, 8].compute() == 2
+    # downsampled levels are derived from the cached sources
+    assert sorted(read_sources) == [1, 2]
+
+
+def test_mosaic_source_cache():
+    data = np.ones((8, 8), dtype=np.float32)  # 256 bytes
+    sources = [
+        MosaicSource.create("test.mcd", 1, i, 0, (8, 8), Affine(scale=(1, 1)))
+        for i in range(3)
+    ]
+    read_sources = []
+
+    def read_source(source: MosaicSource) -> np.ndarray:
+        read_sources.append(source.acquisition_id)
+        return data
+
+    source_cache = MosaicSourceCache(max_bytes=2 * data.nbytes)
+    for source in sources:
+        source_cache.get(source, 1, read_source)
+    assert read_sources == [0, 1, 2]
+    assert source_cache.nbytes == 2 * data.nbytes  # bounded
+    source_cache.get(sources[2], 1, read_source)
+    source_cache.get(sources[2], 2, read_source)  # derived from the cached source
+    assert read_sources == [0, 1, 2]
+    source_cache.get(sources[0], 1, read_source)  # evicted
+    assert read_sources == [0, 1, 2, 0]
+    assert source_cache.nbytes <= source_cache.max_bytes
@@ -0,0 +1,18 @@
+import numpy as np
+import pytest
+from napari.layers import Labels
+
+from napari_hierarchical.utils.labels import create_labels_data
+
+zarr = pytest.importorskip("zarr")
+
+
+def test_create_labels_data():
+    data = create_labels_data((3, 4096, 4096))
+    assert isinstance(data, zarr.Array) and data.dtype == np.uint32
+    assert data.chunks == (1, 1024, 1024) and data.nchunks_initialized == 0
+    layer = Labels(data)
+    layer.paint((1, 2000, 2000), 7)
+    assert data.nchunks_initialized == 1 and data[1, 2000, 2000] == 7
+    layer.paint((1, 2000, 2000), 0)
+    assert data.nchunks_initialized == 0
@@ -0,0 +1,71 @@
+import numpy as np
+from napari.layers import Image
+
+from napari_hierarchical.model import Array, Group
+
+
+def test_array_layer_events():
+    group = Group(name="group")
+    child = Group(name="child")
+    group.children.append(child)
+    array = Array(name="array")
+    child.arrays.append(array)
+    loaded_values = []
+    visible_values = []
+    group.events.loaded.connect(lambda event: loaded_values.append(event.value))
+    group.events.visible.connect(lambda event: visible_values.append(event.value))
+    layer = Image(np.zeros((2, 2)), name="layer")
+    array.layer = layer
+    assert array.name == "layer"
+    assert loaded_values == [True] and visible_values == [True]
+    array.name = "renamed"
+    assert layer.name == "renamed"
+    layer.visible = False
+    assert visible_values == [True, False]
+    array.layer = None
+    assert loaded_values == [True, False]
+    with array.events.blocker_all():
+        array.layer = layer
+    assert loaded_values == [True, False]
+
+
+def test_array_lazy_events():
+    group = Group(name="group")
+    array = Array(name="array")
+    group.arrays.append(array)
+    nested_sources = []
+    group.nested_event.connect(
+        lambda event: nested_sources.append(event.source_event.source)
+    )
+    array.name = "renamed"
+    assert array._events is None  # unobserved
+    assert nested_sources == [array]
+    name_sources = []
+    array.events.name.connect(lambda event: name_sources.append(event.source))
+    array.name = "renamed again"
+    assert name_sources == [array] and nested_sources == [array, array]
+
+
+def test_flat_grouping_groups_events():
+    array = Array(name="array")
+    array.flat_grouping_groups["Channel"] = "channel"
+    added_keys = []
+    array.flat_grouping_groups.events.added.connect(
+        lambda event: added_keys.append(event.key)
+    )
+    array.flat_grouping_groups["Path"] = "path"
+    del array.flat_grouping_groups["Channel"]
+    assert added_keys == ["Path"]
+    assert dict(array.flat_grouping_groups) == {"Path": "path"}
+
+
+def test_build_group():
+    array = Array(name="array")
+    child = Group.build("child", arrays=[array])
+    nested_list_events = []
+    child.nested_list_event.connect(nested_list_events.append)
+    group = Group.build("group", children=[child])
+    assert nested_list_events == []
+    assert array.parent is child and child.parent is group
+    assert list(group.iter_arrays(recursive=True)) == [array]
+    assert not group.dirty
@@ -0,0 +1,46 @@
+import numpy as np
+from napari.components import LayerList
+from napari.layers import Image
+
+from napari_hierarchical.utils.proxy_image import ProxyImage
+
+
+def test_batched_propagation(qtbot):
+    layers = LayerList(
+        [Image(np.zeros((2, 2)) + i, name=f"image{i}") for i in range(3)]
+    )
+    layers.selection = set(layers[:2])
+    proxy = ProxyImage(layers)
+    gamma_values = []
+    layers[0].events.gamma.connect(lambda event: gamma_values.append(layers[0].gamma))
+    for gamma in (0.5, 0.6, 0.7):
+        proxy.gamma = gamma
+    assert gamma_values == [] and layers[1].gamma == 1
+    qtbot.waitUntil(lambda: len(gamma_values) > 0)
+    assert gamma_values == [0.7] and layers[1].gamma == 0.7
+    assert layers[2].gamma == 1
+    # pending changes are applied before the selection changes
+    proxy.opacity = 0.5
+    layers.selection.clear()
+    layers.selection.add(layers[2])
+    assert [layer.opacity for layer in layers] == [0.5, 0.5, 1]
+
+
+def test_single_refresh_per_image(qtbot):
+    layers = LayerList(
+        [Image(np.zeros((2, 2)) + i, name=f"image{i}") for i in range(2)]
+    )
+    layers.selection = set(layers)
+    proxy = ProxyImage(layers)
+    redraws = {layer.name: 0 for layer in layers}
+    for layer in layers:
+        layer.events.thumbnail.connect(
+            lambda event, name=layer.name: redraws.update({name: redraws[name] + 1})
+        )
+    proxy.gamma = 0.5
+    proxy.opacity = 0.5
+    proxy.contrast_limits = (0.2, 0.8)
+    proxy.flush()
+    assert redraws == {"image0": 1, "image1": 1}
+    assert all(layer.gamma == 0.5 and layer.opacity == 0.5 for layer in layers)
+    assert all(tuple(layer.contrast_limits) == (0.2, 0.8) for layer in layers)
@@ -0,0 +1,28 @@
+import dask.array as da
+import numpy as np
+
+from napari_hierarchical.utils.statistics import (
+    MAX_ATTR,
+    MIN_ATTR,
+    PERCENTILE_ATTRS,
+    store_with_statistics,
+)
+
+
+def test_store_with_statistics_reads_chunks_once():
+    read_chunks = []
+
+    def read_chunk(chunk):
+        read_chunks.append(chunk.shape)
+        return chunk
+
+    data = np.arange(64, dtype=np.float64).reshape(8, 8)
+    lazy_data = da.from_array(data, chunks=4).map_blocks(
+        read_chunk, meta=np.empty((0, 0))
+    )
+    target = np.zeros_like(data)
+    statistics = store_with_statistics(lazy_data, target, lock=False)
+    np.testing.assert_array_equal(target, data)
+    assert len(read_chunks) == 4  # including the sampled chunks
+    assert statistics[MIN_ATTR] == 0 and statistics[MAX_ATTR] == 63
+    assert all(attr in statistics for attr in PERCENTILE_ATTRS)
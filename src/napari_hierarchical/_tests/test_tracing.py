@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+from napari_hierarchical.utils import tracing
+from napari_hierarchical.utils.tracing import Tracer
+
+
+@pytest.mark.skipif(tracing.tracer is not None, reason="tracing is enabled")
+def test_traced_disabled():
+    def func():
+        pass
+
+    assert tracing.traced(func) is func
+
+
+def test_write_chrome_trace(tmp_path):
+    tracer = Tracer()
+    with tracer.span("span", arg=1):
+        tracer.begin("nested")
+        tracer.end()
+    tracer.count("counter", 2)
+    tracer.count("counter")
+    tracer.write_chrome_trace(tmp_path / "trace.json")
+    with (tmp_path / "trace.json").open() as f:
+        trace_events = json.load(f)["traceEvents"]
+    assert [trace_event["name"] for trace_event in trace_events] == [
+        "nested",
+        "span",
+        "counter",
+        "counter",
+    ]
+    assert trace_events[1]["ph"] == "X" and trace_events[1]["args"] == {"arg": "1"}
+    assert trace_events[3]["args"] == {"counter": 3}
+    summary = tracer.summarize()
+    assert summary["spans"]["span"]["count"] == 1
+    assert summary["counters"] == {"counter": 3}
@@ -0,0 +1,18 @@
+import numpy as np
+from napari.layers import Image
+
+from napari_hierarchical.utils.viewer import add_layers
+
+
+def test_add_layers(make_napari_viewer):
+    viewer = make_napari_viewer()
+    layers = [Image(np.zeros((4, 4)), name=f"layer{i}") for i in range(3)]
+    add_layers(viewer, layers)
+    assert list(viewer.layers) == layers
+    assert viewer.layers.selection.active is layers[-1]
+    assert viewer.dims.range[-1][1] == 4
+    layers[0].scale = (4, 4)
+    assert viewer.dims.range[-1][1] > 4
+    viewer.layers.remove(layers[0])
+    assert viewer.dims.range[-1][1] == 4
+    assert viewer._on_layers_change not in layers[0].events.scale.callbacks
@@ -1,73 +1,137 @@
 import os
+from functools import partial
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 
 from pluggy import HookimplMarker
 
 from napari_hierarchical.hookspecs import (
     ArrayLoaderFunction,
+    ArrayReaderFunction,
     ArraySaverFunction,
     GroupReaderFunction,
+    GroupStreamReaderFunction,
     GroupWriterFunction,
 )
 from napari_hierarchical.model import Array, Group
+from napari_hierarchical.utils.remote import is_url
 
-from ._reader import load_hdf5_array, read_hdf5_group
-from ._writer import save_hdf5_array, write_hdf5_group
 from .model import HDF5Array
 
-try:
-    import h5py
-except ModuleNotFoundError:
-    h5py = None
-
-
 PathLike = Union[str, os.PathLike]
 
-available = h5py is not None
+# heavy dependencies are only imported once a function is resolved (lazy loading)
+available = find_spec("h5py") is not None
 hookimpl = HookimplMarker("napari-hierarchical")
 
+# number of worker processes for reading/decompressing chunked datasets (0: disabled)
+PROCESSES_ENV_VAR = "NAPARI_HIERARCHICAL_HDF5_PROCESSES"
+# read chunked datasets through a (cached) chunk reference index, requires zarr/fsspec
+REFERENCES_ENV_VAR = "NAPARI_HIERARCHICAL_HDF5_REFERENCES"
+references_available = find_spec("zarr") is not None and find_spec("fsspec") is not None
+
 
 @hookimpl
 def napari_hierarchical_get_group_reader(
     path: PathLike,
 ) -> Optional[GroupReaderFunction]:
     if available and Path(path).suffix.lower() == ".h5":
+        from ._reader import read_hdf5_group
+
         return read_hdf5_group
     return None
 
 
+@hookimpl
+def napari_hierarchical_get_group_stream_reader(
+    path: PathLike,
+) -> Optional[GroupStreamReaderFunction]:
+    if available and Path(path).suffix.lower() == ".h5":
+        from ._reader import stream_hdf5_group
+
+        return stream_hdf5_group
+    return None
+
+
 @hookimpl
 def napari_hierarchical_get_group_writer(
     path: PathLike, group: Group
 ) -> Optional[GroupWriterFunction]:
-    if available and Path(path).suffix.lower() == ".h5":
+    # remote files are read-only (h5py requires seekable, writable files)
+    if available and Path(path).suffix.lower() == ".h5" and not is_url(path):
+        from ._writer import write_hdf5_group
+
         return write_hdf5_group
     return None
 
 
+@hookimpl
+def napari_hierarchical_get_array_reader(array: Array) -> Optional[ArrayReaderFunction]:
+    if available and isinstance(array, HDF5Array):
+        from ._reader import read_hdf5_array
+
+        if references_available and os.environ.get(REFERENCES_ENV_VAR):
+            return partial(read_hdf5_array, use_references=True)
+        return read_hdf5_array
+    return None
+
+
 @hookimpl
 def napari_hierarchical_get_array_loader(array: Array) -> Optional[ArrayLoaderFunction]:
     if available and isinstance(array, HDF5Array):
+        from ._reader import load_hdf5_array
+
+        kwargs: Dict[str, Any] = {}
+        max_processes = int(os.environ.get(PROCESSES_ENV_VAR, "0"))
+        if max_processes > 0:
+            kwargs["max_processes"] = max_processes
+        if references_available and os.environ.get(REFERENCES_ENV_VAR):
+            kwargs["use_references"] = True
+        if len(kwargs) > 0:
+            return partial(load_hdf5_array, **kwargs)
         return load_hdf5_array
     return None
 
 
 @hookimpl
 def napari_hierarchical_get_array_saver(array: Array) -> Optional[ArraySaverFunction]:
-    if available and isinstance(array, HDF5Array):
+    if available and isinstance(array, HDF5Array) and not is_url(array.hdf5_file):
+        from ._writer import save_hdf5_array
+
         return save_hdf5_array
     return None
 
 
+def __getattr__(name: str) -> Any:
+    if name in (
+        "read_hdf5_group",
+        "stream_hdf5_group",
+        "read_hdf5_array",
+        "load_hdf5_array",
+    ):
+        from . import _reader
+
+        return getattr(_reader, name)
+    if name in ("write_hdf5_group", "save_hdf5_array"):
+        from . import _writer
+
+        return getattr(_writer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "available",
     "read_hdf5_group",
+    "stream_hdf5_group",
     "write_hdf5_group",
+    "read_hdf5_array",
     "load_hdf5_array",
     "save_hdf5_array",
     "napari_hierarchical_get_group_reader",
+    "napari_hierarchical_get_group_stream_reader",
     "napari_hierarchical_get_group_writer",
+    "napari_hierarchical_get_array_reader",
     "napari_hierarchical_get_array_loader",
     "napari_hierarchical_get_array_saver",
 ]
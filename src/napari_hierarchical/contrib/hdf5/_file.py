@@ -0,0 +1,19 @@
+import os
+from typing import Union
+
+from napari_hierarchical.utils.remote import is_url, open_remote_file
+
+try:
+    import h5py
+except ModuleNotFoundError:
+    pass
+
+PathLike = Union[str, os.PathLike]
+
+
+def open_hdf5_file(hdf5_file: PathLike) -> "h5py.File":
+    # remote files (fsspec URLs) are read through a block-cached file-like object,
+    # i.e. only the blocks holding the accessed metadata/chunks are fetched
+    if is_url(hdf5_file):
+        return h5py.File(open_remote_file(str(hdf5_file)), mode="r")
+    return h5py.File(hdf5_file, mode="r")
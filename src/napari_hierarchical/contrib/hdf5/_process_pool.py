@@ -0,0 +1,131 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ._file import open_hdf5_file
+
+Selection = Tuple[slice, ...]
+
+TASKS_PER_PROCESS = 4  # smaller tasks balance the load across processes
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_max_workers: Optional[int] = None
+_process_pool_lock = threading.Lock()
+
+
+def read_hdf5_dataset(hdf5_file: str, hdf5_path: str, max_workers: int) -> np.ndarray:
+    # chunks are read and decompressed by worker processes (i.e., not serialized by
+    # the HDF5 library lock) and written to shared memory, which becomes the buffer
+    # of the returned array (no copies, no pickling of decoded data)
+    with open_hdf5_file(hdf5_file) as f:
+        hdf5_dataset = f[hdf5_path]
+        shape = hdf5_dataset.shape
+        dtype = hdf5_dataset.dtype
+        chunks = hdf5_dataset.chunks
+        if chunks is None or len(shape) == 0 or dtype.hasobject:
+            return hdf5_dataset[()]
+    selections = _get_selections(shape, chunks, max_workers * TASKS_PER_PROCESS)
+    size = int(np.prod(shape)) * dtype.itemsize
+    shm = SharedMemory(create=True, size=max(size, 1))
+    try:
+        process_pool = _get_process_pool(max_workers)
+        futures = [
+            process_pool.submit(
+                _read_hdf5_selections,
+                hdf5_file,
+                hdf5_path,
+                shm.name,
+                shape,
+                dtype.str,
+                task_selections,
+            )
+            for task_selections in _split(selections, max_workers * TASKS_PER_PROCESS)
+        ]
+        try:
+            for future in futures:
+                future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+        return _detach_array(shm, shape, dtype)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    global _process_pool, _process_pool_max_workers
+    with _process_pool_lock:
+        if _process_pool is None or _process_pool_max_workers != max_workers:
+            if _process_pool is not None:
+                _process_pool.shutdown(wait=False)
+            # forking a process with running (Qt, dask) threads is unsafe
+            _process_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _process_pool_max_workers = max_workers
+        return _process_pool
+
+
+def _get_selections(
+    shape: Sequence[int], chunks: Sequence[int], num_tasks: int
+) -> List[Selection]:
+    # chunk-aligned slabs along the first axis (split further along the second axis
+    # if there are fewer chunks than tasks along the first axis)
+    selections: List[Selection] = []
+    for start in range(0, shape[0], chunks[0]):
+        stop = min(start + chunks[0], shape[0])
+        if len(shape) > 1 and -(-shape[0] // chunks[0]) < num_tasks:
+            for start2 in range(0, shape[1], chunks[1]):
+                stop2 = min(start2 + chunks[1], shape[1])
+                selections.append((slice(start, stop), slice(start2, stop2)))
+        else:
+            selections.append((slice(start, stop),))
+    return selections
+
+
+def _split(selections: List[Selection], num_tasks: int) -> List[List[Selection]]:
+    num_tasks = min(num_tasks, len(selections))
+    return [selections[i::num_tasks] for i in range(num_tasks)]
+
+
+def _read_hdf5_selections(
+    hdf5_file: str,
+    hdf5_path: str,
+    shm_name: str,
+    shape: Tuple[int, ...],
+    dtype_str: str,
+    selections: Sequence[Selection],
+) -> None:
+    shm = SharedMemory(name=shm_name)
+    if os.name == "posix":  # owned (i.e., unlinked) by the parent process
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore
+    try:
+        data = np.ndarray(shape, dtype=np.dtype(dtype_str), buffer=shm.buf)
+        with open_hdf5_file(hdf5_file) as f:
+            hdf5_dataset = f[hdf5_path]
+            for selection in selections:
+                hdf5_dataset.read_direct(data, source_sel=selection, dest_sel=selection)
+        del data
+    finally:
+        shm.close()
+
+
+def _detach_array(
+    shm: SharedMemory, shape: Tuple[int, ...], dtype: np.dtype
+) -> np.ndarray:
+    # hands the shared memory mapping over to the array, such that the memory remains
+    # mapped for as long as the array (or any view of it) exists after unlinking
+    mmap = shm._mmap  # type: ignore
+    shm._buf.release()  # type: ignore
+    shm._buf = None  # type: ignore
+    shm._mmap = None  # type: ignore
+    count = int(np.prod(shape))
+    return np.frombuffer(mmap, dtype=dtype, count=count).reshape(shape)
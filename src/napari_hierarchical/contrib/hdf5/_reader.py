@@ -1,11 +1,17 @@
 import os
+import sys
 from pathlib import Path
-from typing import Optional, Sequence, Union
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union
 
-from napari.layers import Image
+import numpy as np
 
 from napari_hierarchical.model import Array, Group
+from napari_hierarchical.utils.remote import is_url
+from napari_hierarchical.utils.statistics import create_image
 
+from ._file import open_hdf5_file
+from ._process_pool import read_hdf5_dataset
+from ._references import open_referenced_array
 from .model import HDF5Array
 
 try:
@@ -18,18 +24,92 @@ PathLike = Union[str, os.PathLike]
 
 
 def read_hdf5_group(path: PathLike) -> Group:
-    with h5py.File(path) as f:
+    with open_hdf5_file(path) as f:
         group = _read_hdf5_group(str(path), [], f, name=Path(path).name)
     group.commit()
     return group
 
 
-def load_hdf5_array(array: Array) -> None:
+def stream_hdf5_group(path: PathLike) -> Iterator[Group]:
+    # yields the root group (with its datasets) first, then its subgroups one by one
+    with open_hdf5_file(path) as f:
+        arrays: List[HDF5Array] = []
+        for hdf5_name, hdf5_item in f.items():
+            if isinstance(hdf5_item, h5py.Dataset):
+                arrays.append(_read_hdf5_array(str(path), [hdf5_name], hdf5_item))
+            elif not isinstance(hdf5_item, h5py.Group):
+                raise NotImplementedError()
+        group = Group.build(Path(path).name, arrays=arrays)
+        group.commit()
+        yield group
+        for hdf5_name, hdf5_item in f.items():
+            if isinstance(hdf5_item, h5py.Group):
+                child = _read_hdf5_group(str(path), [hdf5_name], hdf5_item)
+                child.commit()
+                yield child
+
+
+def read_hdf5_array(array: Array, use_references: bool = False) -> "da.Array":
+    # with use_references, chunked datasets are read through a Zarr reference store
+    # (see open_referenced_array), i.e. without the HDF5 library lock
+    if not isinstance(array, HDF5Array):
+        raise TypeError(f"Not an HDF5 array: {array}")
+    if use_references:
+        zarr_array = open_referenced_array(array.hdf5_file, array.hdf5_path)
+        if zarr_array is not None:
+            return da.from_zarr(zarr_array)
+    # the file is opened per chunk read (see _HDF5DatasetReader), i.e. no file handle
+    # outlives the read
+    with open_hdf5_file(array.hdf5_file) as f:
+        hdf5_dataset = f[array.hdf5_path]
+        reader = _HDF5DatasetReader(
+            array.hdf5_file, array.hdf5_path, hdf5_dataset.shape, hdf5_dataset.dtype
+        )
+        chunks = hdf5_dataset.chunks or "auto"
+    return da.from_array(reader, chunks=chunks, meta=np.empty((0,) * reader.ndim))
+
+
+def load_hdf5_array(
+    array: Array, max_processes: int = 0, use_references: bool = False
+) -> None:
+    # with max_processes > 0, chunked datasets are read and decompressed by a pool of
+    # worker processes (see read_hdf5_dataset); referenced datasets take precedence
     if not isinstance(array, HDF5Array):
-        raise ValueError(f"Not an HDF5 array: {array}")
-    with h5py.File(array.hdf5_file) as f:
-        data = da.from_array(f[array.hdf5_path][:])
-    array.layer = Image(name=array.name, data=data)
+        raise TypeError(f"Not an HDF5 array: {array}")
+    with open_hdf5_file(array.hdf5_file) as f:
+        statistics = dict(f[array.hdf5_path].attrs)
+    zarr_array = None
+    if use_references:
+        zarr_array = open_referenced_array(array.hdf5_file, array.hdf5_path)
+    if zarr_array is not None:
+        data = zarr_array[:]
+    elif max_processes > 0:
+        data = read_hdf5_dataset(array.hdf5_file, array.hdf5_path, max_processes)
+    else:
+        with open_hdf5_file(array.hdf5_file) as f:
+            data = f[array.hdf5_path][:]
+    array.layer = create_image(array.name, data, statistics=statistics)
+
+
+class _HDF5DatasetReader:
+    # array-like dataset reference for dask, opening the file upon every read
+    def __init__(
+        self, hdf5_file: str, hdf5_path: str, shape: Tuple[int, ...], dtype: np.dtype
+    ) -> None:
+        self.hdf5_file = hdf5_file
+        self.hdf5_path = hdf5_path
+        self.shape = shape
+        self.dtype = dtype
+        self.ndim = len(shape)
+        # chunks of changed (local) files are not reused from dask caches
+        self._mtime = None if is_url(hdf5_file) else os.stat(hdf5_file).st_mtime
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        with open_hdf5_file(self.hdf5_file) as f:
+            return f[self.hdf5_path][key]
+
+    def __dask_tokenize__(self) -> Any:
+        return (type(self).__name__, self.hdf5_file, self.hdf5_path, self._mtime)
 
 
 def _read_hdf5_group(
@@ -40,17 +120,18 @@ def _read_hdf5_group(
 ) -> Group:
     if name is None:
         name = Path(hdf5_group.name).name
-    group = Group(name=name)
+    arrays: List[HDF5Array] = []
+    children: List[Group] = []
     for hdf5_name, hdf5_item in hdf5_group.items():
         if isinstance(hdf5_item, h5py.Group):
             child = _read_hdf5_group(hdf5_file, [*hdf5_names, hdf5_name], hdf5_item)
-            group.children.append(child)
+            children.append(child)
         elif isinstance(hdf5_item, h5py.Dataset):
             array = _read_hdf5_array(hdf5_file, [*hdf5_names, hdf5_name], hdf5_item)
-            group.arrays.append(array)
+            arrays.append(array)
         else:
             raise NotImplementedError()
-    return group
+    return Group.build(name, arrays=arrays, children=children)
 
 
 def _read_hdf5_array(
@@ -60,7 +141,7 @@ def _read_hdf5_array(
     hdf5_path = "/".join(hdf5_names)
     name = f"{Path(hdf5_file).name}/{hdf5_path}"
     array = HDF5Array(name=name, hdf5_file=hdf5_file, hdf5_path=hdf5_path)
-    array.flat_grouping_groups["Path"] = (
+    array.flat_grouping_groups["Path"] = sys.intern(
         "/*" * (len(hdf5_names) - 1) + "/" + hdf5_names[-1]
     )
     return array
@@ -0,0 +1,192 @@
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from napari_hierarchical.utils.remote import is_url
+
+from ._file import open_hdf5_file
+
+try:
+    import fsspec
+    import h5py
+    import zarr
+except ModuleNotFoundError:
+    pass
+
+# kerchunk-style (version 1) reference index, cached beside the HDF5 file
+REFERENCES_SUFFIX = ".refs.json"
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, os.PathLike]
+
+_references_cache: Dict[str, Tuple[Any, Any]] = {}  # file -> (mtime/key, mapper)
+_references_lock = threading.Lock()
+
+
+def open_referenced_array(hdf5_file: str, hdf5_path: str) -> Optional["zarr.Array"]:
+    # returns a Zarr array that reads the dataset's chunks by byte ranges (i.e.,
+    # without the HDF5 library), or None if the dataset is not referenced (e.g.
+    # unsupported filters)
+    mapper = _get_references_mapper(hdf5_file)
+    if f"{hdf5_path}/.zarray" not in mapper:
+        return None
+    return zarr.open_array(store=mapper, path=hdf5_path, mode="r")
+
+
+def build_references(hdf5_file: PathLike) -> Dict[str, Any]:
+    refs: Dict[str, Any] = {".zgroup": json.dumps({"zarr_format": 2})}
+
+    def visit(name: str, obj: Any) -> None:
+        if isinstance(obj, h5py.Group):
+            refs[f"{name}/.zgroup"] = json.dumps({"zarr_format": 2})
+        elif isinstance(obj, h5py.Dataset):
+            dataset_refs = _get_dataset_references(name, obj)
+            if dataset_refs is not None:
+                refs.update(dataset_refs)
+
+    with open_hdf5_file(hdf5_file) as f:
+        f.visititems(visit)
+    # the file URL is templated, i.e. the index remains valid when moving files
+    return {"version": 1, "templates": {"u": ""}, "refs": refs}
+
+
+def _get_references_mapper(hdf5_file: str) -> Any:
+    # reference indices of remote files are not persisted (i.e., rebuilt per session)
+    remote = is_url(hdf5_file)
+    if remote:
+        fs, fs_path = fsspec.core.url_to_fs(hdf5_file)
+        key: Any = fs.ukey(fs_path)
+    else:
+        key = os.stat(hdf5_file).st_mtime
+    with _references_lock:
+        cached = _references_cache.get(hdf5_file)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        references = None if remote else _load_references(hdf5_file, key)
+        if references is None:
+            references = build_references(hdf5_file)
+            if not remote:
+                _save_references(hdf5_file, references)
+        if remote:
+            references["templates"]["u"] = hdf5_file
+        else:
+            references["templates"]["u"] = str(Path(hdf5_file).absolute())
+        fs = fsspec.filesystem("reference", fo=references)
+        mapper = fs.get_mapper("")
+        _references_cache[hdf5_file] = (key, mapper)
+        return mapper
+
+
+def _load_references(hdf5_file: str, mtime: float) -> Optional[Dict[str, Any]]:
+    references_file = Path(hdf5_file + REFERENCES_SUFFIX)
+    try:
+        if references_file.stat().st_mtime >= mtime:
+            with references_file.open() as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _save_references(hdf5_file: str, references: Dict[str, Any]) -> None:
+    references_file = Path(hdf5_file + REFERENCES_SUFFIX)
+    try:
+        with references_file.open("w") as f:
+            json.dump(references, f)
+    except OSError as e:  # e.g. read-only file system
+        logger.warning(f"Could not save reference index {references_file}: {e}")
+
+
+def _get_dataset_references(
+    name: str, hdf5_dataset: "h5py.Dataset"
+) -> Optional[Dict[str, Any]]:
+    shape = hdf5_dataset.shape
+    dtype = hdf5_dataset.dtype
+    if shape is None or len(shape) == 0 or dtype.kind not in "biuf":
+        return None
+    filters = _get_filters(hdf5_dataset)
+    if filters is None:
+        return None
+    dsid = hdf5_dataset.id
+    plist = dsid.get_create_plist()
+    layout = plist.get_layout()
+    # compact datasets are stored in the object header, external/virtual datasets in
+    # other files, i.e. they cannot be referenced by byte ranges of this file
+    if layout == h5py.h5d.CONTIGUOUS:
+        if plist.get_external_count() > 0:
+            return None
+    elif layout != h5py.h5d.CHUNKED:
+        return None
+    refs: Dict[str, Any] = {}
+    if hdf5_dataset.chunks is None:
+        chunks: Tuple[int, ...] = shape
+        offset = dsid.get_offset()
+        if offset is not None:  # allocated
+            key = ".".join(["0"] * len(shape))
+            refs[f"{name}/{key}"] = ["{{u}}", offset, dsid.get_storage_size()]
+    else:
+        chunks = hdf5_dataset.chunks
+        for chunk_info in _get_chunk_infos(dsid):
+            if chunk_info.filter_mask != 0:  # chunks with partially applied filters
+                return None
+            key = ".".join(str(o // c) for o, c in zip(chunk_info.chunk_offset, chunks))
+            refs[f"{name}/{key}"] = ["{{u}}", chunk_info.byte_offset, chunk_info.size]
+    refs[f"{name}/.zarray"] = json.dumps(
+        {
+            "zarr_format": 2,
+            "shape": list(shape),
+            "chunks": list(chunks),
+            "dtype": dtype.str,
+            "compressor": None,
+            "filters": filters or None,
+            "fill_value": _get_fill_value(hdf5_dataset),
+            "order": "C",
+        }
+    )
+    return refs
+
+
+def _get_chunk_infos(dsid: "h5py.h5d.DatasetID") -> List[Any]:
+    # chunk_iter (HDF5 >= 1.12.3) visits all chunks in a single pass; otherwise, chunks
+    # are looked up by index (i.e., slower for many chunks)
+    if hasattr(dsid, "chunk_iter"):
+        chunk_infos: List[Any] = []
+        dsid.chunk_iter(chunk_infos.append)
+        return chunk_infos
+    return [dsid.get_chunk_info(i) for i in range(dsid.get_num_chunks())]
+
+
+def _get_filters(hdf5_dataset: "h5py.Dataset") -> Optional[List[Dict[str, Any]]]:
+    # HDF5 filter pipeline (in encoding order) as numcodecs configurations; Zarr
+    # decodes filters in reverse order
+    plist = hdf5_dataset.id.get_create_plist()
+    filters: List[Dict[str, Any]] = []
+    for i in range(plist.get_nfilters()):
+        filter_id, _, filter_options, _ = plist.get_filter(i)
+        if filter_id == h5py.h5z.FILTER_DEFLATE:
+            level = filter_options[0] if len(filter_options) > 0 else 4
+            filters.append({"id": "zlib", "level": int(level)})
+        elif filter_id == h5py.h5z.FILTER_SHUFFLE:
+            filters.append(
+                {"id": "shuffle", "elementsize": hdf5_dataset.dtype.itemsize}
+            )
+        elif filter_id == h5py.h5z.FILTER_FLETCHER32:
+            filters.append({"id": "fletcher32"})
+        else:  # e.g. LZF, scale-offset, plugins
+            return None
+    return filters
+
+
+def _get_fill_value(hdf5_dataset: "h5py.Dataset") -> Any:
+    fill_value = np.asarray(hdf5_dataset.fillvalue).item()
+    if isinstance(fill_value, float) and not np.isfinite(fill_value):
+        if np.isnan(fill_value):
+            return "NaN"
+        return "Infinity" if fill_value > 0 else "-Infinity"
+    return fill_value
@@ -1,12 +1,18 @@
 import os
 from pathlib import Path
-from typing import Union
+from typing import Any, Optional, Union
 
+from napari_hierarchical.hookspecs import ArrayReaderFunction
 from napari_hierarchical.model import Array, Group
+from napari_hierarchical.utils.statistics import (
+    compute_statistics,
+    store_with_statistics,
+)
 
 from .model import HDF5Array
 
 try:
+    import dask.array as da
     import h5py
 except ModuleNotFoundError:
     pass
@@ -14,29 +20,54 @@ except ModuleNotFoundError:
 PathLike = Union[str, os.PathLike]
 
 
-def write_hdf5_group(path: PathLike, group: Group) -> None:
+def write_hdf5_group(
+    path: PathLike, group: Group, array_reader: Optional[ArrayReaderFunction] = None
+) -> None:
     if group.parent is not None:
         raise ValueError(f"Not a root group: {group}")
-    if not group.loaded:
+    if array_reader is None and not group.loaded:
         raise ValueError(f"Group is not loaded: {group}")
     with h5py.File(path, mode="w") as f:
-        _write_hdf5_group(group, f)
+        _write_hdf5_group(group, f, array_reader)
 
 
 def save_hdf5_array(array: Array) -> None:
     if not isinstance(array, HDF5Array):
-        raise ValueError(f"Not an HDF5 array: {array}")
+        raise TypeError(f"Not an HDF5 array: {array}")
     if not array.loaded:
         raise ValueError(f"Array is not loaded: {array}")
     assert array.layer is not None
     with h5py.File(array.hdf5_file, mode="r+") as f:
-        f[array.hdf5_path][:] = array.layer.data
+        hdf5_dataset = f[array.hdf5_path]
+        hdf5_dataset[:] = array.layer.data
+        hdf5_dataset.attrs.update(compute_statistics(array.layer.data))
 
 
-def _write_hdf5_group(group: Group, hdf5_group: "h5py.Group") -> None:
+def _write_hdf5_group(
+    group: Group,
+    hdf5_group: "h5py.Group",
+    array_reader: Optional[ArrayReaderFunction],
+) -> None:
     for array in group.arrays:
-        assert array.layer is not None
-        hdf5_group.create_dataset(name=Path(array.name).name, data=array.layer.data)
+        if array.layer is not None:
+            data = array.layer.data
+        else:
+            assert array_reader is not None
+            data = array_reader(array)
+        _write_hdf5_dataset(hdf5_group, Path(array.name).name, data)
     for child in group.children:
         g = hdf5_group.create_group(name=child.name)
-        _write_hdf5_group(child, g)
+        _write_hdf5_group(child, g, array_reader)
+
+
+def _write_hdf5_dataset(hdf5_group: "h5py.Group", name: str, data: Any) -> None:
+    if isinstance(data, da.Array):
+        # stream chunk by chunk instead of materializing the whole array
+        hdf5_dataset = hdf5_group.create_dataset(
+            name=name, shape=data.shape, dtype=data.dtype
+        )
+        statistics = store_with_statistics(data, hdf5_dataset, lock=True)
+    else:
+        hdf5_dataset = hdf5_group.create_dataset(name=name, data=data)
+        statistics = compute_statistics(data)
+    hdf5_dataset.attrs.update(statistics)
@@ -1,6 +1,8 @@
+from pydantic import Field
+
 from napari_hierarchical.model import Array
 
 
 class HDF5Array(Array):
-    hdf5_file: str
-    hdf5_path: str
+    hdf5_file: str = Field(allow_mutation=False)
+    hdf5_path: str = Field(allow_mutation=False)
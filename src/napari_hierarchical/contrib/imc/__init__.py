@@ -1,50 +1,139 @@
 import os
+from functools import partial
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 from pluggy import HookimplMarker
 
-from napari_hierarchical.contrib.imc.model import IMCAcquisitionArray, IMCPanoramaArray
-from napari_hierarchical.hookspecs import ArrayLoaderFunction, GroupReaderFunction
+from napari_hierarchical.contrib.imc.model import (
+    IMCAcquisitionArray,
+    IMCMultichannelAcquisitionArray,
+    IMCPanoramaArray,
+    IMCSlideMosaicArray,
+)
+from napari_hierarchical.hookspecs import (
+    ArrayLoaderFunction,
+    ArrayReaderFunction,
+    GroupReaderFunction,
+    GroupStreamReaderFunction,
+)
 from napari_hierarchical.model import Array
 
-from ._reader import load_imc_acquisition_array, load_imc_panorama_array, read_imc_group
-
-try:
-    import readimc
-except ModuleNotFoundError:
-    readimc = None
-
-
 PathLike = Union[str, os.PathLike]
 
-available = readimc is not None
+# heavy dependencies are only imported once a function is resolved (lazy loading)
+available = find_spec("readimc") is not None
 hookimpl = HookimplMarker("napari-hierarchical")
 
+# load all channels of an acquisition from a single array split into one layer per
+# channel (napari's channel_axis), instead of reading each channel array separately
+MULTICHANNEL_ENV_VAR = "NAPARI_HIERARCHICAL_IMC_MULTICHANNEL"
+# add per-channel mosaics compositing all acquisitions of a slide into a single layer
+MOSAIC_ENV_VAR = "NAPARI_HIERARCHICAL_IMC_MOSAIC"
+# size of the mosaic source cache (in MB) shared by all slide mosaics (default: 256)
+MOSAIC_CACHE_ENV_VAR = "NAPARI_HIERARCHICAL_IMC_MOSAIC_CACHE_MB"
+
 
 @hookimpl
 def napari_hierarchical_get_group_reader(
     path: PathLike,
 ) -> Optional[GroupReaderFunction]:
     if available and Path(path).suffix.lower() == ".mcd":
+        from ._reader import read_imc_group
+
+        multichannel = bool(os.environ.get(MULTICHANNEL_ENV_VAR))
+        mosaic = bool(os.environ.get(MOSAIC_ENV_VAR))
+        if multichannel or mosaic:
+            return partial(read_imc_group, multichannel=multichannel, mosaic=mosaic)
         return read_imc_group
     return None
 
 
+@hookimpl
+def napari_hierarchical_get_group_stream_reader(
+    path: PathLike,
+) -> Optional[GroupStreamReaderFunction]:
+    if available and Path(path).suffix.lower() == ".mcd":
+        from ._reader import stream_imc_group
+
+        multichannel = bool(os.environ.get(MULTICHANNEL_ENV_VAR))
+        mosaic = bool(os.environ.get(MOSAIC_ENV_VAR))
+        if multichannel or mosaic:
+            return partial(stream_imc_group, multichannel=multichannel, mosaic=mosaic)
+        return stream_imc_group
+    return None
+
+
+@hookimpl
+def napari_hierarchical_get_array_reader(array: Array) -> Optional[ArrayReaderFunction]:
+    if available and isinstance(array, IMCPanoramaArray):
+        from ._reader import read_imc_panorama_array
+
+        return read_imc_panorama_array
+    if available and isinstance(array, IMCAcquisitionArray):
+        from ._reader import read_imc_acquisition_array
+
+        return read_imc_acquisition_array
+    if available and isinstance(array, IMCSlideMosaicArray):
+        from ._reader import read_imc_slide_mosaic_array
+
+        return read_imc_slide_mosaic_array
+    return None
+
+
 @hookimpl
 def napari_hierarchical_get_array_loader(array: Array) -> Optional[ArrayLoaderFunction]:
     if available and isinstance(array, IMCPanoramaArray):
+        from ._reader import load_imc_panorama_array
+
         return load_imc_panorama_array
+    if available and isinstance(array, IMCMultichannelAcquisitionArray):
+        from ._reader import load_imc_multichannel_acquisition_array
+
+        return load_imc_multichannel_acquisition_array
     if available and isinstance(array, IMCAcquisitionArray):
+        from ._reader import load_imc_acquisition_array
+
         return load_imc_acquisition_array
+    if available and isinstance(array, IMCSlideMosaicArray):
+        from ._reader import load_imc_slide_mosaic_array
+
+        return load_imc_slide_mosaic_array
     return None
 
 
+def __getattr__(name: str) -> Any:
+    if name in (
+        "read_imc_group",
+        "stream_imc_group",
+        "read_imc_panorama_array",
+        "read_imc_acquisition_array",
+        "read_imc_slide_mosaic_array",
+        "load_imc_panorama_array",
+        "load_imc_acquisition_array",
+        "load_imc_multichannel_acquisition_array",
+        "load_imc_slide_mosaic_array",
+    ):
+        from . import _reader
+
+        return getattr(_reader, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "available",
     "read_imc_group",
+    "stream_imc_group",
+    "read_imc_panorama_array",
+    "read_imc_acquisition_array",
+    "read_imc_slide_mosaic_array",
     "load_imc_panorama_array",
     "load_imc_acquisition_array",
+    "load_imc_multichannel_acquisition_array",
+    "load_imc_slide_mosaic_array",
     "napari_hierarchical_get_group_reader",
+    "napari_hierarchical_get_group_stream_reader",
+    "napari_hierarchical_get_array_reader",
     "napari_hierarchical_get_array_loader",
 ]
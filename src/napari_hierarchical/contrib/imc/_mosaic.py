@@ -0,0 +1,239 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from napari.utils.transforms import Affine
+
+try:
+    import dask.array as da
+except ModuleNotFoundError:
+    pass
+
+MOSAIC_TILE_SIZE = 512
+MOSAIC_CACHE_SIZE = 256 * 1024**2  # bytes
+
+
+class MosaicSource(NamedTuple):
+    mcd_file: str
+    slide_id: int
+    acquisition_id: int
+    channel_index: int
+    shape: Tuple[int, int]
+    # slide (world) coordinates -> data coordinates (hashable affine matrix)
+    inverse_matrix: Tuple[Tuple[float, ...], ...]
+    extent: Tuple[float, float, float, float]  # (min_y, min_x, max_y, max_x)
+    # modification time of the MCD file, i.e. cached data of changed files is not used
+    mtime: Optional[float] = None
+
+    @classmethod
+    def create(
+        cls,
+        mcd_file: str,
+        slide_id: int,
+        acquisition_id: int,
+        channel_index: int,
+        shape: Tuple[int, int],
+        transform: Affine,
+        mtime: Optional[float] = None,
+    ) -> "MosaicSource":
+        corners = np.array(
+            [
+                [-0.5, -0.5],
+                [-0.5, shape[1] - 0.5],
+                [shape[0] - 0.5, -0.5],
+                [shape[0] - 0.5, shape[1] - 0.5],
+            ]
+        )
+        world_corners = transform(corners)
+        min_y, min_x = np.amin(world_corners, axis=0)
+        max_y, max_x = np.amax(world_corners, axis=0)
+        return cls(
+            mcd_file=mcd_file,
+            slide_id=slide_id,
+            acquisition_id=acquisition_id,
+            channel_index=channel_index,
+            shape=shape,
+            inverse_matrix=tuple(map(tuple, transform.inverse.affine_matrix.tolist())),
+            extent=(float(min_y), float(min_x), float(max_y), float(max_x)),
+            mtime=mtime,
+        )
+
+
+def create_mosaic(
+    sources: Sequence[MosaicSource],
+    read_source: Callable[[MosaicSource], np.ndarray],
+    pixel_size: float,
+    tile_size: int = MOSAIC_TILE_SIZE,
+    source_cache: Optional["MosaicSourceCache"] = None,
+) -> Tuple[List["da.Array"], Tuple[float, float]]:
+    # returns the levels of a lazily tiled, multiscale canvas in slide coordinates
+    # (pixel size of level k: pixel_size * 2**k) and the slide coordinates of the
+    # first pixel; tiles are rendered on the fly (nearest neighbor) from the sources,
+    # which are retained in the (bounded, possibly shared) source cache
+    if len(sources) == 0:
+        raise ValueError("No mosaic sources")
+    if source_cache is None:
+        source_cache = MosaicSourceCache()
+    min_y = min(source.extent[0] for source in sources)
+    min_x = min(source.extent[1] for source in sources)
+    max_y = max(source.extent[2] for source in sources)
+    max_x = max(source.extent[3] for source in sources)
+    origin = (min_y, min_x)
+    shape = (
+        int(np.ceil((max_y - min_y) / pixel_size)),
+        int(np.ceil((max_x - min_x) / pixel_size)),
+    )
+    levels: List["da.Array"] = []
+    downsample = 1
+    while True:
+        level_shape = tuple(int(np.ceil(n / downsample)) for n in shape)
+        level = da.zeros(level_shape, dtype=np.float32, chunks=tile_size).map_blocks(
+            _render_tile,
+            sources=sources,
+            read_source=read_source,
+            source_cache=source_cache,
+            origin=origin,
+            pixel_size=pixel_size,
+            downsample=downsample,
+            dtype=np.float32,
+        )
+        levels.append(level)
+        if max(level_shape) <= tile_size:
+            break
+        downsample *= 2
+    return levels, origin
+
+
+class MosaicSourceCache:
+    # source data per level (downsampled by nearest neighbor), with up to max_bytes
+    # in total; least recently used entries are evicted first, and sources are
+    # downsampled from cached data of finer levels if available
+    def __init__(self, max_bytes: int = MOSAIC_CACHE_SIZE) -> None:
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[MosaicSource, int], np.ndarray]" = (
+            OrderedDict()
+        )
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        # per-source locks (with reference counts), i.e. different sources are read
+        # concurrently, but each source is only read/downsampled once
+        self._source_locks: Dict[MosaicSource, Tuple[threading.Lock, int]] = {}
+
+    def get(
+        self,
+        source: MosaicSource,
+        downsample: int,
+        read_source: Callable[[MosaicSource], np.ndarray],
+    ) -> np.ndarray:
+        data = self._get_cached(source, downsample)
+        if data is not None:
+            return data
+        source_lock = self._acquire_source_lock(source)
+        try:
+            with source_lock:
+                data = self._get_cached(source, downsample)
+                if data is not None:
+                    return data
+                base_downsample = downsample // 2
+                base_data = None
+                while base_downsample >= 1 and base_data is None:
+                    base_data = self._get_cached(source, base_downsample)
+                    if base_data is None:
+                        base_downsample //= 2
+                if base_data is None:
+                    base_downsample = 1
+                    base_data = read_source(source)
+                step = downsample // base_downsample
+                data = np.ascontiguousarray(base_data[::step, ::step])
+                self._put(source, downsample, data)
+                return data
+        finally:
+            self._release_source_lock(source)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def _get_cached(
+        self, source: MosaicSource, downsample: int
+    ) -> Optional[np.ndarray]:
+        with self._lock:
+            data = self._entries.get((source, downsample))
+            if data is not None:
+                self._entries.move_to_end((source, downsample))
+            return data
+
+    def _put(self, source: MosaicSource, downsample: int, data: np.ndarray) -> None:
+        with self._lock:
+            if data.nbytes > self._max_bytes:
+                return
+            old_data = self._entries.pop((source, downsample), None)
+            if old_data is not None:
+                self._nbytes -= old_data.nbytes
+            self._entries[(source, downsample)] = data
+            self._nbytes += data.nbytes
+            while self._nbytes > self._max_bytes:
+                _, evicted_data = self._entries.popitem(last=False)
+                self._nbytes -= evicted_data.nbytes
+
+    def _acquire_source_lock(self, source: MosaicSource) -> threading.Lock:
+        with self._lock:
+            source_lock, count = self._source_locks.get(source, (threading.Lock(), 0))
+            self._source_locks[source] = (source_lock, count + 1)
+            return source_lock
+
+    def _release_source_lock(self, source: MosaicSource) -> None:
+        with self._lock:
+            source_lock, count = self._source_locks[source]
+            if count > 1:
+                self._source_locks[source] = (source_lock, count - 1)
+            else:
+                del self._source_locks[source]
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+
+def _render_tile(
+    block: np.ndarray,
+    sources: Sequence[MosaicSource],
+    read_source: Callable[[MosaicSource], np.ndarray],
+    source_cache: MosaicSourceCache,
+    origin: Tuple[float, float],
+    pixel_size: float,
+    downsample: int,
+    block_info: Optional[dict] = None,
+) -> np.ndarray:
+    assert block_info is not None
+    (start_y, stop_y), (start_x, stop_x) = block_info[0]["array-location"]
+    ys = origin[0] + np.arange(start_y, stop_y) * pixel_size * downsample
+    xs = origin[1] + np.arange(start_x, stop_x) * pixel_size * downsample
+    tile = np.zeros(block.shape, dtype=np.float32)
+    for source in sources:
+        min_y, min_x, max_y, max_x = source.extent
+        if ys[0] > max_y or ys[-1] < min_y or xs[0] > max_x or xs[-1] < min_x:
+            continue
+        world_y, world_x = np.meshgrid(ys, xs, indexing="ij")
+        m = source.inverse_matrix
+        # nearest pixels of the source, downsampled by the level's factor
+        rows = np.rint(
+            (m[0][0] * world_y + m[0][1] * world_x + m[0][2]) / downsample
+        ).astype(int)
+        cols = np.rint(
+            (m[1][0] * world_y + m[1][1] * world_x + m[1][2]) / downsample
+        ).astype(int)
+        source_shape = tuple(-(-n // downsample) for n in source.shape)
+        mask = (rows >= 0) & (rows < source_shape[0])
+        mask &= (cols >= 0) & (cols < source_shape[1])
+        if np.any(mask):
+            # later sources (acquisitions) are drawn on top of earlier ones
+            data = source_cache.get(source, downsample, read_source)
+            tile[mask] = data[rows[mask], cols[mask]]
+    return tile
@@ -1,69 +1,123 @@
 import os
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple, Union
 
 import numpy as np
 from napari.layers import Image
+from napari.layers.utils.stack_utils import split_channels
+from napari.utils.transforms import Affine
 
 from napari_hierarchical.model import Array, Group
+from napari_hierarchical.utils.statistics import create_image
 
-from .model import IMCAcquisitionArray, IMCPanoramaArray
+from . import MOSAIC_CACHE_ENV_VAR
+from ._mosaic import MosaicSource, MosaicSourceCache, create_mosaic
+from .model import (
+    IMCAcquisitionArray,
+    IMCArray,
+    IMCMultichannelAcquisitionArray,
+    IMCPanoramaArray,
+    IMCSlideMosaicArray,
+)
+
+if TYPE_CHECKING:
+    from napari.types import FullLayerData
 
 try:
+    import dask
     import dask.array as da
     from readimc import MCDFile
+    from readimc.data import Acquisition, Slide
 except ModuleNotFoundError:
     pass
 
 PathLike = Union[str, os.PathLike]
 
+# number of acquisitions whose (lazy) channel layer data are cached, see multichannel
+ACQUISITION_CACHE_SIZE = 16
+
+# (downsampled) mosaic sources of all slide mosaics, bounded in size
+_mosaic_source_cache = MosaicSourceCache(
+    int(float(os.environ.get(MOSAIC_CACHE_ENV_VAR, "256")) * 1024**2)
+)
+
 
-def read_imc_group(path: PathLike) -> Group:
-    group = Group(name=Path(path).name)
+def read_imc_group(
+    path: PathLike, multichannel: bool = False, mosaic: bool = False
+) -> Group:
+    name = Path(path).name
     with MCDFile(path) as f:
-        for slide in f.slides:
-            slide_group = Group(name=f"[S{slide.id:02d}] {slide.description}")
-            panoramas_group = Group(name="Panoramas")
-            for panorama in slide.panoramas:
-                panorama_group = Group(
-                    name=f"[P{panorama.id:02d}] {panorama.description}"
-                )
-                panorama_array = IMCPanoramaArray(
-                    name=f"{group.name} [S{slide.id:02d} P{panorama.id:02d}]",
-                    mcd_file=str(path),
-                    slide_id=slide.id,
-                    panorama_id=panorama.id,
-                )
-                panorama_group.arrays.append(panorama_array)
-                panoramas_group.children.append(panorama_group)
-            slide_group.children.append(panoramas_group)
-            acquisitions_group = Group(name="Acquisitions")
-            for acquisition in slide.acquisitions:
-                acquisition_group = Group(
-                    name=f"[A{acquisition.id:02d}] {acquisition.description}"
-                )
-                for channel_index, (channel_name, channel_label) in enumerate(
-                    zip(acquisition.channel_names, acquisition.channel_labels)
-                ):
-                    acquisition_array = IMCAcquisitionArray(
-                        name=f"{group.name} "
-                        f"[S{slide.id:02d} A{acquisition.id:02d} C{channel_index:02d}]",
-                        mcd_file=str(path),
-                        slide_id=slide.id,
-                        acquisition_id=acquisition.id,
-                        channel_index=channel_index,
-                    )
-                    acquisition_array.flat_grouping_groups[
-                        "Channel"
-                    ] = f"[C{channel_index:02d}] {channel_name} {channel_label}"
-                    acquisition_group.arrays.append(acquisition_array)
-                acquisitions_group.children.append(acquisition_group)
-            slide_group.children.append(acquisitions_group)
-            group.children.append(slide_group)
+        slide_groups = [
+            _read_imc_slide_group(
+                name, str(path), slide, multichannel=multichannel, mosaic=mosaic
+            )
+            for slide in f.slides
+        ]
+    group = Group.build(name, children=slide_groups)
     group.commit()
     return group
 
 
+def stream_imc_group(
+    path: PathLike, multichannel: bool = False, mosaic: bool = False
+) -> Iterator[Group]:
+    # yields the (empty) root group first, then the slide groups one by one; note that
+    # readimc parses the metadata of all slides when opening the file
+    name = Path(path).name
+    with MCDFile(path) as f:
+        group = Group.build(name)
+        group.commit()
+        yield group
+        for slide in f.slides:
+            slide_group = _read_imc_slide_group(
+                name, str(path), slide, multichannel=multichannel, mosaic=mosaic
+            )
+            slide_group.commit()
+            yield slide_group
+
+
+def read_imc_panorama_array(array: Array) -> "da.Array":
+    if not isinstance(array, IMCPanoramaArray):
+        raise TypeError(f"Not an IMC panorama array: {array}")
+    with MCDFile(array.mcd_file) as f:
+        slide = next(slide for slide in f.slides if slide.id == array.slide_id)
+        panorama = next(
+            panorama for panorama in slide.panoramas if panorama.id == array.panorama_id
+        )
+        return da.from_array(f.read_panorama(panorama)[::-1, :])
+
+
+def read_imc_acquisition_array(array: Array) -> "da.Array":
+    if not isinstance(array, IMCAcquisitionArray):
+        raise TypeError(f"Not an IMC acquisition array: {array}")
+    with MCDFile(array.mcd_file) as f:
+        slide = next(slide for slide in f.slides if slide.id == array.slide_id)
+        acquisition = next(
+            acquisition
+            for acquisition in slide.acquisitions
+            if acquisition.id == array.acquisition_id
+        )
+        if acquisition.height_px is None or acquisition.width_px is None:
+            return da.from_array(
+                f.read_acquisition(acquisition)[array.channel_index, ::-1, :]
+            )
+        shape = (acquisition.height_px, acquisition.width_px)
+    # defer reading until the data is actually requested
+    data = dask.delayed(_read_imc_acquisition_channel)(
+        array.mcd_file, array.slide_id, array.acquisition_id, array.channel_index
+    )
+    return da.from_delayed(data, shape, dtype=np.float32)
+
+
+def read_imc_slide_mosaic_array(array: Array) -> "da.Array":
+    if not isinstance(array, IMCSlideMosaicArray):
+        raise TypeError(f"Not an IMC slide mosaic array: {array}")
+    levels, _, _ = _create_slide_mosaic(array)
+    return levels[0]
+
+
 def load_imc_panorama_array(array: Array) -> None:
     if not isinstance(array, IMCPanoramaArray):
         raise TypeError(f"Not an IMC panorama array: {array}")
@@ -72,7 +126,7 @@ def load_imc_panorama_array(array: Array) -> None:
         panorama = next(
             panorama for panorama in slide.panoramas if panorama.id == array.panorama_id
         )
-        data = da.from_array(f.read_panorama(panorama)[::-1, :])
+        data = f.read_panorama(panorama)[::-1, :]
         scale = (
             panorama.height_um / data.shape[0],
             panorama.width_um / data.shape[1],
@@ -100,21 +154,217 @@ def load_imc_acquisition_array(array: Array) -> None:
             for acquisition in slide.acquisitions
             if acquisition.id == array.acquisition_id
         )
-        data = da.from_array(
-            f.read_acquisition(acquisition)[array.channel_index, ::-1, :]
+        data = f.read_acquisition(acquisition)[array.channel_index, ::-1, :]
+        scale, translate, rotate = _get_acquisition_transform(acquisition, data.shape)
+    array.layer = Image(
+        name=array.name, data=data, scale=scale, translate=translate, rotate=rotate
+    )
+
+
+def load_imc_multichannel_acquisition_array(array: Array) -> None:
+    if not isinstance(array, IMCMultichannelAcquisitionArray):
+        raise TypeError(f"Not an IMC multichannel acquisition array: {array}")
+    # the channels of an acquisition are the layers created by napari's channel_axis
+    # from the same (cached) acquisition array, i.e. channels can still be toggled
+    # individually (e.g. using the "Channel" flat grouping)
+    data, meta, _ = _split_imc_acquisition(
+        array.mcd_file,
+        array.slide_id,
+        array.acquisition_id,
+        os.stat(array.mcd_file).st_mtime,
+    )[array.channel_index]
+    array.layer = create_image(array.name, data, **meta)
+
+
+def load_imc_slide_mosaic_array(array: Array) -> None:
+    if not isinstance(array, IMCSlideMosaicArray):
+        raise TypeError(f"Not an IMC slide mosaic array: {array}")
+    levels, origin, pixel_size = _create_slide_mosaic(array)
+    array.layer = create_image(
+        array.name,
+        levels if len(levels) > 1 else levels[0],
+        multiscale=len(levels) > 1,
+        scale=(pixel_size, pixel_size),
+        translate=origin,
+    )
+
+
+def _create_slide_mosaic(
+    array: IMCSlideMosaicArray,
+) -> Tuple[List["da.Array"], Tuple[float, float], float]:
+    sources: List[MosaicSource] = []
+    pixel_size = np.inf
+    mtime = os.stat(array.mcd_file).st_mtime
+    with MCDFile(array.mcd_file) as f:
+        slide = next(slide for slide in f.slides if slide.id == array.slide_id)
+        for acquisition in slide.acquisitions:
+            if array.channel_name not in acquisition.channel_names:
+                continue
+            if acquisition.height_px is None or acquisition.width_px is None:
+                shape = f.read_acquisition(acquisition).shape[1:]
+            else:
+                shape = (acquisition.height_px, acquisition.width_px)
+            scale, translate, rotate = _get_acquisition_transform(acquisition, shape)
+            source = MosaicSource.create(
+                array.mcd_file,
+                array.slide_id,
+                acquisition.id,
+                acquisition.channel_names.index(array.channel_name),
+                shape,
+                # same transform as for acquisition layers
+                Affine(scale=scale, translate=translate, rotate=rotate),
+                mtime=mtime,
+            )
+            sources.append(source)
+            pixel_size = min(pixel_size, *scale)
+    levels, origin = create_mosaic(
+        sources, _read_mosaic_source, pixel_size, source_cache=_mosaic_source_cache
+    )
+    return levels, origin, pixel_size
+
+
+def _read_imc_slide_group(
+    name: str, mcd_file: str, slide: "Slide", multichannel: bool, mosaic: bool
+) -> Group:
+    panorama_groups: List[Group] = []
+    for panorama in slide.panoramas:
+        panorama_array = IMCPanoramaArray(
+            name=f"{name} [S{slide.id:02d} P{panorama.id:02d}]",
+            mcd_file=mcd_file,
+            slide_id=slide.id,
+            panorama_id=panorama.id,
         )
-        scale = (
-            acquisition.height_um / data.shape[0],
-            acquisition.width_um / data.shape[1],
+        panorama_group = Group.build(
+            f"[P{panorama.id:02d}] {panorama.description}",
+            arrays=[panorama_array],
         )
-        translate = (
-            acquisition.roi_points_um[0][1] - acquisition.height_um,
-            acquisition.roi_points_um[0][0],
+        panorama_groups.append(panorama_group)
+    acquisition_groups: List[Group] = []
+    mosaic_channels: Dict[str, str] = {}  # channel name -> flat group
+    for acquisition in slide.acquisitions:
+        for channel_index, (channel_name, channel_label) in enumerate(
+            zip(acquisition.channel_names, acquisition.channel_labels)
+        ):
+            mosaic_channels.setdefault(
+                channel_name,
+                sys.intern(f"[C{channel_index:02d}] {channel_name} {channel_label}"),
+            )
+        acquisition_arrays: List[IMCArray] = []
+        # multichannel: channels are split from a single acquisition array when loaded
+        acquisition_array_type = (
+            IMCMultichannelAcquisitionArray if multichannel else IMCAcquisitionArray
         )
-        rotate = -np.arctan2(
-            acquisition.roi_points_um[1][1] - acquisition.roi_points_um[0][1],
-            acquisition.roi_points_um[1][0] - acquisition.roi_points_um[0][0],
+        for channel_index, (channel_name, channel_label) in enumerate(
+            zip(acquisition.channel_names, acquisition.channel_labels)
+        ):
+            acquisition_array = acquisition_array_type(
+                name=f"{name} [S{slide.id:02d} "
+                f"A{acquisition.id:02d} C{channel_index:02d}]",
+                mcd_file=mcd_file,
+                slide_id=slide.id,
+                acquisition_id=acquisition.id,
+                channel_index=channel_index,
+            )
+            # share flat group strings among acquisitions to save memory
+            acquisition_array.flat_grouping_groups["Channel"] = sys.intern(
+                f"[C{channel_index:02d}] {channel_name} {channel_label}"
+            )
+            acquisition_arrays.append(acquisition_array)
+        acquisition_group = Group.build(
+            f"[A{acquisition.id:02d}] {acquisition.description}",
+            arrays=acquisition_arrays,
         )
-    array.layer = Image(
-        name=array.name, data=data, scale=scale, translate=translate, rotate=rotate
+        acquisition_groups.append(acquisition_group)
+    slide_children = [
+        Group.build("Panoramas", children=panorama_groups),
+        Group.build("Acquisitions", children=acquisition_groups),
+    ]
+    if mosaic:
+        # one composite array (spanning all acquisitions) per channel
+        mosaic_arrays: List[IMCSlideMosaicArray] = []
+        for channel_name, channel_group in mosaic_channels.items():
+            mosaic_array = IMCSlideMosaicArray(
+                name=f"{name} [S{slide.id:02d} {channel_name}]",
+                mcd_file=mcd_file,
+                slide_id=slide.id,
+                channel_name=channel_name,
+            )
+            mosaic_array.flat_grouping_groups["Channel"] = channel_group
+            mosaic_arrays.append(mosaic_array)
+        slide_children.append(Group.build("Mosaic", arrays=mosaic_arrays))
+    return Group.build(
+        f"[S{slide.id:02d}] {slide.description}", children=slide_children
+    )
+
+
+def _get_acquisition_transform(
+    acquisition: "Acquisition", shape: Tuple[int, ...]
+) -> Tuple[Tuple[float, float], Tuple[float, float], float]:
+    scale = (acquisition.height_um / shape[0], acquisition.width_um / shape[1])
+    translate = (
+        acquisition.roi_points_um[0][1] - acquisition.height_um,
+        acquisition.roi_points_um[0][0],
+    )
+    rotate = -np.arctan2(
+        acquisition.roi_points_um[1][1] - acquisition.roi_points_um[0][1],
+        acquisition.roi_points_um[1][0] - acquisition.roi_points_um[0][0],
+    )
+    return scale, translate, rotate
+
+
+@lru_cache(maxsize=ACQUISITION_CACHE_SIZE)
+def _split_imc_acquisition(
+    mcd_file: str, slide_id: int, acquisition_id: int, mtime: float
+) -> List["FullLayerData"]:
+    # layer data of the acquisition's channels (see napari's channel_axis), i.e. the
+    # MCD file is only opened once per acquisition; the file's modification time
+    # invalidates cached acquisitions
+    with MCDFile(mcd_file) as f:
+        slide = next(slide for slide in f.slides if slide.id == slide_id)
+        acquisition = next(
+            acquisition
+            for acquisition in slide.acquisitions
+            if acquisition.id == acquisition_id
+        )
+        if acquisition.height_px is None or acquisition.width_px is None:
+            data = da.from_array(
+                f.read_acquisition(acquisition)[:, ::-1, :], chunks=(1, -1, -1)
+            )
+    if acquisition.height_px is not None and acquisition.width_px is not None:
+        # one chunk per channel, i.e. channels are only read when actually requested
+        shape = (acquisition.height_px, acquisition.width_px)
+        data = da.stack(
+            [
+                da.from_delayed(
+                    dask.delayed(_read_imc_acquisition_channel)(
+                        mcd_file, slide_id, acquisition_id, channel_index
+                    ),
+                    shape,
+                    dtype=np.float32,
+                )
+                for channel_index in range(acquisition.num_channels)
+            ]
+        )
+    scale, translate, rotate = _get_acquisition_transform(acquisition, data.shape[1:])
+    return split_channels(data, 0, scale=scale, translate=translate, rotate=rotate)
+
+
+def _read_imc_acquisition_channel(
+    mcd_file: str, slide_id: int, acquisition_id: int, channel_index: int
+) -> np.ndarray:
+    # only the requested channel is read (i.e., not the whole acquisition)
+    with MCDFile(mcd_file) as f:
+        slide = next(slide for slide in f.slides if slide.id == slide_id)
+        acquisition = next(
+            acquisition
+            for acquisition in slide.acquisitions
+            if acquisition.id == acquisition_id
+        )
+        return f.read_acquisition(acquisition, channels=[channel_index])[0, ::-1, :]
+
+
+def _read_mosaic_source(source: MosaicSource) -> np.ndarray:
+    # sources are cached per mosaic level, shared by all mosaics (see MosaicSourceCache)
+    return _read_imc_acquisition_channel(
+        source.mcd_file, source.slide_id, source.acquisition_id, source.channel_index
     )
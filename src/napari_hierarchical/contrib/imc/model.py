@@ -1,15 +1,28 @@
+from pydantic import Field
+
 from napari_hierarchical.model import Array
 
 
 class IMCArray(Array):
-    mcd_file: str
-    slide_id: int
+    mcd_file: str = Field(allow_mutation=False)
+    slide_id: int = Field(allow_mutation=False)
 
 
 class IMCPanoramaArray(IMCArray):
-    panorama_id: int
+    panorama_id: int = Field(allow_mutation=False)
 
 
 class IMCAcquisitionArray(IMCArray):
-    acquisition_id: int
-    channel_index: int
+    acquisition_id: int = Field(allow_mutation=False)
+    channel_index: int = Field(allow_mutation=False)
+
+
+class IMCMultichannelAcquisitionArray(IMCAcquisitionArray):
+    # channel of an acquisition that is loaded as a whole, i.e. all channels of the
+    # acquisition share a single lazy (C, Y, X) array (one chunk per channel) that is
+    # split into layers using napari's channel_axis
+    pass
+
+
+class IMCSlideMosaicArray(IMCArray):
+    channel_name: str = Field(allow_mutation=False)
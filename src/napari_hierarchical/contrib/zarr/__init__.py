@@ -1,30 +1,25 @@
 import os
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 from pluggy import HookimplMarker
 
 from napari_hierarchical.hookspecs import (
     ArrayLoaderFunction,
+    ArrayReaderFunction,
     ArraySaverFunction,
     GroupReaderFunction,
     GroupWriterFunction,
 )
 from napari_hierarchical.model import Array, Group
 
-from ._reader import load_zarr_array, read_zarr_group
-from ._writer import save_zarr_array, write_zarr_group
 from .model import ZarrArray
 
-try:
-    import zarr
-except ModuleNotFoundError:
-    zarr = None
-
-
 PathLike = Union[str, os.PathLike]
 
-available = zarr is not None
+# heavy dependencies are only imported once a function is resolved (lazy loading)
+available = find_spec("zarr") is not None
 hookimpl = HookimplMarker("napari-hierarchical")
 
 
@@ -33,6 +28,8 @@ def napari_hierarchical_get_group_reader(
     path: PathLike,
 ) -> Optional[GroupReaderFunction]:
     if available and Path(path).suffix.lower() == ".zarr":
+        from ._reader import read_zarr_group
+
         return read_zarr_group
     return None
 
@@ -42,13 +39,26 @@ def napari_hierarchical_get_group_writer(
     path: PathLike, group: Group
 ) -> Optional[GroupWriterFunction]:
     if available and Path(path).suffix.lower() == ".zarr":
+        from ._writer import write_zarr_group
+
         return write_zarr_group
     return None
 
 
+@hookimpl
+def napari_hierarchical_get_array_reader(array: Array) -> Optional[ArrayReaderFunction]:
+    if available and isinstance(array, ZarrArray):
+        from ._reader import read_zarr_array
+
+        return read_zarr_array
+    return None
+
+
 @hookimpl
 def napari_hierarchical_get_array_loader(array: Array) -> Optional[ArrayLoaderFunction]:
     if available and isinstance(array, ZarrArray):
+        from ._reader import load_zarr_array
+
         return load_zarr_array
     return None
 
@@ -56,18 +66,34 @@ def napari_hierarchical_get_array_loader(array: Array) -> Optional[ArrayLoaderFu
 @hookimpl
 def napari_hierarchical_get_array_saver(array: Array) -> Optional[ArraySaverFunction]:
     if available and isinstance(array, ZarrArray):
+        from ._writer import save_zarr_array
+
         return save_zarr_array
     return None
 
 
+def __getattr__(name: str) -> Any:
+    if name in ("read_zarr_group", "read_zarr_array", "load_zarr_array"):
+        from . import _reader
+
+        return getattr(_reader, name)
+    if name in ("write_zarr_group", "save_zarr_array"):
+        from . import _writer
+
+        return getattr(_writer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "available",
     "read_zarr_group",
     "write_zarr_group",
+    "read_zarr_array",
     "load_zarr_array",
     "save_zarr_array",
     "napari_hierarchical_get_group_reader",
     "napari_hierarchical_get_group_writer",
+    "napari_hierarchical_get_array_reader",
     "napari_hierarchical_get_array_loader",
     "napari_hierarchical_get_array_saver",
 ]
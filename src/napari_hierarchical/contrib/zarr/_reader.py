@@ -1,10 +1,10 @@
 import os
+import sys
 from pathlib import Path
 from typing import Optional, Sequence, Union
 
-from napari.layers import Image
-
 from napari_hierarchical.model import Array, Group
+from napari_hierarchical.utils.statistics import create_image
 
 from .model import ZarrArray
 
@@ -20,9 +20,8 @@ PathLike = Union[str, os.PathLike]
 def read_zarr_group(path: PathLike) -> Group:
     z = zarr.open(store=str(path), mode="r")
     if isinstance(z, zarr.Array):
-        group = Group(name=Path(path).name)
         array = _read_zarr_array(str(path), [], z)
-        group.arrays.append(array)
+        group = Group.build(Path(path).name, arrays=[array])
     elif isinstance(z, zarr.Group):
         group = _read_zarr_group(str(path), [], z, name=Path(path).name)
     else:
@@ -31,12 +30,21 @@ def read_zarr_group(path: PathLike) -> Group:
     return group
 
 
+def read_zarr_array(array: Array) -> "da.Array":
+    if not isinstance(array, ZarrArray):
+        raise TypeError(f"Not a Zarr array: {array}")
+    z = zarr.open(store=array.zarr_file, mode="r")
+    return da.from_zarr(z[array.zarr_path])
+
+
 def load_zarr_array(array: Array) -> None:
     if not isinstance(array, ZarrArray):
-        raise ValueError(f"Not a Zarr array: {array}")
+        raise TypeError(f"Not a Zarr array: {array}")
     z = zarr.open(store=array.zarr_file, mode="r")
-    data = da.from_array(z[array.zarr_path][:])
-    array.layer = Image(name=array.name, data=data)
+    zarr_array = z[array.zarr_path]
+    data = zarr_array[:]
+    statistics = zarr_array.attrs.asdict()
+    array.layer = create_image(array.name, data, statistics=statistics)
 
 
 def _read_zarr_group(
@@ -47,14 +55,15 @@ def _read_zarr_group(
 ) -> Group:
     if name is None:
         name = zarr_group.basename
-    group = Group(name=name)
-    for zarr_name, zarr_child in zarr_group.groups():
-        child = _read_zarr_group(zarr_file, [*zarr_names, zarr_name], zarr_child)
-        group.children.append(child)
-    for zarr_name, zarr_array in zarr_group.arrays():
-        array = _read_zarr_array(zarr_file, [*zarr_names, zarr_name], zarr_array)
-        group.arrays.append(array)
-    return group
+    children = [
+        _read_zarr_group(zarr_file, [*zarr_names, zarr_name], zarr_child)
+        for zarr_name, zarr_child in zarr_group.groups()
+    ]
+    arrays = [
+        _read_zarr_array(zarr_file, [*zarr_names, zarr_name], zarr_array)
+        for zarr_name, zarr_array in zarr_group.arrays()
+    ]
+    return Group.build(name, arrays=arrays, children=children)
 
 
 def _read_zarr_array(
@@ -66,7 +75,7 @@ def _read_zarr_array(
         name += f"/{zarr_path}"
     array = ZarrArray(name=name, zarr_file=zarr_file, zarr_path=zarr_path)
     if len(zarr_names) > 0:
-        array.flat_grouping_groups["Path"] = (
+        array.flat_grouping_groups["Path"] = sys.intern(
             "/*" * (len(zarr_names) - 1) + "/" + zarr_names[-1]
         )
     else:
@@ -1,14 +1,20 @@
 import os
 from pathlib import Path
-from typing import Union
+from typing import Any, Optional, Union
 
 import numpy as np
 
+from napari_hierarchical.hookspecs import ArrayReaderFunction
 from napari_hierarchical.model import Array, Group
+from napari_hierarchical.utils.statistics import (
+    compute_statistics,
+    store_with_statistics,
+)
 
 from .model import ZarrArray
 
 try:
+    import dask.array as da
     import zarr
 except ModuleNotFoundError:
     pass
@@ -16,31 +22,59 @@ except ModuleNotFoundError:
 PathLike = Union[str, os.PathLike]
 
 
-def write_zarr_group(path: PathLike, group: Group) -> None:
+def write_zarr_group(
+    path: PathLike, group: Group, array_reader: Optional[ArrayReaderFunction] = None
+) -> None:
     if group.parent is not None:
         raise ValueError(f"Not a root group: {group}")
-    if not group.loaded:
+    if array_reader is None and not group.loaded:
         raise ValueError(f"Group is not loaded: {group}")
     z = zarr.open(store=str(path), mode="w")
     assert isinstance(z, zarr.Group)
-    _write_zarr_group(group, z)
+    _write_zarr_group(group, z, array_reader)
 
 
 def save_zarr_array(array: Array) -> None:
     if not isinstance(array, ZarrArray):
-        raise ValueError(f"Not a Zarr array: {array}")
+        raise TypeError(f"Not a Zarr array: {array}")
     if not array.loaded:
         raise ValueError(f"Array is not loaded: {array}")
     assert array.layer is not None
     z = zarr.open(store=array.zarr_file, mode="r+")
-    z[array.zarr_path][:] = array.layer.data
+    zarr_array = z[array.zarr_path]
+    zarr_array[:] = array.layer.data
+    zarr_array.attrs.update(compute_statistics(array.layer.data))
 
 
-def _write_zarr_group(group: Group, zarr_group: "zarr.Group") -> None:
+def _write_zarr_group(
+    group: Group,
+    zarr_group: "zarr.Group",
+    array_reader: Optional[ArrayReaderFunction],
+) -> None:
     for array in group.arrays:
-        assert array.layer is not None
-        data = np.asarray(array.layer.data)
-        zarr_group.create_dataset(name=Path(array.name).name, data=data)
+        if array.layer is not None:
+            data = array.layer.data
+        else:
+            assert array_reader is not None
+            data = array_reader(array)
+        _write_zarr_dataset(zarr_group, Path(array.name).name, data)
     for child in group.children:
         g = zarr_group.create_group(name=child.name)
-        _write_zarr_group(child, g)
+        _write_zarr_group(child, g, array_reader)
+
+
+def _write_zarr_dataset(zarr_group: "zarr.Group", name: str, data: Any) -> None:
+    if isinstance(data, da.Array):
+        # stream chunk by chunk instead of materializing the whole array
+        zarr_array = zarr_group.create_dataset(
+            name=name, shape=data.shape, chunks=data.chunksize, dtype=data.dtype
+        )
+        # align dask chunks with zarr chunks to allow for lock-free writing
+        statistics = store_with_statistics(
+            data.rechunk(zarr_array.chunks), zarr_array, lock=False
+        )
+    else:
+        data = np.asarray(data)
+        zarr_array = zarr_group.create_dataset(name=name, data=data)
+        statistics = compute_statistics(data)
+    zarr_array.attrs.update(statistics)
@@ -1,6 +1,8 @@
+from pydantic import Field
+
 from napari_hierarchical.model import Array
 
 
 class ZarrArray(Array):
-    zarr_file: str
-    zarr_path: str
+    zarr_file: str = Field(allow_mutation=False)
+    zarr_path: str = Field(allow_mutation=False)
@@ -1,5 +1,5 @@
 import os
-from typing import Callable, Optional, Union
+from typing import Any, Callable, Iterator, Optional, Union
 
 from pluggy import HookspecMarker
 
@@ -7,7 +7,11 @@ from .model import Array, Group
 
 PathLike = Union[str, os.PathLike]
 GroupReaderFunction = Callable[[PathLike], Group]
-GroupWriterFunction = Callable[[PathLike, Group], None]
+# yields the (committed) root group first, followed by its child groups as they are
+# read; child groups are appended to the root group by the caller
+GroupStreamReaderFunction = Callable[[PathLike], Iterator[Group]]
+GroupWriterFunction = Callable[..., None]
+ArrayReaderFunction = Callable[[Array], Any]
 ArrayLoaderFunction = Callable[[Array], None]
 ArraySaverFunction = Callable[[Array], None]
 
@@ -21,6 +25,13 @@ def napari_hierarchical_get_group_reader(
     pass
 
 
+@hookspec(firstresult=True)
+def napari_hierarchical_get_group_stream_reader(
+    path: PathLike,
+) -> Optional[GroupStreamReaderFunction]:
+    pass
+
+
 @hookspec(firstresult=True)
 def napari_hierarchical_get_group_writer(
     path: PathLike, group: Group
@@ -28,6 +39,11 @@ def napari_hierarchical_get_group_writer(
     pass
 
 
+@hookspec(firstresult=True)
+def napari_hierarchical_get_array_reader(array: Array) -> Optional[ArrayReaderFunction]:
+    pass
+
+
 @hookspec(firstresult=True)
 def napari_hierarchical_get_array_loader(array: Array) -> Optional[ArrayLoaderFunction]:
     pass
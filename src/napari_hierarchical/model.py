@@ -1,12 +1,13 @@
-from typing import Any, Generator, Optional
+from typing import Any, Callable, Generator, Iterable, Optional
 
 from napari.layers import Layer
-from napari.utils.events import Event
-from pydantic import Field
+from napari.utils.events import EmitterGroup, Event, EventEmitter
+from pydantic import BaseModel, Field, PrivateAttr
 
 from .utils.parent_aware import (
     NestedParentAwareEventedModel,
     NestedParentAwareEventedModelList,
+    ParentAware,
     ParentAwareEventedDict,
     ParentAwareEventedModel,
 )
@@ -33,11 +34,16 @@ class Group(NestedParentAwareEventedModel["Group"]):
         self.events.add(loaded=Event, visible=Event)
 
     @staticmethod
-    def from_group(group: "Group") -> "Group":
-        new_group = Group(name=group.name)
-        new_group.arrays.extend(Array.from_array(array) for array in group.arrays)
-        new_group.children.extend(Group.from_group(child) for child in group.children)
-        return new_group
+    def build(
+        name: str,
+        arrays: Iterable["Array"] = (),
+        children: Iterable["Group"] = (),
+    ) -> "Group":
+        # for readers: assembles a group without emitting events, see extend_silently
+        group = Group(name=name)
+        group.arrays.extend_silently(arrays)
+        group.children.extend_silently(children)
+        return group
 
     def show(self) -> None:
         for array in self.iter_arrays(recursive=True):
@@ -132,14 +138,14 @@ class Array(ParentAwareEventedModel[Group]):
         default_factory=FlatGroupingGroupsDict, allow_mutation=False
     )
 
+    # event emitters are created upon first access (see events), i.e. only for arrays
+    # that are observed; unobserved arrays propagate their events to their parents
+    _events: Optional[EmitterGroup] = PrivateAttr(None)  # type: ignore
+
     def __init__(self, **kwargs) -> None:
-        super().__init__(**kwargs)
+        BaseModel.__init__(self, **kwargs)  # skip EventedModel (creates emitters)
+        ParentAware.__init__(self)
         self.flat_grouping_groups.set_parent(self)
-        self.events.add(loaded=Event, visible=Event)
-        self.events.name.connect(self._on_name_event)
-        self.events.layer.connect(self._on_layer_event)
-        self.events.loaded.connect(self._on_loaded_event)
-        self.events.visible.connect(self._on_visible_event)
         layer = kwargs.get("layer")
         if layer is not None:
             layer.events.name.connect(self._on_layer_name_event)
@@ -172,17 +178,55 @@ class Array(ParentAwareEventedModel[Group]):
         return repr(self)
 
     def __setattr__(self, name: str, value: Any) -> None:
+        if name not in ("name", "layer"):
+            if (
+                name in self.__fields__
+                and self.__fields__[name].field_info.allow_mutation
+            ):
+                super().__setattr__(name, value)  # e.g. fields added by plugins
+            else:
+                self._super_setattr_(name, value)
+            return
         if name == "layer" and self.layer is not None:
             self.layer.events.name.disconnect(self._on_layer_name_event)
             self.layer.events.visible.disconnect(self._on_layer_visible_event)
-        super().__setattr__(name, value)
+        # emit events here instead of connecting to the own event emitters, which is
+        # costly for large numbers of arrays (same as EventedModel.__setattr__)
+        old_value = getattr(self, name)
+        self._super_setattr_(name, value)
+        new_value = getattr(self, name)
         if name == "layer" and self.layer is not None:
             self.layer.events.name.connect(self._on_layer_name_event)
             self.layer.events.visible.connect(self._on_layer_visible_event)
+        if new_value is not old_value and new_value != old_value:
+            if name == "name":
+                self._emit(name, self._on_name_event, value=new_value)
+            else:
+                self._emit(name, self._on_layer_event, value=new_value)
+
+    def _emit(
+        self, name: str, callback: Callable[[Event], None], **kwargs: Any
+    ) -> None:
+        # emits the event (if observed) and passes it to the callback, with the array
+        # as its source (emitters unset event sources after emission)
+        if self._events is None:
+            event = Event(name, **kwargs)
+        else:
+            emitter: EventEmitter = getattr(self._events, name)
+            if emitter.blocked():
+                return
+            event = emitter(**kwargs)
+        event._push_source(self)
+        try:
+            callback(event)
+        finally:
+            event._pop_source()
 
     def _on_name_event(self, event: Event) -> None:
         if self.layer is not None:
             self.layer.name = self.name
+        if self.parent is not None:
+            self.parent._emit_nested_event(event)
 
     def _on_layer_event(self, event: Event) -> None:
         if self.layer is not None:
@@ -198,19 +242,45 @@ class Array(ParentAwareEventedModel[Group]):
         assert self.layer is not None
         self._emit_visible_event(event)
 
-    def _on_loaded_event(self, event: Event) -> None:
+    def _emit_loaded_event(self, source_event: Event) -> None:
+        self._emit(
+            "loaded",
+            self._propagate_loaded_event,
+            value=self.loaded,
+            source_event=source_event,
+        )
+
+    def _emit_visible_event(self, source_event: Event) -> None:
+        self._emit(
+            "visible",
+            self._propagate_visible_event,
+            value=self.visible,
+            source_event=source_event,
+        )
+
+    def _propagate_loaded_event(self, event: Event) -> None:
         if self.parent is not None:
             self.parent._emit_loaded_event(event)
 
-    def _on_visible_event(self, event: Event) -> None:
+    def _propagate_visible_event(self, event: Event) -> None:
         if self.parent is not None:
             self.parent._emit_visible_event(event)
 
-    def _emit_loaded_event(self, source_event: Event) -> None:
-        self.events.loaded(value=self.loaded, source_event=source_event)
-
-    def _emit_visible_event(self, source_event: Event) -> None:
-        self.events.visible(value=self.visible, source_event=source_event)
+    @property
+    def events(self) -> EmitterGroup:  # type: ignore
+        if self._events is None:
+            events = EmitterGroup(source=self)
+            events.add(
+                **dict.fromkeys(
+                    name
+                    for name, field in self.__fields__.items()
+                    if field.field_info.allow_mutation
+                ),
+                loaded=Event,
+                visible=Event,
+            )
+            self._events = events
+        return self._events
 
     @property
     def loaded(self) -> bool:
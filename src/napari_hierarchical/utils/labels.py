@@ -0,0 +1,29 @@
+from importlib.util import find_spec
+from typing import Any, Sequence
+
+import numpy as np
+
+LABELS_DTYPE = np.uint32  # narrower than napari's default (int64)
+LABELS_CHUNK_SIZE = 1024
+
+# chunked storage requires zarr (optional)
+chunked_available = find_spec("zarr") is not None
+
+
+def create_labels_data(
+    shape: Sequence[int], chunk_size: int = LABELS_CHUNK_SIZE
+) -> Any:
+    # chunks are allocated when painted (and freed when erased) instead of allocating
+    # a dense array for the whole extent upfront
+    if not chunked_available:
+        return np.zeros(shape, dtype=LABELS_DTYPE)
+    import zarr
+
+    chunks = [1] * (len(shape) - 2) + [min(n, chunk_size) for n in shape[-2:]]
+    return zarr.zeros(
+        shape,
+        chunks=chunks,
+        dtype=LABELS_DTYPE,
+        store=zarr.MemoryStore(),
+        write_empty_chunks=False,
+    )
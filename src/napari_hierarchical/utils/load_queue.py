@@ -0,0 +1,74 @@
+from heapq import heapify, heappop, heappush
+from itertools import count
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+_T = TypeVar("_T", bound=Hashable)
+
+
+class LoadQueue(Generic[_T]):
+    # lower priorities first, then first in, first out; heap entries are invalidated
+    # lazily, i.e. removing or re-prioritizing items does not require heap updates
+    def __init__(self, get_priority: Callable[[_T], int]) -> None:
+        self._get_priority = get_priority
+        self._heap: List[Tuple[int, int, _T]] = []
+        self._entries: Dict[_T, Tuple[int, int]] = {}  # item -> (priority, order)
+        self._order = count()
+
+    def push(self, items: Iterable[_T]) -> None:
+        for item in items:
+            if item not in self._entries:
+                entry = (self._get_priority(item), next(self._order))
+                self._entries[item] = entry
+                heappush(self._heap, (*entry, item))
+
+    def remove(self, items: Iterable[_T]) -> None:
+        for item in items:
+            self._entries.pop(item, None)
+        if len(self._entries) == 0:
+            self._heap.clear()
+
+    def update(self, items: Optional[Iterable[_T]] = None) -> None:
+        # re-evaluates the priorities of the given items (default: all items)
+        if items is None:
+            self._entries = {
+                item: (self._get_priority(item), order)
+                for item, (_, order) in self._entries.items()
+            }
+            self._heap = [(*entry, item) for item, entry in self._entries.items()]
+            heapify(self._heap)
+        else:
+            for item in items:
+                old_entry = self._entries.get(item)
+                if old_entry is not None:
+                    entry = (self._get_priority(item), old_entry[1])
+                    if entry != old_entry:
+                        self._entries[item] = entry
+                        heappush(self._heap, (*entry, item))
+
+    def pop(self) -> _T:
+        while len(self._heap) > 0:
+            priority, order, item = heappop(self._heap)
+            if self._entries.get(item) == (priority, order):
+                del self._entries[item]
+                return item
+        raise IndexError("pop from empty load queue")
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._entries.clear()
+
+    def __contains__(self, item: _T) -> bool:
+        return item in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,11 +1,13 @@
 from typing import Generic, Iterable, Optional, TypeVar, Union
 
 from napari.utils.events import (
+    EmitterGroup,
     Event,
     EventedDict,
     EventedList,
     EventedModel,
     EventEmitter,
+    SelectableEventedList,
 )
 
 _PT = TypeVar("_PT")
@@ -37,10 +39,39 @@ class ParentAwareEventedList(ParentAware[_PT], EventedList[_T]):
 
 
 class ParentAwareEventedDict(ParentAware[_PT], EventedDict[_KT, _VT]):
+    # events are created upon first access, i.e. only for dicts that are observed
     def __init__(self, *args, **kwargs) -> None:
-        EventedDict.__init__(self, *args, **kwargs)
+        self._events: Optional[EmitterGroup] = None
+        super(EventedDict, self).__init__(*args, **kwargs)  # skip EventedDict
         ParentAware.__init__(self)
 
+    def __setitem__(self, key: _KT, value: _VT) -> None:
+        if self._events is None:
+            super(EventedDict, self).__setitem__(key, value)
+        else:
+            super().__setitem__(key, value)
+
+    def __delitem__(self, key: _KT) -> None:
+        if self._events is None:
+            super(EventedDict, self).__delitem__(key)
+        else:
+            super().__delitem__(key)
+
+    @property
+    def events(self) -> EmitterGroup:  # type: ignore
+        if self._events is None:
+            self._events = EmitterGroup(
+                source=self,
+                changing=None,
+                changed=None,
+                adding=None,
+                added=None,
+                removing=None,
+                removed=None,
+                updated=None,
+            )
+        return self._events
+
 
 _PAEMT = TypeVar("_PAEMT", bound="ParentAwareEventedModel")
 
@@ -95,6 +126,14 @@ class NestedParentAwareEventedModelList(ParentAwareEventedList[_NPAEMT, _PAT]):
         if self.parent is not None:
             self.parent._emit_nested_list_event(event)
 
+    # items propagate their events to their parents directly (see nested events), so
+    # connecting to all event emitters of each item for re-emission is not required
+    def _connect_child_emitters(self, child: _PAT) -> None:
+        pass
+
+    def _disconnect_child_emitters(self, child: _PAT) -> None:
+        pass
+
     def insert(self, index: int, value: _PAT) -> None:
         value.set_parent(self.parent)
         super().insert(index, value)
@@ -148,5 +187,47 @@ class NestedParentAwareEventedModelList(ParentAwareEventedList[_NPAEMT, _PAT]):
         for item in self:
             item.set_parent(value)
 
+    def extend_silently(self, values: Iterable[_PAT]) -> None:
+        # bulk insertion for building (unobserved) trees: no type checks, no events
+        values = list(values)
+        for value in values:
+            value.set_parent(self.parent)
+        self._list.extend(values)
+
     def commit(self) -> None:
         self.dirty = False
+
+
+def move_item(
+    src_list: EventedList[_PAT],
+    src_index: int,
+    dest_list: EventedList[_PAT],
+    dest_index: int,
+) -> bool:
+    # moves an item between (parent-aware) lists without removing/re-inserting it,
+    # i.e. the item keeps its state and event connections; both indices refer to
+    # the lists prior to the move (same as EventedList.move)
+    if dest_list is src_list:
+        return src_list.move(src_index, dest_index=dest_index)
+    if dest_index < 0:
+        dest_index += len(dest_list) + 1
+    assert 0 <= dest_index <= len(dest_list)
+    item = src_list[src_index]
+    dest_list._type_check(item)
+    # cross-list moves are emitted by the source list only, with dest_list set
+    src_list.events.moving(index=src_index, new_index=dest_index, dest_list=dest_list)
+    src_list._list.pop(src_index)
+    if isinstance(src_list, SelectableEventedList):
+        src_list.selection.discard(item)
+    if isinstance(dest_list, ParentAware):
+        item.set_parent(dest_list.parent)
+    else:
+        item.set_parent(None)
+    dest_list._list.insert(dest_index, item)
+    for evented_list in (src_list, dest_list):
+        if isinstance(evented_list, NestedParentAwareEventedModelList):
+            evented_list.dirty = True
+    src_list.events.moved(
+        index=src_index, new_index=dest_index, value=item, dest_list=dest_list
+    )
+    return True
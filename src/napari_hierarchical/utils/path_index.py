@@ -0,0 +1,66 @@
+from bisect import bisect_left
+from typing import Dict, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+_T = TypeVar("_T", bound=Hashable)
+
+
+class PathIndex(Generic[_T]):
+    def __init__(self) -> None:
+        self._items: Dict[str, List[_T]] = {}
+        self._paths: Dict[_T, str] = {}
+        self._sorted_paths: Optional[List[str]] = []  # sorted lazily
+
+    def add(self, items: Iterable[Tuple[str, _T]]) -> None:
+        for path, item in items:
+            assert item not in self._paths
+            self._paths[item] = path
+            path_items = self._items.get(path)
+            if path_items is None:
+                self._items[path] = [item]
+                self._sorted_paths = None
+            else:
+                path_items.append(item)
+
+    def remove(self, items: Iterable[_T]) -> None:
+        for item in items:
+            path = self._paths.pop(item)
+            path_items = self._items[path]
+            path_items.remove(item)
+            if len(path_items) == 0:
+                del self._items[path]
+                self._sorted_paths = None
+
+    def get(self, path: str, default: Optional[_T] = None) -> Optional[_T]:
+        path_items = self._items.get(path)
+        if path_items is not None:
+            return path_items[0]
+        return default
+
+    def get_all(self, path: str) -> List[_T]:
+        return list(self._items.get(path, []))
+
+    def get_path(self, item: _T) -> Optional[str]:
+        return self._paths.get(item)
+
+    def find(self, prefix: str) -> List[Tuple[str, _T]]:
+        # returns the items at the given path and below (i.e., not "a/bc" for "a/b")
+        if self._sorted_paths is None:
+            self._sorted_paths = sorted(self._items)
+        prefix = prefix.rstrip("/")
+        results: List[Tuple[str, _T]] = [
+            (prefix, item) for item in self._items.get(prefix, [])
+        ]
+        i = bisect_left(self._sorted_paths, prefix + "/")
+        while i < len(self._sorted_paths) and self._sorted_paths[i].startswith(
+            prefix + "/"
+        ):
+            path = self._sorted_paths[i]
+            results += ((path, item) for item in self._items[path])
+            i += 1
+        return results
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._items
+
+    def __len__(self) -> int:
+        return len(self._paths)
@@ -1,7 +1,15 @@
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
 import numpy as np
 from napari.components import LayerList
 from napari.layers import Image
 from napari.utils.events import Event
+from qtpy.QtCore import QTimer
+
+PROPAGATION_INTERVAL_MS = 16  # coalesce property changes within one frame
+# properties derived from other properties by each image, i.e. not propagated
+_DERIVED_PROPERTIES = ("thumbnail",)
 
 
 class ProxyImage(Image):
@@ -9,13 +17,34 @@ class ProxyImage(Image):
         super().__init__(np.array([[0, 1]]))
         self._layers = layers
         self._updating = False
+        self._pending_properties: Dict[str, Any] = {}
+        self._pending_images: List[Image] = []
+        self._selection_contrast_limits_range: Optional[Tuple[float, float]] = None
+        self._propagation_timer = QTimer()
+        self._propagation_timer.setSingleShot(True)
+        self._propagation_timer.setInterval(PROPAGATION_INTERVAL_MS)
+        self._propagation_timer.timeout.connect(self.flush)
         self.events.connect(self._on_event)
         self._connect_events()
         self._update()
 
     def __del__(self) -> None:
+        self._propagation_timer.stop()
         self._disconnect_events()
 
+    def flush(self) -> None:
+        # applies pending property changes to all selected images in one batch
+        self._propagation_timer.stop()
+        properties = self._pending_properties
+        images = self._pending_images
+        self._pending_properties = {}
+        self._pending_images = []
+        for image in images:
+            with _deferred_refresh(image):
+                for name, value in properties.items():
+                    if hasattr(image, name):
+                        setattr(image, name, value)
+
     def _connect_events(self) -> None:
         self._layers.selection.events.changed.connect(
             self._on_layers_selection_changed_event
@@ -27,26 +56,62 @@ class ProxyImage(Image):
         )
 
     def _on_event(self, event: Event) -> None:
+        if event.type in _DERIVED_PROPERTIES:
+            return
         if hasattr(self, event.type) and not self._updating:
-            value = getattr(self, event.type)
-            for layer in self._layers.selection:
-                if isinstance(layer, Image) and hasattr(layer, event.type):
-                    setattr(layer, event.type, value)
+            # only the latest value per property is propagated
+            if len(self._pending_properties) == 0:
+                self._pending_images = [
+                    layer
+                    for layer in self._layers.selection
+                    if isinstance(layer, Image)
+                ]
+                self._propagation_timer.start()
+            self._pending_properties[event.type] = getattr(self, event.type)
 
     def _on_layers_selection_changed_event(self, event: Event) -> None:
+        self.flush()  # pending changes apply to the previous selection
         self._update()
 
     def _update(self) -> None:
         images = [layer for layer in self._layers.selection if isinstance(layer, Image)]
         if len(images) > 0:
+            # contrast limits ranges are stored by the layers, i.e. no data access
+            contrast_limits_range = (
+                min(image.contrast_limits_range[0] for image in images),
+                max(image.contrast_limits_range[1] for image in images),
+            )
+            if contrast_limits_range == self._selection_contrast_limits_range:
+                return
             self._updating = True
             try:
-                self.data = np.array(
-                    [
-                        np.amin([image.contrast_limits_range[0] for image in images]),
-                        np.amax([image.contrast_limits_range[1] for image in images]),
-                    ]
-                )[np.newaxis, :]
+                self.data = np.array(contrast_limits_range)[np.newaxis, :]
                 self.reset_contrast_limits()
+                self._selection_contrast_limits_range = contrast_limits_range
             finally:
                 self._updating = False
+
+
+@contextmanager
+def _deferred_refresh(image: Image) -> Iterator[None]:
+    # napari refreshes the image (slice, thumbnail) upon every property change; within
+    # this context, refreshes are recorded instead and performed once upon exit
+    requested: Set[str] = set()
+
+    def refresh(event: Optional[Event] = None) -> None:
+        requested.add("refresh")
+
+    def update_thumbnail() -> None:
+        requested.add("thumbnail")
+
+    image.refresh = refresh  # type: ignore[assignment]
+    image._update_thumbnail = update_thumbnail  # type: ignore[assignment]
+    try:
+        yield
+    finally:
+        del image.refresh
+        del image._update_thumbnail
+        if "refresh" in requested:
+            image.refresh()  # includes the thumbnail
+        elif "thumbnail" in requested:
+            image._update_thumbnail()
@@ -0,0 +1,31 @@
+import os
+import re
+from typing import Any, Union
+
+PathLike = Union[str, os.PathLike]
+
+# fsspec URLs (e.g. s3://, gs://, https://); note that pathlib collapses "//"
+_URL_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]+://")
+
+# remote files are read in large blocks (i.e., few requests), of which the most
+# recently used ones are kept in memory
+REMOTE_BLOCK_SIZE = 4 * 2**20
+REMOTE_MAX_BLOCKS = 64
+
+
+def is_url(path: PathLike) -> bool:
+    return isinstance(path, str) and _URL_PATTERN.match(path) is not None
+
+
+def open_remote_file(
+    url: str, block_size: int = REMOTE_BLOCK_SIZE, max_blocks: int = REMOTE_MAX_BLOCKS
+) -> Any:
+    import fsspec
+
+    return fsspec.open(
+        url,
+        mode="rb",
+        block_size=block_size,
+        cache_type="blockcache",
+        cache_options={"maxblocks": max_blocks},
+    ).open()
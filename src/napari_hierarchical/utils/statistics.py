@@ -0,0 +1,146 @@
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import dask
+import dask.array as da
+import numpy as np
+from napari.layers import Image
+
+# statistics are stored as array attributes by the writers and used by the loaders to
+# set contrast limits without scanning the data (contrast limits: percentile range);
+# attribute names are namespaced to not collide with attributes written by other tools
+ATTR_PREFIX = "napari_hierarchical:"
+MIN_ATTR = f"{ATTR_PREFIX}min"
+MAX_ATTR = f"{ATTR_PREFIX}max"
+PERCENTILES = (1, 99)
+PERCENTILE_ATTRS = tuple(
+    f"{ATTR_PREFIX}percentile_{percentile:g}" for percentile in PERCENTILES
+)
+MAX_SAMPLE_CHUNKS = 4
+
+ContrastLimits = Tuple[float, float]
+
+
+def compute_statistics(data: Any) -> Dict[str, float]:
+    if not isinstance(data, da.Array):
+        data = np.asarray(data)
+    if data.size == 0 or not _is_numeric(data.dtype):
+        return {}
+    if isinstance(data, da.Array):
+        # sampled chunks are computed in the same graph, i.e. chunks are only read once
+        min_value, max_value, *chunks = dask.compute(
+            da.nanmin(data), da.nanmax(data), *_get_sample_blocks(data)
+        )
+        return _get_statistics(min_value, max_value, _concatenate(chunks))
+    return _get_statistics(np.nanmin(data), np.nanmax(data), data)
+
+
+def store_with_statistics(data: da.Array, target: Any, lock: Any) -> Dict[str, float]:
+    # computes min/max/sampled chunks while storing (in the same graph), i.e. chunks
+    # are only read once
+    if data.size == 0 or not _is_numeric(data.dtype):
+        da.store(data, target, lock=lock)
+        return {}
+    store = da.store(data, target, lock=lock, compute=False)
+    _, min_value, max_value, *chunks = dask.compute(
+        store, da.nanmin(data), da.nanmax(data), *_get_sample_blocks(data)
+    )
+    return _get_statistics(min_value, max_value, _concatenate(chunks))
+
+
+def estimate_statistics(data: da.Array) -> Dict[str, float]:
+    # min/max/percentiles of a few evenly spaced chunks
+    if data.size == 0 or not _is_numeric(data.dtype):
+        return {}
+    sample = _sample_chunks(data)
+    if np.all(np.isnan(sample)):
+        return {}
+    return _get_statistics(np.nanmin(sample), np.nanmax(sample), sample)
+
+
+def get_contrast_limits(
+    statistics: Mapping[str, Any]
+) -> Optional[Tuple[ContrastLimits, ContrastLimits]]:
+    # returns (contrast limits range, contrast limits); attributes that cannot be
+    # converted (e.g. modified by other tools) are treated as missing
+    min_value = _get_float(statistics, MIN_ATTR)
+    max_value = _get_float(statistics, MAX_ATTR)
+    if min_value is None or max_value is None or not min_value < max_value:
+        return None
+    contrast_limits_range = (min_value, max_value)
+    contrast_limits = contrast_limits_range
+    lower, upper = (_get_float(statistics, attr) for attr in PERCENTILE_ATTRS)
+    if lower is not None and upper is not None and lower < upper:
+        contrast_limits = (lower, upper)
+    return contrast_limits_range, contrast_limits
+
+
+def create_image(
+    name: str,
+    data: Any,
+    statistics: Optional[Mapping[str, Any]] = None,
+    multiscale: Optional[bool] = None,
+    **kwargs: Any,
+) -> Image:
+    # contrast limits from stored statistics, sampled chunks (lazy data) or the dtype
+    # range (lazy integer data); napari scans in-memory data if none of these apply
+    result = None
+    if statistics is not None:
+        result = get_contrast_limits(statistics)
+    base_data = data[0] if multiscale else data
+    if result is None and isinstance(base_data, da.Array):
+        result = get_contrast_limits(estimate_statistics(base_data))
+        if result is None and np.issubdtype(base_data.dtype, np.integer):
+            info = np.iinfo(base_data.dtype)
+            result = ((float(info.min), float(info.max)),) * 2
+    if result is None:
+        return Image(name=name, data=data, multiscale=multiscale, **kwargs)
+    contrast_limits_range, contrast_limits = result
+    layer = Image(
+        name=name,
+        data=data,
+        multiscale=multiscale,
+        contrast_limits=contrast_limits_range,
+        **kwargs,
+    )
+    layer.contrast_limits = contrast_limits
+    return layer
+
+
+def _get_statistics(min_value: Any, max_value: Any, sample: Any) -> Dict[str, float]:
+    if np.isnan(min_value) or np.isnan(max_value):  # all-NaN data
+        return {}
+    statistics = {MIN_ATTR: float(min_value), MAX_ATTR: float(max_value)}
+    if np.size(sample) > 0 and not np.all(np.isnan(sample)):
+        percentile_values = np.nanpercentile(sample, PERCENTILES)
+        for attr, value in zip(PERCENTILE_ATTRS, percentile_values):
+            statistics[attr] = float(value)
+    return statistics
+
+
+def _get_float(statistics: Mapping[str, Any], attr: str) -> Optional[float]:
+    try:
+        value = float(statistics[attr])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return value if np.isfinite(value) else None
+
+
+def _sample_chunks(data: da.Array) -> np.ndarray:
+    chunks: Sequence[np.ndarray] = dask.compute(*_get_sample_blocks(data))
+    return _concatenate(chunks)
+
+
+def _get_sample_blocks(data: da.Array) -> List[Any]:
+    # evenly spaced chunks (delayed)
+    blocks = data.to_delayed().ravel()
+    num_samples = min(len(blocks), MAX_SAMPLE_CHUNKS)
+    indices = np.unique(np.linspace(0, len(blocks) - 1, num=num_samples).round())
+    return [blocks[int(i)] for i in indices]
+
+
+def _concatenate(chunks: Sequence[np.ndarray]) -> np.ndarray:
+    return np.concatenate([np.ravel(chunk) for chunk in chunks])
+
+
+def _is_numeric(dtype: np.dtype) -> bool:
+    return np.issubdtype(dtype, np.integer) or np.issubdtype(dtype, np.floating)
@@ -0,0 +1,174 @@
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from pluggy import PluginManager
+
+PathLike = Union[str, os.PathLike]
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+TRACE_ENV_VAR = "NAPARI_HIERARCHICAL_TRACE"
+
+logger = logging.getLogger(__name__)
+
+
+class Tracer:
+    def __init__(self) -> None:
+        self._pid = os.getpid()
+        self._start_ns = time.perf_counter_ns()
+        self._trace_events: List[Dict[str, Any]] = []
+        self._counters: Dict[str, int] = defaultdict(int)
+        self._counters_lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def span(
+        self, name: str, category: str = "napari-hierarchical", **args: Any
+    ) -> Iterator[None]:
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._add_span(name, category, start_ns, time.perf_counter_ns(), args)
+
+    def begin(self, name: str, category: str = "napari-hierarchical") -> None:
+        stack: Optional[List[Tuple[str, str, int]]] = getattr(
+            self._local, "stack", None
+        )
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append((name, category, time.perf_counter_ns()))
+
+    def end(self, **args: Any) -> None:
+        end_ns = time.perf_counter_ns()
+        name, category, start_ns = self._local.stack.pop()
+        self._add_span(name, category, start_ns, end_ns, args)
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._counters_lock:
+            self._counters[name] += value
+            total = self._counters[name]
+        self._trace_events.append(
+            {
+                "name": name,
+                "ph": "C",
+                "ts": self._to_us(time.perf_counter_ns()),
+                "pid": self._pid,
+                "tid": threading.get_ident(),
+                "args": {name: total},
+            }
+        )
+
+    def clear(self) -> None:
+        self._trace_events.clear()
+        with self._counters_lock:
+            self._counters.clear()
+
+    def summarize(self) -> Dict[str, Any]:
+        spans: Dict[str, Dict[str, float]] = {}
+        for trace_event in self._trace_events:
+            if trace_event["ph"] == "X":
+                span = spans.setdefault(
+                    trace_event["name"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+                )
+                duration_ms = trace_event["dur"] / 1000
+                span["count"] += 1
+                span["total_ms"] += duration_ms
+                span["max_ms"] = max(span["max_ms"], duration_ms)
+        with self._counters_lock:
+            counters = dict(self._counters)
+        return {"spans": spans, "counters": counters}
+
+    def write_chrome_trace(self, path: PathLike) -> None:
+        # can be opened with chrome://tracing or https://ui.perfetto.dev
+        with Path(path).open("w") as f:
+            json.dump({"traceEvents": self._trace_events, "displayTimeUnit": "ms"}, f)
+
+    def write_summary(self, path: PathLike) -> None:
+        with Path(path).open("w") as f:
+            json.dump(self.summarize(), f, indent=2)
+
+    def _add_span(
+        self,
+        name: str,
+        category: str,
+        start_ns: int,
+        end_ns: int,
+        args: Dict[str, Any],
+    ) -> None:
+        trace_event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": self._to_us(start_ns),
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            trace_event["args"] = {key: str(value) for key, value in args.items()}
+        self._trace_events.append(trace_event)
+
+    def _to_us(self, ns: int) -> float:
+        return (ns - self._start_ns) / 1000
+
+
+def traced(func: _F) -> _F:
+    if tracer is None:
+        return func  # zero cost when tracing is disabled
+    name = func.__qualname__
+    category = func.__module__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        assert tracer is not None
+        with tracer.span(name, category=category):
+            return func(*args, **kwargs)
+
+    return wrapper  # type: ignore
+
+
+def count(name: str, value: int = 1) -> None:
+    if tracer is not None:
+        tracer.count(name, value=value)
+
+
+def trace_hook_calls(pm: PluginManager) -> None:
+    if tracer is None:
+        return
+
+    def before(hook_name: str, hook_impls: list, kwargs: dict) -> None:
+        assert tracer is not None
+        tracer.begin(hook_name, category="pluggy")
+
+    def after(outcome: Any, hook_name: str, hook_impls: list, kwargs: dict) -> None:
+        assert tracer is not None
+        tracer.end(plugins=", ".join(hook_impl.plugin_name for hook_impl in hook_impls))
+
+    pm.add_hookcall_monitoring(before, after)
+
+
+def _write_trace(path: PathLike) -> None:
+    assert tracer is not None
+    summary_path = Path(path).with_suffix(".summary.json")
+    try:
+        tracer.write_chrome_trace(path)
+        tracer.write_summary(summary_path)
+    except OSError as e:
+        logger.warning(f"Could not write trace to {path}: {e}")
+
+
+# tracing is enabled at import time to avoid any overhead when disabled
+tracer: Optional[Tracer] = None
+if os.environ.get(TRACE_ENV_VAR):
+    tracer = Tracer()
+    atexit.register(_write_trace, os.environ[TRACE_ENV_VAR])
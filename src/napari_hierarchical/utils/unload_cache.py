@@ -0,0 +1,123 @@
+import zlib
+from collections import OrderedDict
+from importlib.util import find_spec
+from typing import Any, Dict, Generic, Hashable, Iterable, NamedTuple, Optional, TypeVar
+
+import dask.array as da
+import numpy as np
+from napari.layers import Image, Layer
+
+_T = TypeVar("_T", bound=Hashable)
+
+# Blosc (LZ4, multi-threaded) is considerably faster than zlib (fallback)
+blosc_available = find_spec("numcodecs") is not None
+BLOSC_MAX_BUFFER_SIZE = 2**31 - 1 - 16  # see BLOSC_MAX_BUFFERSIZE
+
+
+class _CacheEntry(NamedTuple):
+    compressed_data: bytes
+    blosc: bool
+    shape: tuple
+    dtype: np.dtype
+    state: Dict[str, Any]
+    layer_type: str
+
+
+class UnloadCache(Generic[_T]):
+    # retains the (compressed) data of recently unloaded layers, such that reloading
+    # does not require file I/O; least recently unloaded entries are evicted first
+    def __init__(self, max_bytes: int = 0) -> None:
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[_T, _CacheEntry]" = OrderedDict()
+        self._nbytes = 0
+        self._codec: Any = None  # created upon first use (import time)
+
+    def put(self, key: _T, layer: Layer) -> bool:
+        # only in-memory and lazy (dask) images are cached (other layers may have been
+        # edited); lazy data is read once upon unloading, if it fits into the cache
+        self.remove([key])
+        if (
+            self._max_bytes <= 0
+            or not isinstance(layer, Image)
+            or layer.multiscale
+            or not isinstance(layer.data, (np.ndarray, da.Array))
+        ):
+            return False
+        if isinstance(layer.data, da.Array):
+            if layer.data.nbytes > self._max_bytes or layer.data.dtype.hasobject:
+                return False
+            data = np.asarray(layer.data.compute())
+        elif type(layer.data) is np.ndarray:
+            data = layer.data
+        else:  # e.g. memory-mapped
+            return False
+        if data.nbytes == 0 or data.dtype.hasobject:
+            return False
+        blosc = blosc_available and data.nbytes <= BLOSC_MAX_BUFFER_SIZE
+        if blosc:
+            compressed_data = self._get_codec().encode(np.ascontiguousarray(data))
+        else:
+            compressed_data = zlib.compress(np.ascontiguousarray(data), 1)
+        if len(compressed_data) > self._max_bytes:
+            return False
+        _, state, layer_type = layer.as_layer_data_tuple()
+        self._entries[key] = _CacheEntry(
+            compressed_data, blosc, data.shape, data.dtype, state, layer_type
+        )
+        self._nbytes += len(compressed_data)
+        self._evict()
+        return True
+
+    def pop(self, key: _T) -> Optional[Layer]:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self._nbytes -= len(entry.compressed_data)
+        data = np.empty(entry.shape, dtype=entry.dtype)
+        if entry.blosc:
+            self._get_codec().decode(entry.compressed_data, out=data)
+        else:
+            buffer = zlib.decompress(entry.compressed_data)
+            data.ravel()[:] = np.frombuffer(buffer, dtype=entry.dtype)
+        return Layer.create(data, entry.state, entry.layer_type)
+
+    def remove(self, keys: Iterable[_T]) -> None:
+        for key in keys:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._nbytes -= len(entry.compressed_data)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._nbytes = 0
+
+    def _get_codec(self) -> Any:
+        if self._codec is None:
+            from numcodecs import Blosc
+
+            self._codec = Blosc(cname="lz4", clevel=5, shuffle=Blosc.SHUFFLE)
+        return self._codec
+
+    def _evict(self) -> None:
+        while self._nbytes > self._max_bytes and len(self._entries) > 0:
+            _, entry = self._entries.popitem(last=False)
+            self._nbytes -= len(entry.compressed_data)
+
+    def __contains__(self, key: _T) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._evict()
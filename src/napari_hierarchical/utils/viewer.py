@@ -0,0 +1,56 @@
+from typing import TYPE_CHECKING, Sequence
+
+from napari.layers import Layer
+
+if TYPE_CHECKING:
+    from napari.components import ViewerModel
+
+# ViewerModel._on_add_layer recomputes the dims ranges and the grid for all layers upon
+# every insertion, i.e. inserting n layers one by one is O(n^2); layer transform events
+# trigger the same recomputation
+_LAYER_TRANSFORM_EVENTS = ("data", "scale", "translate", "rotate", "shear", "affine")
+
+
+def add_layers(viewer: "ViewerModel", layers: Sequence[Layer]) -> None:
+    # adds layers with a single dims/grid update and a single layer activation; other
+    # listeners (e.g. the layer list and the canvas) are notified as usual, and the
+    # canvas is redrawn once control returns to the event loop
+    if len(layers) <= 1:
+        for layer in layers:
+            viewer.add_layer(layer)
+        return
+    was_empty = len(viewer.layers) == 0
+    activate_on_insert = viewer.layers._activate_on_insert
+    viewer.layers._activate_on_insert = False
+    try:
+        with viewer.layers.events.inserted.blocker(viewer._on_add_layer):
+            viewer.layers.extend(layers)
+    finally:
+        viewer.layers._activate_on_insert = activate_on_insert
+        added_layers = [layer for layer in layers if layer in viewer.layers]
+        for layer in added_layers:
+            _connect_layer_events(viewer, layer)
+        viewer._on_layers_change()
+        viewer._on_grid_change()
+        viewer._update_layers(layers=added_layers)
+    if was_empty:  # same as ViewerModel._on_add_layer for the first layer
+        viewer.reset_view()
+        ranges = viewer.layers._ranges
+        midpoint = [viewer.rounded_division(*_range) for _range in ranges]
+        viewer.dims.set_point(range(len(ranges)), midpoint)
+    if activate_on_insert:
+        viewer.layers.selection.active = layers[-1]
+
+
+def _connect_layer_events(viewer: "ViewerModel", layer: Layer) -> None:
+    # same as ViewerModel._on_add_layer (napari 0.4.17), without the dims/grid update;
+    # the connections are undone by ViewerModel._on_remove_layer
+    layer.events.interactive.connect(viewer._update_interactive)
+    layer.events.cursor.connect(viewer._update_cursor)
+    layer.events.cursor_size.connect(viewer._update_cursor_size)
+    for name in _LAYER_TRANSFORM_EVENTS:
+        getattr(layer.events, name).connect(viewer._on_layers_change)
+    layer.events.name.connect(viewer.layers._update_name)
+    if hasattr(layer.events, "mode"):
+        layer.events.mode.connect(viewer._on_layer_mode_change)
+    viewer._layer_help_from_mode(layer)
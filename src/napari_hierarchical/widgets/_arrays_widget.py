@@ -16,6 +16,7 @@ from qtpy.QtWidgets import (
 
 from .._controller import controller
 from ..model import Array
+from ..utils.labels import create_labels_data
 from ._flat_groupings_tab_widget import QFlatGroupingsTabWidget
 
 logger = logging.getLogger(__name__)
@@ -126,7 +127,7 @@ class QArraysWidget(QWidget):
         assert len(controller.selected_groups) == 1
         group = controller.selected_groups[0]
         layer = controller.viewer.add_labels(
-            np.zeros(
+            create_labels_data(
                 [
                     np.round(s / sc).astype("int") if s > 0 else 1
                     for s, sc in zip(
@@ -134,8 +135,7 @@ class QArraysWidget(QWidget):
                         - controller.viewer.layers.extent.world[0],
                         controller.viewer.layers.extent.step,
                     )
-                ],
-                dtype=int,
+                ]
             ),
             translate=np.array(
                 controller.viewer.layers.extent.world[0]
@@ -8,6 +8,7 @@ from qtpy.QtCore import QAbstractItemModel, QModelIndex, QObject, Qt
 from .._controller import HierarchicalController
 from ..model import Array
 from ..utils.parent_aware import ParentAware
+from ..utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -222,9 +223,7 @@ class QFlatGroupingTreeModel(QAbstractItemModel):
                     if role == Qt.ItemDataRole.CheckStateRole:
                         assert value in (Qt.CheckState.Checked, Qt.CheckState.Unchecked)
                         if value == Qt.CheckState.Checked:
-                            for array in arrays:
-                                if not array.loaded:
-                                    self._controller.load_array(array)
+                            self._controller.load_arrays(arrays)
                         else:
                             for array in arrays:
                                 if array.loaded:
@@ -449,6 +448,7 @@ class QFlatGroupingTreeModel(QAbstractItemModel):
         arrays = self._flat_group_arrays[flat_group]
         return self.createIndex(row, column, object=arrays)
 
+    @traced
     def _on_current_arrays_event(self, event: Event) -> None:
         if not isinstance(event.sources[0], EventedList):
             return
@@ -522,6 +522,7 @@ class QFlatGroupingTreeModel(QAbstractItemModel):
                 self._connect_array_events(array)
             self._close_if_empty()
 
+    @traced
     def _on_flat_grouping_groups_event(self, event: Event) -> None:
         if not isinstance(event.sources[0], EventedDict):
             return
@@ -550,6 +551,7 @@ class QFlatGroupingTreeModel(QAbstractItemModel):
             assert isinstance(flat_group, str)
             self._add_array_to_flat_group(array, flat_group)
 
+    @traced
     def _on_array_name_event(self, event: Event) -> None:
         logger.debug(f"event={event.type}")
         assert self._flat_grouping is None
@@ -564,6 +566,7 @@ class QFlatGroupingTreeModel(QAbstractItemModel):
         flat_group = self._get_flat_group(array)
         self._add_array_to_flat_group(array, flat_group)
 
+    @traced
     def _on_array_loaded_event(self, event: Event) -> None:
         array = event.source
         assert isinstance(array, Array)
@@ -581,6 +584,7 @@ class QFlatGroupingTreeModel(QAbstractItemModel):
             )
             self.dataChanged.emit(flat_group_index, flat_group_index)
 
+    @traced
     def _on_array_visible_event(self, event: Event) -> None:
         array = event.source
         assert isinstance(array, Array)
@@ -1,14 +1,15 @@
 import logging
 import pickle
 from enum import IntEnum
-from typing import Any, Iterable, List, Optional
+from typing import Any, Generator, Iterable, List, Optional
 
 from napari.utils.events import Event, EventedList
 from qtpy.QtCore import QAbstractItemModel, QMimeData, QModelIndex, QObject, Qt
 
 from .._controller import HierarchicalController
 from ..model import Group
-from ..utils.parent_aware import ParentAware
+from ..utils.parent_aware import ParentAware, move_item
+from ..utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -128,7 +129,7 @@ class QGroupTreeModel(QAbstractItemModel):
                     logger.debug(f"group={group}, value={value}")
                     assert value in (Qt.CheckState.Checked, Qt.CheckState.Unchecked)
                     if value == Qt.CheckState.Checked:
-                        self._controller.load_group(group)
+                        self._controller.load_group(group, block=False)
                     else:
                         self._controller.unload_group(group)
                     return True
@@ -250,6 +251,7 @@ class QGroupTreeModel(QAbstractItemModel):
                 assert isinstance(parent_group, Group)
                 target_groups = parent_group.children
             else:
+                parent_group = None
                 target_groups = self._controller.groups
             if row == -1 and column == -1:
                 row = len(target_groups)
@@ -258,9 +260,8 @@ class QGroupTreeModel(QAbstractItemModel):
                 data.data("x-napari-hierarchical-group").data()
             )
             assert isinstance(indices_stacks, List) and len(indices_stacks) > 0
-            row_offset = 0
-            while len(indices_stacks) > 0:
-                indices_stack = indices_stacks.pop(0)
+            groups: List[Group] = []
+            for indices_stack in indices_stacks:
                 assert isinstance(indices_stack, List) and len(indices_stack) > 0
                 source_groups = self._controller.groups
                 source_row = indices_stack.pop()
@@ -269,15 +270,31 @@ class QGroupTreeModel(QAbstractItemModel):
                     source_groups = source_groups[source_row].children
                     source_row = indices_stack.pop()
                     assert isinstance(source_row, int)
-                group = source_groups[source_row]
-                logger.debug(f"target_groups={target_groups}, group={group}")
-                self._dropping = True
-                try:
-                    new_group = Group.from_group(group)
-                    target_groups.insert(row + row_offset, new_group)
-                finally:
-                    self._dropping = False
-                row_offset += 1
+                groups.append(source_groups[source_row])
+            if parent_group is not None and any(
+                group is parent_group or group in _iter_ancestors(parent_group)
+                for group in groups
+            ):
+                return False  # cannot move groups into themselves
+            # groups are moved together with their ancestors, if these are moved too
+            groups = [
+                group
+                for group in groups
+                if not any(ancestor in groups for ancestor in _iter_ancestors(group))
+            ]
+            self._dropping = True
+            try:
+                for group in groups:
+                    logger.debug(f"target_groups={target_groups}, group={group}")
+                    if group.parent is not None:
+                        source_groups = group.parent.children
+                    else:
+                        source_groups = self._controller.groups
+                    source_row = source_groups.index(group)
+                    move_item(source_groups, source_row, target_groups, row)
+                    row = target_groups.index(group) + 1
+            finally:
+                self._dropping = False
             return True
         # if (
         #     data.hasFormat("x-napari-hierarchical-array")
@@ -302,8 +319,8 @@ class QGroupTreeModel(QAbstractItemModel):
             groups_copy = [groups[i] for i in range(row, row + count)]
             for group in groups_copy:
                 logger.debug(f"groups={groups}, group={group}")
-                for array in group.iter_arrays(recursive=True):
-                    array.layer = None
+                if group.loaded in (None, True):
+                    self._controller.unload_group(group)
                 groups.remove(group)
             return True
         return False
@@ -316,9 +333,11 @@ class QGroupTreeModel(QAbstractItemModel):
         row = parent_groups.index(group)
         return self.createIndex(row, column, object=group)
 
+    @traced
     def _on_groups_event(self, event: Event) -> None:
         self._process_groups_event(event, connect=True)
 
+    @traced
     def _on_group_nested_list_event(self, event: Event) -> None:
         source_list_event = event.source_list_event
         assert isinstance(source_list_event, Event)
@@ -326,7 +345,7 @@ class QGroupTreeModel(QAbstractItemModel):
         assert isinstance(group_children, ParentAware)
         group = group_children.parent
         assert isinstance(group, Group)
-        if group_children == group.children:
+        if group_children is group.children:
             self._process_groups_event(source_list_event)
 
     def _process_groups_event(self, event: Event, connect: bool = False) -> None:
@@ -335,13 +354,34 @@ class QGroupTreeModel(QAbstractItemModel):
         groups = event.source
         assert isinstance(groups, EventedList)
 
-        def get_parent_index() -> QModelIndex:
+        def get_parent_index(groups: EventedList = groups) -> QModelIndex:
             if isinstance(groups, ParentAware):
                 assert isinstance(groups.parent, Group)
                 return self.create_group_index(groups.parent)
             return QModelIndex()
 
-        if event.type == "inserting":
+        if event.type == "moving" and hasattr(event, "dest_list"):
+            logger.debug(f"event={event.type}")
+            assert isinstance(event.index, int) and 0 <= event.index < len(groups)
+            assert isinstance(event.dest_list, EventedList)
+            assert 0 <= event.new_index <= len(event.dest_list)
+            self.beginMoveRows(
+                get_parent_index(),
+                event.index,
+                event.index,
+                get_parent_index(event.dest_list),
+                event.new_index,
+            )
+        elif event.type == "moved" and hasattr(event, "dest_list"):
+            logger.debug(f"event={event.type}")
+            self.endMoveRows()
+            group = event.value
+            assert isinstance(group, Group)
+            if connect and event.dest_list is not self._controller.groups:
+                self._disconnect_group_events(group)
+            elif not connect and event.dest_list is self._controller.groups:
+                self._connect_group_events(group)
+        elif event.type == "inserting":
             logger.debug(f"event={event.type}")
             assert isinstance(event.index, int) and 0 <= event.index <= len(groups)
             self.beginInsertRows(get_parent_index(), event.index, event.index)
@@ -419,9 +459,12 @@ class QGroupTreeModel(QAbstractItemModel):
             )
             self.dataChanged.emit(top_left_index, bottom_right_index)
 
+    @traced
     def _on_group_nested_event(self, event: Event) -> None:
         source_event = event.source_event
         assert isinstance(source_event, Event)
+        if not isinstance(source_event.source, Group):
+            return  # e.g. array name events
         column = None
         if source_event.type == "name":
             column = self.COLUMNS.NAME
@@ -439,3 +482,9 @@ class QGroupTreeModel(QAbstractItemModel):
     @property
     def dropping(self) -> bool:
         return self._dropping
+
+
+def _iter_ancestors(group: Group) -> Generator[Group, None, None]:
+    while group.parent is not None:
+        group = group.parent
+        yield group
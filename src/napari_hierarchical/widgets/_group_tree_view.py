@@ -9,6 +9,7 @@ from qtpy.QtCore import (
     QPoint,
     Qt,
 )
+from qtpy.QtGui import QDropEvent
 from qtpy.QtWidgets import QFileDialog, QHeaderView, QMenu, QTreeView, QWidget
 
 from .._controller import HierarchicalController
@@ -82,6 +83,17 @@ class QGroupTreeView(QTreeView):
             self._on_selected_groups_event
         )
 
+    def dropEvent(self, event: QDropEvent) -> None:
+        super().dropEvent(event)
+        if (
+            event.isAccepted()
+            and event.source() is self
+            and event.dropAction() == Qt.DropAction.MoveAction
+        ):
+            # groups have been moved by the model already, i.e. do not let Qt remove
+            # the source rows (which follow the moved groups) after the drop
+            event.setDropAction(Qt.DropAction.CopyAction)
+
     def _on_custom_context_menu_requested(self, pos: QPoint) -> None:
         index = self.indexAt(pos)
         if index.isValid():
@@ -133,7 +145,7 @@ class QGroupTreeView(QTreeView):
                 else:
                     self._controller.groups.remove(group)
             elif result == load_arrays_action:
-                self._controller.load_group(group)
+                self._controller.load_group(group, block=False)
             elif result == unload_arrays_action:
                 self._controller.unload_group(group)
             elif result == show_arrays_action: